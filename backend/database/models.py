@@ -1,8 +1,9 @@
 """
 SQLAlchemy models for Situated Learning System
 """
-from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, BigInteger, ForeignKey, UniqueConstraint, CheckConstraint, Float
-from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, BigInteger, ForeignKey, UniqueConstraint, CheckConstraint, Float, Index
+from sqlalchemy import or_
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY, array as pg_array
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -120,15 +121,36 @@ class AssignmentRubric(Base):
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     assignment_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False)
+    # Primary (one rubric per assignment) link; assignment_ids is kept for legacy multi-assignment rubrics
+    assignment_id = Column(UUID(as_uuid=True), ForeignKey("generated_assignments.id", ondelete="CASCADE"), unique=True, nullable=True)
     rubric_name = Column(String(255), nullable=False)
     doc_type = Column(String(100), default='Assignment')
     criteria = Column(JSONB, nullable=False)
+    # criteria['rubrics'] normalized on write (see extract_rubrics_list) so readers skip the shape checks
+    rubrics_list = Column(JSONB)
     total_points = Column(Integer)
     is_edited = Column(Boolean, default=False)
     reason_for_edit = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Indexes
+    __table_args__ = (
+        # Serves assignment_ids @> ARRAY[...] lookups
+        Index('idx_assignment_rubrics_assignment_ids', 'assignment_ids', postgresql_using='gin'),
+    )
+
+    @staticmethod
+    def extract_rubrics_list(criteria):
+        """Rubric categories from a criteria payload ([] when absent or not a dict)"""
+        return criteria.get('rubrics', []) if isinstance(criteria, dict) else []
+
+    @classmethod
+    def matches_assignment(cls, assignment_id):
+        """Filter clause for the rubric of an assignment (UUID value or column expression)"""
+        legacy_match = [assignment_id] if isinstance(assignment_id, uuid.UUID) else pg_array([assignment_id])
+        return or_(cls.assignment_id == assignment_id, cls.assignment_ids.contains(legacy_match))
+
 class StudentSubmission(Base):
     """Student submission of an assignment"""
     __tablename__ = "student_submissions"
@@ -159,6 +181,7 @@ class StudentSubmission(Base):
     faculty_feedback = Column(Text)  # General faculty feedback (for both rejected and evaluated)
     swot_analysis = Column(JSONB)
     error_message = Column(Text)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the uploaded file
 
     # Course and Assignment relationships
     course = relationship("Course", backref="submissions")
@@ -181,6 +204,28 @@ class StudentSubmission(Base):
         cascade="all, delete-orphan"
     )
 
+    # Indexes
+    __table_args__ = (
+        # Pending-submissions lookup by course; INCLUDE keeps the small projected columns in the index
+        Index(
+            'idx_student_submissions_pending', 'course_id', 'evaluation_status',
+            postgresql_include=['student_id', 'submission_date']
+        ),
+        # Per-assignment listing, newest first
+        Index('idx_student_submissions_assignment_created', assignment_id, created_at.desc()),
+        # Faculty pending/evaluated queue, newest first
+        Index(
+            'idx_student_submissions_status_created', evaluation_status, created_at.desc(),
+            postgresql_include=['id', 'student_id', 'assignment_id']
+        ),
+        # Latest submission per student (faculty dashboard); INCLUDE covers the match and display
+        # columns so the lookup is an index-only scan
+        Index(
+            'idx_student_submissions_student_created', student_id, created_at.desc(),
+            postgresql_include=['id', 'assignment_id', 'course_id', 'evaluation_status', 'evaluation_score']
+        ),
+    )
+
 
 class FacultyEvaluationResult(Base):
     """Faculty Evaluation Result model for rubric-based evaluations"""
@@ -196,6 +241,10 @@ class FacultyEvaluationResult(Base):
     # Relationships
     submission = relationship("StudentSubmission", back_populates="faculty_evaluations")
 
+    __table_args__ = (
+        UniqueConstraint('submission_id', name='uq_faculty_eval_submission'),
+    )
+
 class StudentSWOTResult(Base):
     """Student SWOT Analysis Result model"""
     __tablename__ = "student_swot_results"
@@ -225,16 +274,6 @@ class EvaluationResult(Base):
     ai_feedback = Column(Text)
     faculty_feedback = Column(Text)
     faculty_score_adjustment = Column(Float)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    
-    # Relationships
-    submission = relationship(
-        "StudentSubmission",
-        back_populates="evaluation_results",
-        uselist=False
-    )
-    assignment = relationship("GeneratedAssignment")
-    rubric = relationship("AssignmentRubric")
     faculty_reason = Column(Text)
     flags = Column(ARRAY(Text))  # quality_issues, plagiarism_detected, etc.
     evaluation_metadata = Column(JSONB)
@@ -250,8 +289,18 @@ class EvaluationResult(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint("overall_score >= 0", name='check_overall_score_positive'),
+        Index('idx_eval_results_assignment', 'assignment_id'),
+        Index('idx_eval_results_submission', 'submission_id'),
     )
 
+class EvaluationCache(Base):
+    """LLM evaluation output keyed by a SHA-256 of its inputs (rubric, assignment, submission text)"""
+    __tablename__ = "evaluation_cache"
+    
+    hash_key = Column(String(64), primary_key=True)
+    result_json = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
 class StudentQuestionSet(Base):
     """Stores generated questions per student context and approval status"""
     __tablename__ = "student_question_sets"
@@ -278,6 +327,9 @@ class StudentQuestionSet(Base):
 
     __table_args__ = (
         CheckConstraint("approval_status IN ('pending','approved','rejected')", name='check_approval_status'),
+        Index('idx_question_sets_course', 'course_id'),
+        # Dashboard keyset pagination, newest first
+        Index('idx_question_sets_created', created_at.desc(), id.desc()),
     )
 
 class SWOTSubmission(Base):
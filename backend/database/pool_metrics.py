@@ -0,0 +1,65 @@
+"""
+Connection pool instrumentation: rolling checkout latency for the SQLAlchemy pools
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Dict
+
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+class CheckoutTimer:
+    """Keeps the most recent pool checkout durations and reports p50/p95"""
+
+    def __init__(self, window: int = 1000):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return {"samples": 0, "p50_ms": None, "p95_ms": None}
+        last = len(samples) - 1
+        return {
+            "samples": len(samples),
+            "p50_ms": round(samples[int(last * 0.50)] * 1000, 3),
+            "p95_ms": round(samples[int(last * 0.95)] * 1000, 3),
+        }
+
+
+class _TimedCheckoutMixin:
+    """Times every connection checkout from the pool"""
+
+    def __init__(self, *args, **kwargs):
+        self.checkout_timer = CheckoutTimer()
+        super().__init__(*args, **kwargs)
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.checkout_timer.record(time.perf_counter() - start)
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """QueuePool for the sync engine with checkout latency tracking"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool for the async engine with checkout latency tracking"""
+
+
+def pool_stats(pool) -> Dict[str, Any]:
+    """Status string plus checkout latency for a pool (timer is absent on foreign pool classes)"""
+    stats = {"status": pool.status()}
+    timer = getattr(pool, "checkout_timer", None)
+    if timer is not None:
+        stats["checkout"] = timer.snapshot()
+    return stats
@@ -0,0 +1,31 @@
+"""
+Query counting helper for spotting N+1 regressions
+"""
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(bind) -> Iterator[List[str]]:
+    """
+    Record every SQL statement executed on an engine or connection while the block runs.
+
+    Usage:
+        with count_queries(sync_engine) as queries:
+            ...
+        assert len(queries) <= 5, queries
+
+    For the async engine pass ``async_engine.sync_engine``.
+    """
+    statements: List[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _before_cursor_execute)
@@ -14,6 +14,7 @@ from contextlib import asynccontextmanager
 from config.settings import settings
 from database.connection import database, init_db
 from storage.minio_client import minio_client
+from utils.executor import blocking_io_executor
 from routers import upload, generation, analytics, student, faculty
 import logging
 
@@ -29,27 +30,29 @@ async def lifespan(app: FastAPI):
     Application lifespan manager
     """
     # Startup
-    try:
-        await database.connect()
-        print("✅ Database connected successfully")
+    # Blocking work offloaded with asyncio.to_thread runs on this pool instead of the small default one
+    async with blocking_io_executor():
+        try:
+            await database.connect()
+            print("✅ Database connected successfully")
+            
+            # Initialize MinIO connection
+            minio_client.initialize_connection()
+            print("✅ MinIO connection initialized")
+            
+            # Initialize database tables
+            await init_db()
+            print("✅ Database tables initialized")
+            
+        except Exception as e:
+            print(f"❌ Startup failed: {e}")
+            raise
         
-        # Initialize MinIO connection
-        minio_client.initialize_connection()
-        print("✅ MinIO connection initialized")
+        yield
         
-        # Initialize database tables
-        await init_db()
-        print("✅ Database tables initialized")
-        
-    except Exception as e:
-        print(f"❌ Startup failed: {e}")
-        raise
-    
-    yield
-    
-    # Shutdown
-    await database.disconnect()
-    print("📴 Database disconnected")
+        # Shutdown
+        await database.disconnect()
+        print("📴 Database disconnected")
 
 # Create FastAPI application
 app = FastAPI(
@@ -0,0 +1,37 @@
+"""
+Migration script: Add per-assignment indexes for submission listings and evaluation results
+"""
+from sqlalchemy import text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Create (assignment_id, created_at DESC) on student_submissions and assignment_id on evaluation_results.
+
+    Indexes are built CONCURRENTLY (outside a transaction) so writes are not blocked; the old
+    single-column submissions index is a prefix of the new one and is dropped afterwards.
+    """
+    with sync_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_student_submissions_assignment_created '
+            'ON student_submissions(assignment_id, created_at DESC)'
+        ))
+        print("✅ Ensured index: idx_student_submissions_assignment_created")
+
+        conn.execute(text('DROP INDEX CONCURRENTLY IF EXISTS idx_student_submissions_assignment'))
+        print("✅ Dropped redundant index: idx_student_submissions_assignment")
+
+        conn.execute(text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_eval_results_assignment '
+            'ON evaluation_results(assignment_id)'
+        ))
+        print("✅ Ensured index: idx_eval_results_assignment")
+
+        conn.execute(text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_eval_results_submission '
+            'ON evaluation_results(submission_id)'
+        ))
+        print("✅ Ensured index: idx_eval_results_submission")
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
@@ -0,0 +1,32 @@
+"""
+Migration script: Add indexes for the faculty dashboard query
+"""
+from sqlalchemy import text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Create (student_id, created_at DESC) INCLUDE (...) on student_submissions and course_id on student_question_sets.
+
+    Built CONCURRENTLY (outside a transaction) so writes are not blocked; the old single-column
+    student_id index is a prefix of the new one and is dropped afterwards.
+    """
+    with sync_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_student_submissions_student_created '
+            'ON student_submissions(student_id, created_at DESC) '
+            'INCLUDE (id, assignment_id, course_id, evaluation_status, evaluation_score)'
+        ))
+        print("✅ Ensured index: idx_student_submissions_student_created")
+
+        conn.execute(text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_question_sets_course '
+            'ON student_question_sets(course_id)'
+        ))
+        print("✅ Ensured index: idx_question_sets_course")
+
+        conn.execute(text('DROP INDEX CONCURRENTLY IF EXISTS idx_student_submissions_student'))
+        print("✅ Dropped redundant index: idx_student_submissions_student")
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
@@ -0,0 +1,43 @@
+"""
+Migration script: Make faculty_evaluation_results.submission_id unique (one faculty evaluation per submission)
+"""
+from sqlalchemy import inspect, text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Collapse duplicate faculty evaluations (latest wins) and add uq_faculty_eval_submission.
+
+    The unique index backing the constraint also serves submission_id lookups, so the plain
+    idx_faculty_eval_submission index is dropped.
+    """
+    inspector = inspect(sync_engine)
+    constraints = [uc['name'] for uc in inspector.get_unique_constraints('faculty_evaluation_results')]
+
+    with sync_engine.connect() as conn:
+        if 'uq_faculty_eval_submission' not in constraints:
+            result = conn.execute(text('''
+                DELETE FROM faculty_evaluation_results f
+                USING (
+                    SELECT id, row_number() OVER (
+                        PARTITION BY submission_id ORDER BY evaluation_date DESC NULLS LAST, id
+                    ) AS rn
+                    FROM faculty_evaluation_results
+                ) ranked
+                WHERE f.id = ranked.id AND ranked.rn > 1
+            '''))
+            print(f"✅ Removed {result.rowcount} duplicate faculty evaluation(s)")
+
+            conn.execute(text(
+                'ALTER TABLE faculty_evaluation_results '
+                'ADD CONSTRAINT uq_faculty_eval_submission UNIQUE (submission_id)'
+            ))
+            print("✅ Added constraint: uq_faculty_eval_submission")
+
+        conn.execute(text('DROP INDEX IF EXISTS idx_faculty_eval_submission'))
+        print("✅ Dropped redundant index: idx_faculty_eval_submission")
+
+        conn.commit()
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
@@ -0,0 +1,21 @@
+"""
+Migration script: Add covering index for pending submissions by course
+"""
+from sqlalchemy import text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Create idx_student_submissions_pending on (course_id, evaluation_status) INCLUDE (student_id, submission_date)."""
+    with sync_engine.connect() as conn:
+        conn.execute(text(
+            'CREATE INDEX IF NOT EXISTS idx_student_submissions_pending '
+            'ON student_submissions(course_id, evaluation_status) '
+            'INCLUDE (student_id, submission_date)'
+        ))
+        print("✅ Ensured index: idx_student_submissions_pending")
+
+        conn.commit()
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
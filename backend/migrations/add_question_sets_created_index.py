@@ -0,0 +1,21 @@
+"""
+Migration script: Add index for keyset pagination of the faculty dashboard
+"""
+from sqlalchemy import text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Create (created_at DESC, id DESC) on student_question_sets.
+
+    Built CONCURRENTLY (outside a transaction) so writes are not blocked.
+    """
+    with sync_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_question_sets_created '
+            'ON student_question_sets(created_at DESC, id DESC)'
+        ))
+        print("✅ Ensured index: idx_question_sets_created")
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
@@ -0,0 +1,45 @@
+"""
+Migration script: Add assignment_id FK to assignment_rubrics and backfill it from assignment_ids
+"""
+from sqlalchemy import inspect, text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Add the unique assignment_id column and link each assignment to its most recent rubric."""
+    inspector = inspect(sync_engine)
+    columns = [col['name'] for col in inspector.get_columns('assignment_rubrics')]
+
+    with sync_engine.connect() as conn:
+        if 'assignment_id' not in columns:
+            conn.execute(text(
+                'ALTER TABLE assignment_rubrics ADD COLUMN assignment_id UUID UNIQUE '
+                'REFERENCES generated_assignments(id) ON DELETE CASCADE'
+            ))
+            print("✅ Added column: assignment_id")
+
+        # One rubric per assignment (latest wins); a rubric shared by several assignments
+        # is linked to one of them here and still matched for the rest via assignment_ids
+        result = conn.execute(text('''
+            UPDATE assignment_rubrics r
+            SET assignment_id = pick.assignment_id
+            FROM (
+                SELECT DISTINCT ON (u.assignment_id) u.assignment_id, u.rubric_id
+                FROM (
+                    SELECT ar.id AS rubric_id, unnest(ar.assignment_ids) AS assignment_id, ar.updated_at
+                    FROM assignment_rubrics ar
+                ) u
+                JOIN generated_assignments ga ON ga.id = u.assignment_id
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM assignment_rubrics linked WHERE linked.assignment_id = u.assignment_id
+                )
+                ORDER BY u.assignment_id, u.updated_at DESC NULLS LAST
+            ) pick
+            WHERE r.id = pick.rubric_id AND r.assignment_id IS NULL
+        '''))
+        print(f"✅ Backfilled assignment_id on {result.rowcount} rubric(s)")
+
+        conn.commit()
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
@@ -0,0 +1,20 @@
+"""
+Migration script: Add GIN index on assignment_rubrics.assignment_ids
+"""
+from sqlalchemy import text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Create the GIN index used by assignment_ids @> ARRAY[...] rubric lookups."""
+    with sync_engine.connect() as conn:
+        conn.execute(text(
+            'CREATE INDEX IF NOT EXISTS idx_assignment_rubrics_assignment_ids '
+            'ON assignment_rubrics USING GIN (assignment_ids)'
+        ))
+        print("✅ Ensured index: idx_assignment_rubrics_assignment_ids")
+
+        conn.commit()
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
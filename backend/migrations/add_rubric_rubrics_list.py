@@ -0,0 +1,31 @@
+"""
+Migration script: Add rubrics_list to assignment_rubrics and backfill it from criteria
+"""
+from sqlalchemy import inspect, text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Add the rubrics_list JSONB column (criteria['rubrics'] precomputed) if it doesn't exist."""
+    inspector = inspect(sync_engine)
+    columns = [col['name'] for col in inspector.get_columns('assignment_rubrics')]
+
+    with sync_engine.connect() as conn:
+        if 'rubrics_list' not in columns:
+            conn.execute(text('ALTER TABLE assignment_rubrics ADD COLUMN rubrics_list JSONB'))
+            print("✅ Added column: rubrics_list")
+
+        result = conn.execute(text('''
+            UPDATE assignment_rubrics
+            SET rubrics_list = CASE
+                WHEN jsonb_typeof(criteria) = 'object' THEN COALESCE(criteria->'rubrics', '[]'::jsonb)
+                ELSE '[]'::jsonb
+            END
+            WHERE rubrics_list IS NULL
+        '''))
+        print(f"✅ Backfilled rubrics_list on {result.rowcount} rubric(s)")
+
+        conn.commit()
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
@@ -0,0 +1,27 @@
+"""
+Migration script: Add content_hash column (and its index) to student_submissions table
+"""
+from sqlalchemy import inspect, text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Add content_hash column if it doesn't exist and index it for duplicate-upload lookups."""
+    inspector = inspect(sync_engine)
+    columns = [col['name'] for col in inspector.get_columns('student_submissions')]
+
+    with sync_engine.connect() as conn:
+        if 'content_hash' not in columns:
+            conn.execute(text('ALTER TABLE student_submissions ADD COLUMN content_hash VARCHAR(64)'))
+            print("✅ Added column: content_hash")
+
+        conn.execute(text(
+            'CREATE INDEX IF NOT EXISTS ix_student_submissions_content_hash '
+            'ON student_submissions(content_hash)'
+        ))
+        print("✅ Ensured index: ix_student_submissions_content_hash")
+
+        conn.commit()
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
@@ -0,0 +1,26 @@
+"""
+Migration script: Add index for the faculty pending-submissions queue
+"""
+from sqlalchemy import text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Create (evaluation_status, created_at DESC) INCLUDE (id, student_id, assignment_id) on student_submissions.
+
+    Built CONCURRENTLY (outside a transaction) so writes are not blocked; the old single-column
+    evaluation_status index is a prefix of the new one and is dropped afterwards.
+    """
+    with sync_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_student_submissions_status_created '
+            'ON student_submissions(evaluation_status, created_at DESC) '
+            'INCLUDE (id, student_id, assignment_id)'
+        ))
+        print("✅ Ensured index: idx_student_submissions_status_created")
+
+        conn.execute(text('DROP INDEX CONCURRENTLY IF EXISTS idx_student_submissions_status'))
+        print("✅ Dropped redundant index: idx_student_submissions_status")
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
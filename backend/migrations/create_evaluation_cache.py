@@ -0,0 +1,22 @@
+"""
+Migration script: Create evaluation_cache table for reusing LLM evaluations of identical inputs
+"""
+from sqlalchemy import text
+from database.connection import sync_engine
+
+def upgrade_database():
+    """Create evaluation_cache (hash_key PRIMARY KEY, result_json, created_at) if it doesn't exist."""
+    with sync_engine.connect() as conn:
+        conn.execute(text(
+            'CREATE TABLE IF NOT EXISTS evaluation_cache ('
+            'hash_key VARCHAR(64) PRIMARY KEY, '
+            'result_json JSONB NOT NULL, '
+            'created_at TIMESTAMPTZ DEFAULT NOW())'
+        ))
+        print("✅ Ensured table: evaluation_cache")
+
+        conn.commit()
+
+if __name__ == "__main__":
+    upgrade_database()
+    print("🎉 Migration completed successfully.")
@@ -10,14 +10,25 @@ Following the requirements:
 7. Report generation
 """
 
+import asyncio
+import hashlib
+import io
+import json
 import uuid
 import logging
 import os
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
-from datetime import datetime
+import time
+from operator import itemgetter
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Request, Response, BackgroundTasks
+from fastapi.responses import StreamingResponse, ORJSONResponse
+from sqlalchemy import select, func, update, insert, exists, or_, cast, String, bindparam
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.orm import selectinload, load_only
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from typing import List, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, Field, TypeAdapter
+from datetime import datetime, timedelta
 
 from database.models import (
     GeneratedAssignment as DBGeneratedAssignment,
@@ -26,12 +37,18 @@ from database.models import (
     FacultyEvaluationResult as DBFacultyEvaluation,
     StudentSWOTResult as DBStudentSWOT,
     EvaluationResult as DBEvaluationResult,
+    EvaluationCache as DBEvaluationCache,
     Course as DBCourse
 )
-from database.repository import get_db
+from database.connection import get_async_db, AsyncSessionLocal
 from services.rubric_parser import fetch_rubric
 from services.submission_processor import SubmissionProcessingService
+from services.evaluation_service import SubmissionEvaluation
+from services.swot_service import LLMAnalysisService
 from storage.minio_client import minio_client
+from utils.cache import TTLCache
+from utils.dashboard_cache import invalidate_dashboard_cache
+from utils.llm_config import llm_config
 
 # Configure logging
 logger = logging.getLogger('evaluation_server.router')
@@ -40,10 +57,89 @@ logger.setLevel(logging.DEBUG)
 # Control whether to log full extracted content. Set env var SHOW_FULL_EXTRACTED_LOGS=true to enable.
 SHOW_FULL_EXTRACTED_LOGS = os.getenv("SHOW_FULL_EXTRACTED_LOGS", "false").lower() in ("1", "true", "yes")
 
+# Extracted text is returned to clients as a preview of this many characters
+TEXT_PREVIEW_CHARS = 200
+
+# Report streaming: chunk size sent per write, and DB rows fetched per page while assembling
+REPORT_CHUNK_SIZE = 64 * 1024
+REPORT_RESULTS_PAGE_SIZE = 100
+
+# Maximum submissions evaluated by the LLM at the same time within one /evaluate request
+EVALUATION_CONCURRENCY = int(os.getenv("EVALUATION_CONCURRENCY", "10"))
+
+# Cached LLM evaluations (evaluation_cache rows) older than this are ignored and re-evaluated
+EVALUATION_CACHE_TTL = timedelta(seconds=int(os.getenv("EVALUATION_CACHE_TTL_SECONDS", str(7 * 24 * 3600))))
+
+# Background report jobs (in-process; each worker tracks its own jobs) and download link lifetime
+_report_jobs = TTLCache(maxsize=256, ttl=float(os.getenv("REPORT_JOB_TTL_SECONDS", "3600")))
+REPORT_URL_EXPIRY_SECONDS = int(os.getenv("REPORT_URL_EXPIRY_SECONDS", "900"))
+
+# Criterion fields copied into each report row, with defaults for missing keys
+_CRITERION_DEFAULTS = {'score': 0, 'max_score': 0, 'percentage': 0, 'feedback': ''}
+_CRITERION_RESULT_KEYS = ('category', 'score', 'max_score', 'percentage', 'feedback')
+_criterion_fields = itemgetter('score', 'max_score', 'percentage', 'feedback')
+
+# Rendered reports keyed by a digest of their inputs; only reports up to REPORT_CACHE_MAX_BYTES are kept
+REPORT_CACHE_MAX_BYTES = int(os.getenv("REPORT_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+_report_cache = TTLCache(
+    maxsize=int(os.getenv("REPORT_CACHE_SIZE", "32")),
+    ttl=float(os.getenv("REPORT_CACHE_TTL_SECONDS", "600")),
+)
+
+# SWOT analyses keyed by a digest of submission text + the assignment fields in the
+# prompt, so an identical resubmission skips the LLM call
+_swot_cache = TTLCache(
+    maxsize=int(os.getenv("SWOT_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("SWOT_CACHE_TTL_SECONDS", "86400")),
+)
+
+# Serialized bodies of the read-only catalogue listings (courses, filters, assignments, rubrics);
+# cleared whenever this router writes a rubric
+LISTING_CACHE_TTL_SECONDS = int(os.getenv("LISTING_CACHE_TTL_SECONDS", "60"))
+_listing_cache = TTLCache(maxsize=256, ttl=LISTING_CACHE_TTL_SECONDS)
+
+# Transformed MySQL rubrics with their content digest, so a rubric edit is picked up after the TTL
+_rubric_cache = TTLCache(maxsize=8, ttl=float(os.getenv("RUBRIC_CACHE_TTL_SECONDS", "300")))
+
 router = APIRouter()
 
+_EMPTY: Dict[str, Any] = {}
+
+# Prebuilt statements for hot lookups; fixed structure with bound parameters hits the compiled cache.
+# Submission lookups only update status columns, so the wide text/JSON columns are not fetched
+_SUBMISSION_BY_ID = select(DBStudentSubmission).options(
+    load_only(DBStudentSubmission.id, DBStudentSubmission.assignment_id, DBStudentSubmission.evaluation_status)
+).where(
+    DBStudentSubmission.id == bindparam('submission_id')
+)
+# Assignment validation only needs these columns (rows from .first(); None when missing)
+_ASSIGNMENT_BY_ID = select(
+    DBGeneratedAssignment.id,
+    DBGeneratedAssignment.course_id,
+    DBGeneratedAssignment.title,
+    DBGeneratedAssignment.description
+).where(
+    DBGeneratedAssignment.id == bindparam('assignment_id')
+)
+_ASSIGNMENT_EXISTS = select(exists().where(
+    DBGeneratedAssignment.id == bindparam('assignment_id')
+))
+_PENDING_SUBMISSIONS = select(
+    DBStudentSubmission.id,
+    DBStudentSubmission.student_id,
+    DBStudentSubmission.submission_date,
+    DBStudentSubmission.content
+).where(
+    DBStudentSubmission.course_id == bindparam('course_id'),
+    DBStudentSubmission.evaluation_status == "pending"
+)
+_RUBRIC_BY_ASSIGNMENT = select(DBAssignmentRubric).where(
+    DBAssignmentRubric.matches_assignment(bindparam('assignment_id', type_=PG_UUID(as_uuid=True)))
+).limit(1)
+
 # Initialize submission processing service
 submission_processor = SubmissionProcessingService()
+swot_generator = LLMAnalysisService()
 
 # Pydantic models for SWOT analysis
 class SWOTAnalysis(BaseModel):
@@ -55,7 +151,7 @@ class SWOTAnalysis(BaseModel):
 
 class SWOTRequest(BaseModel):
     student_id: str
-    submission_id: str
+    submission_id: uuid.UUID
     content: str
 
 class FacultyEvaluation(BaseModel):
@@ -70,28 +166,55 @@ class SubmissionSummary(BaseModel):
     submission_date: datetime
     content: str
 
+def _swot_cache_key(content: str, assignment) -> bytes:
+    """Exact-match key for a SWOT analysis over everything the prompt is built from
+    (NUL-separated so fields cannot run together)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        llm_config.text_model_name,
+        getattr(assignment, 'title', None),
+        getattr(assignment, 'description', None),
+        getattr(assignment, 'course_name', None),
+        content,
+    ):
+        digest.update((part or '').encode())
+        digest.update(b"\0")
+    return digest.digest()
+
 @router.post("/student/swot", response_model=SWOTAnalysis)
-async def create_swot_analysis(request: SWOTRequest, db: Session = Depends(get_db)):
+async def create_swot_analysis(request: SWOTRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Create a SWOT analysis for a student submission
     """
     try:
-        # Validate submission exists
-        submission = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.id == request.submission_id,
-            DBStudentSubmission.student_id == request.student_id
-        ).first()
+        # Validate submission exists; the assignment feeds the SWOT prompt and
+        # is loaded eagerly because lazy loads cannot run on an AsyncSession
+        submission = (await db.execute(
+            select(DBStudentSubmission)
+            .options(selectinload(DBStudentSubmission.assignment))
+            .where(
+                DBStudentSubmission.id == request.submission_id,
+                DBStudentSubmission.student_id == request.student_id
+            )
+        )).scalar_one_or_none()
         
         if not submission:
             raise HTTPException(status_code=404, detail="Submission not found")
             
-        # Generate SWOT analysis using the submission processor
-        swot_analysis = submission_processor.generate_swot_analysis(request.content)
+        # Generate SWOT analysis using the LLM SWOT service, unless this exact
+        # text was already analysed for the same assignment
+        cache_key = _swot_cache_key(request.content, submission.assignment)
+        swot_analysis = _swot_cache.get(cache_key)
+        if swot_analysis is None:
+            swot_analysis = SWOTAnalysis(
+                **await swot_generator.generate_swot(submission.assignment, request.content)
+            )
+            _swot_cache.set(cache_key, swot_analysis)
         
         # Create SWOT analysis result
         swot_result = DBStudentSWOT(
-            id=str(uuid.uuid4()),
-            submission_id=submission_id,
+            id=uuid.uuid4(),
+            submission_id=submission.id,
             strengths=swot_analysis.strengths,
             weaknesses=swot_analysis.weaknesses,
             opportunities=swot_analysis.opportunities,
@@ -101,32 +224,37 @@ async def create_swot_analysis(request: SWOTRequest, db: Session = Depends(get_d
         
         # Add and commit the SWOT analysis
         db.add(swot_result)
-        db.commit()
+        await db.commit()
         
         return swot_analysis
         
-    except Exception as e:
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        await db.rollback()
         logger.error(f"Error creating SWOT analysis: {str(e)}")
         raise HTTPException(status_code=500, detail="Error creating SWOT analysis")
+    except Exception as e:
+        # LLM transport and response-format failures
+        logger.error(f"Error generating SWOT analysis: {str(e)}")
+        raise HTTPException(status_code=502, detail="Error generating SWOT analysis")
 
 @router.get("/faculty/pending", response_model=List[SubmissionSummary])
-async def get_pending_submissions(course_id: str, db: Session = Depends(get_db)):
+async def get_pending_submissions(course_id: uuid.UUID, db: AsyncSession = Depends(get_async_db)):
     """
     Get all pending submissions for faculty evaluation
     """
     try:
-        submissions = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.course_id == course_id,
-            DBStudentSubmission.evaluation_status == "pending"
-        ).all()
-        
-        return [SubmissionSummary(
-            submission_id=sub.id,
-            student_id=sub.student_id,
-            student_name=sub.student_name,
-            submission_date=sub.submission_date,
-            content=sub.content
-        ) for sub in submissions]
+        rows = (await db.execute(_PENDING_SUBMISSIONS, {'course_id': course_id})).all()
+        
+        # Submissions carry no separate student name; the student id is shown in its place
+        return _list_response(_SUBMISSION_SUMMARY_LIST, [{
+            'submission_id': str(row.id),
+            'student_id': row.student_id,
+            'student_name': row.student_id,
+            'submission_date': row.submission_date,
+            'content': row.content or ''
+        } for row in rows])
         
     except Exception as e:
         logger.error(f"Error fetching pending submissions: {str(e)}")
@@ -134,18 +262,16 @@ async def get_pending_submissions(course_id: str, db: Session = Depends(get_db))
 
 @router.post("/faculty/evaluate/{submission_id}")
 async def evaluate_submission(
-    submission_id: str,
+    submission_id: uuid.UUID,
     evaluation: FacultyEvaluation,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Faculty evaluation of a student submission using rubric
     """
     try:
         # Get submission
-        submission = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.id == submission_id
-        ).first()
+        submission = (await db.execute(_SUBMISSION_BY_ID, {'submission_id': submission_id})).scalar_one_or_none()
         
         if not submission:
             raise HTTPException(status_code=404, detail="Submission not found")
@@ -164,20 +290,14 @@ async def evaluate_submission(
         
         # Save to database
         db.add(faculty_evaluation)
-        db.commit()
+        await db.commit()
+        invalidate_dashboard_cache()
         
         return {"message": "Evaluation completed successfully"}
         
     except Exception as e:
         logger.error(f"Error evaluating submission: {str(e)}")
         raise HTTPException(status_code=500, detail="Error evaluating submission")
-    submission_text: str
-
-class SWOTResponse(BaseModel):
-    submission_id: str
-    analysis: SWOTAnalysis
-    iteration: int
-    final: bool
 
 # Pydantic models for rubric evaluation
 class RejectionRequest(BaseModel):
@@ -201,118 +321,99 @@ class RubricEvaluation(BaseModel):
 
 class RubricRequest(BaseModel):
     faculty_id: str
-    submission_id: str
+    submission_id: uuid.UUID
     criteria_scores: Dict[str, float]
     feedback: str
 
 # Initialize submission processing service
 submission_processor = SubmissionProcessingService()
 
-@router.post("/student/swot", response_model=SWOTResponse)
-async def analyze_student_submission(request: SWOTRequest, db: Session = Depends(get_db)):
-    """
-    Analyze student submission using SWOT analysis.
-    Students can submit multiple times for iterative feedback.
-    """
-    try:
-        # Get existing submission details
-        submission = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.id == uuid.UUID(request.submission_id)
-        ).first()
-        
-        if not submission:
-            raise HTTPException(status_code=404, detail="Submission not found")
-            
-        # Get iteration count
-        iteration = db.query(DBEvaluationResult).filter(
-            DBEvaluationResult.submission_id == uuid.UUID(request.submission_id),
-            DBEvaluationResult.type == 'swot'
-        ).count() + 1
-
-        # Perform SWOT analysis using LLM
-        analysis = await submission_processor.perform_swot_analysis(
-            request.submission_text,
-            submission.assignment.requirements if submission.assignment else []
-        )
-        
-        # Save analysis result
-        result = DBEvaluationResult(
-            id=uuid.uuid4(),
-            submission_id=uuid.UUID(request.submission_id),
-            evaluator_id=request.student_id,
-            type='swot',
-            scores={},  # SWOT doesn't have numerical scores
-            feedback=analysis.dict(),
-            iteration=iteration
-        )
-        db.add(result)
-        db.commit()
-        
-        return SWOTResponse(
-            submission_id=request.submission_id,
-            analysis=analysis,
-            iteration=iteration,
-            final=iteration >= 3  # Limit to 3 iterations
-        )
-        
-    except Exception as e:
-        logger.error(f"Error in SWOT analysis: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
 @router.post("/faculty/evaluate", response_model=RubricEvaluation)
-async def faculty_evaluation(request: RubricRequest, db: Session = Depends(get_db)):
+async def faculty_evaluation(request: RubricRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Faculty performs final rubric-based evaluation of student submission
     """
     try:
-        # Get submission
-        submission = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.id == uuid.UUID(request.submission_id)
-        ).first()
+        # Get submission together with its assignment's rubric in one round trip; the rubric linked
+        # by assignment_id wins over legacy assignment_ids matches
+        row = (await db.execute(
+            select(DBStudentSubmission, DBAssignmentRubric)
+            .outerjoin(
+                DBAssignmentRubric,
+                DBAssignmentRubric.matches_assignment(DBStudentSubmission.assignment_id)
+            )
+            .where(DBStudentSubmission.id == request.submission_id)
+            .order_by(
+                (DBAssignmentRubric.assignment_id == DBStudentSubmission.assignment_id).desc().nullslast(),
+                DBAssignmentRubric.created_at.desc()
+            )
+            .limit(1)
+        )).first()
         
-        if not submission:
+        if not row:
             raise HTTPException(status_code=404, detail="Submission not found")
+        submission, rubric = row
+        if not rubric:
+            raise HTTPException(status_code=404, detail="No rubric found for this assignment")
+        
+        # Index rubric criteria by name once, outside the per-criterion loop
+        rubric_criteria = {
+            criterion.get('category'): criterion
+            for criterion in (rubric.rubrics_list or [])
+        }
 
-        # Calculate total score
-        total_score = sum(request.criteria_scores.values())
+        # One pass over the submitted scores: bind each criterion's rubric entry once and build both
+        # the stored criterion_scores ({category: details}, as the AI evaluation stores them) and
+        # the response criteria from it, totalling the score as we go
+        total_score = 0
+        criterion_scores = {}
+        criteria = []
+        for name, score in request.criteria_scores.items():
+            meta = rubric_criteria.get(name) or _EMPTY
+            max_score = meta.get('max_score', 10)
+            feedback = meta.get('feedback', '')
+            total_score += score
+            criterion_scores[name] = {"score": float(score), "max_score": float(max_score), "feedback": feedback}
+            criteria.append(RubricCriterion(
+                name=name,
+                description=meta.get('description', ''),
+                max_score=max_score,
+                score=score,
+                feedback=feedback
+            ))
         
         # Create evaluation result
         result = DBEvaluationResult(
             id=uuid.uuid4(),
-            submission_id=uuid.UUID(request.submission_id),
-            evaluator_id=request.faculty_id,
-            type='rubric',
-            scores=request.criteria_scores,
-            feedback=request.feedback,
-            total_score=total_score
+            submission_id=request.submission_id,
+            assignment_id=submission.assignment_id,
+            rubric_id=rubric.id,
+            overall_score=total_score,
+            criterion_scores=criterion_scores,
+            faculty_feedback=request.feedback,
+            faculty_reviewed=True
         )
         db.add(result)
         
         # Update submission status
         submission.evaluation_status = 'completed'
-        db.commit()
+        await db.commit()
+        invalidate_dashboard_cache()
         
         return RubricEvaluation(
-            submission_id=request.submission_id,
-            criteria=[
-                RubricCriterion(
-                    name=name,
-                    description=submission.assignment.rubric.get(name, {}).get('description', ''),
-                    max_score=submission.assignment.rubric.get(name, {}).get('max_score', 10),
-                    score=score,
-                    feedback=submission.assignment.rubric.get(name, {}).get('feedback', '')
-                )
-                for name, score in request.criteria_scores.items()
-            ],
+            submission_id=str(request.submission_id),
+            criteria=criteria,
             total_score=total_score,
             overall_feedback=request.feedback,
             evaluated_by=request.faculty_id,
             evaluation_date=datetime.now()
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in faculty evaluation: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 # Helper to transform hardcoded MySQL rubric dimensions into app's expected structure
@@ -324,10 +425,11 @@ def _transform_mysql_rubric_to_app_structure(dimensions: List[Dict[str, Any]]) -
     for dim in dimensions or []:
         category_name = dim.get('name', 'Unnamed Category')
         criteria_output = dim.get('criteria_output', {}) or {}
-        questions: List[str] = []
-        for crit_key, crit_desc in criteria_output.items():
-            # Form a clear evaluation prompt segment for each sub-criterion
-            questions.append(f"{category_name} > {crit_key}: {crit_desc}")
+        # Form a clear evaluation prompt segment for each sub-criterion
+        questions = [
+            f"{category_name} > {crit_key}: {crit_desc}"
+            for crit_key, crit_desc in criteria_output.items()
+        ]
         if questions:
             rubrics.append({
                 'category': category_name,
@@ -335,6 +437,46 @@ def _transform_mysql_rubric_to_app_structure(dimensions: List[Dict[str, Any]]) -
             })
     return {'rubrics': rubrics}
 
+def _get_transformed_rubric(rubric_name: str) -> Tuple[Dict[str, Any], str]:
+    """Hardcoded MySQL rubric in app structure plus the sha256 of its JSON, fetched at most once
+    per RUBRIC_CACHE_TTL_SECONDS (shared: treat as read-only).
+    Raises instead of returning None so a failed fetch is never cached.
+    """
+    cached = _rubric_cache.get(rubric_name)
+    if cached is None:
+        mysql_dimensions = fetch_rubric(rubric_name=rubric_name, as_text=False)
+        if not mysql_dimensions:
+            raise HTTPException(status_code=500, detail="Hardcoded rubric not found in MySQL")
+        rubric = _transform_mysql_rubric_to_app_structure(mysql_dimensions)
+        cached = (rubric, hashlib.sha256(json.dumps(rubric, sort_keys=True).encode()).hexdigest())
+        _rubric_cache.set(rubric_name, cached)
+    return cached
+
+async def _ensure_assignment_rubric(db: AsyncSession, assignment_id: uuid.UUID):
+    """The assignment's rubric, materialized from the hardcoded rubric when it has none.
+    Returns (rubric, created). The insert is ON CONFLICT (assignment_id) DO NOTHING, so a
+    concurrent request that creates it first is picked up by re-reading instead of duplicating it.
+    """
+    rubric = (await db.execute(_RUBRIC_BY_ASSIGNMENT, {'assignment_id': assignment_id})).scalar_one_or_none()
+    if rubric is not None:
+        return rubric, False
+    
+    transformed, _ = _get_transformed_rubric("Situated_Learning_rubric")
+    rubric = (await db.execute(
+        pg_insert(DBAssignmentRubric).values(
+            id=uuid.uuid4(),
+            assignment_ids=[assignment_id],
+            assignment_id=assignment_id,
+            rubric_name="Situated_Learning_rubric",
+            doc_type="Assignment",
+            criteria=transformed,
+            rubrics_list=transformed['rubrics']
+        ).on_conflict_do_nothing(index_elements=['assignment_id']).returning(DBAssignmentRubric)
+    )).scalar_one_or_none()
+    if rubric is not None:
+        return rubric, True
+    return (await db.execute(_RUBRIC_BY_ASSIGNMENT, {'assignment_id': assignment_id})).scalar_one(), False
+
 # Response Models
 class CourseResponse(BaseModel):
     id: str
@@ -410,91 +552,122 @@ class CourseSelectionRequest(BaseModel):
     semester: int
 
 class EvaluationRequest(BaseModel):
-    submission_id: str
-    criteria_scores: Dict[str, float]
-    feedback: str
-    faculty_id: Optional[str]='f20220162'
+    assignment_id: uuid.UUID
+    rubric_id: Optional[uuid.UUID] = None
+    submission_ids: Optional[List[uuid.UUID]] = None
 
 class FacultyReviewRequest(BaseModel):
     adjusted_scores: Dict[str, Any]
     faculty_feedback: str
     reason_for_adjustment: str
 
+# Prebuilt validators/serializers for the list responses, built once instead of per request
+_SUBMISSION_SUMMARY_LIST = TypeAdapter(List[SubmissionSummary])
+_COURSE_LIST = TypeAdapter(List[CourseResponse])
+_SAVED_ASSIGNMENT_LIST = TypeAdapter(List[SavedAssignmentResponse])
+_RUBRIC_LIST = TypeAdapter(List[RubricResponse])
+_COURSE_FILTERS = TypeAdapter(Dict[str, List[Any]])
+
+def _dump_list(adapter: TypeAdapter, rows: Any) -> bytes:
+    """Validate plain row dicts and serialize them in one pass with a prebuilt adapter"""
+    return adapter.dump_json(adapter.validate_python(rows))
+
+def _list_response(adapter: TypeAdapter, rows: List[Dict[str, Any]]) -> Response:
+    """JSON response for rows serialized through a prebuilt adapter"""
+    return Response(content=_dump_list(adapter, rows), media_type="application/json")
+
+def _listing_response(request: Request, body: bytes) -> Response:
+    """Serve a cached listing body with validators, or 304 when the client's copy is current"""
+    headers = {
+        "ETag": f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"',
+        "Cache-Control": f"private, max-age={LISTING_CACHE_TTL_SECONDS}"
+    }
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _store_listing(request: Request, cache_key: tuple, body: bytes) -> Response:
+    """Cache a freshly built listing body and serve it"""
+    _listing_cache.set(cache_key, body)
+    return _listing_response(request, body)
+
 # Step 1: Course Selection API
 @router.get("/courses", response_model=List[CourseResponse])
-async def get_courses_with_saved_assignments(db: Session = Depends(get_db)):
+async def get_courses_with_saved_assignments(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Get list of unique course titles that have saved assignments for evaluation
     Returns unique course titles with their available academic years and semesters
     """
     try:
-        # Query courses that have saved assignments - get unique titles
-        courses_with_assignments = db.query(DBCourse.title).join(
-            DBGeneratedAssignment, DBCourse.id == DBGeneratedAssignment.course_id
-        ).filter(
-            DBGeneratedAssignment.is_selected == True,
-            DBGeneratedAssignment.assignment_name.isnot(None)
-        ).distinct().all()
-        
-        course_responses = []
-        for course_tuple in courses_with_assignments:
-            course_title = course_tuple[0]
-            
-            # Get all courses with this title to find available academic years and semesters
-            courses_with_title = db.query(DBCourse).filter(
-                DBCourse.title == course_title
-            ).all()
-            
-            # Count total saved assignments for this course title
-            assignment_count = db.query(DBGeneratedAssignment).join(
-                DBCourse, DBCourse.id == DBGeneratedAssignment.course_id
-            ).filter(
-                DBCourse.title == course_title,
+        cache_key = ('courses',)
+        cached = _listing_cache.get(cache_key)
+        if cached is not None:
+            return _listing_response(request, cached)
+        
+        # One grouped query: a representative course row per title plus its saved assignment count
+        # (Postgres has no min(uuid), so the id is compared as text)
+        rows = (await db.execute(
+            select(
+                DBCourse.title,
+                func.min(cast(DBCourse.id, String)),
+                func.min(DBCourse.course_code),
+                func.min(DBCourse.academic_year),
+                func.min(DBCourse.semester),
+                func.count(DBGeneratedAssignment.id)
+            ).join(
+                DBGeneratedAssignment, DBCourse.id == DBGeneratedAssignment.course_id
+            ).where(
                 DBGeneratedAssignment.is_selected == True,
                 DBGeneratedAssignment.assignment_name.isnot(None)
-            ).count()
-            
-            # Use the first course entry for basic info, but this represents all courses with this title
-            first_course = courses_with_title[0]
-            
-            course_responses.append(CourseResponse(
-                id=str(first_course.id),  # This will be used for filtering, but we'll filter by title
-                title=course_title,
-                course_code=first_course.course_code,
-                academic_year=first_course.academic_year,
-                semester=first_course.semester,
-                saved_assignment_count=assignment_count
-            ))
-        
-        return course_responses
+            ).group_by(DBCourse.title)
+        )).all()
+        
+        return _store_listing(request, cache_key, _dump_list(_COURSE_LIST, [
+            {
+                'id': course_id,  # This will be used for filtering, but we'll filter by title
+                'title': title,
+                'course_code': course_code,
+                'academic_year': academic_year,
+                'semester': semester,
+                'saved_assignment_count': assignment_count
+            }
+            for title, course_id, course_code, academic_year, semester, assignment_count in rows
+        ]))
         
     except Exception as e:
         logger.error(f"Error fetching courses: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch courses: {str(e)}")
 
 @router.get("/courses/{course_title}/filters")
-async def get_course_filters(course_title: str, db: Session = Depends(get_db)):
+async def get_course_filters(course_title: str, request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Get available academic years and semesters for a specific course title
     """
     try:
+        cache_key = ('filters', course_title)
+        cached = _listing_cache.get(cache_key)
+        if cached is not None:
+            return _listing_response(request, cached)
+        
         # Get all courses with this title that have saved assignments
-        courses = db.query(DBCourse).join(
-            DBGeneratedAssignment, DBCourse.id == DBGeneratedAssignment.course_id
-        ).filter(
-            DBCourse.title == course_title,
-            DBGeneratedAssignment.is_selected == True,
-            DBGeneratedAssignment.assignment_name.isnot(None)
-        ).distinct().all()
+        courses = (await db.execute(
+            select(DBCourse).join(
+                DBGeneratedAssignment, DBCourse.id == DBGeneratedAssignment.course_id
+            ).where(
+                DBCourse.title == course_title,
+                DBGeneratedAssignment.is_selected == True,
+                DBGeneratedAssignment.assignment_name.isnot(None)
+            ).distinct()
+        )).scalars().all()
         
         # Extract unique academic years and semesters
         academic_years = list(set([course.academic_year for course in courses if course.academic_year]))
         semesters = list(set([course.semester for course in courses if course.semester]))
         
-        return {
+        return _store_listing(request, cache_key, _dump_list(_COURSE_FILTERS, {
             "academic_years": sorted(academic_years),
             "semesters": sorted(semesters)
-        }
+        }))
         
     except Exception as e:
         logger.error(f"Error fetching course filters: {str(e)}")
@@ -504,19 +677,25 @@ async def get_course_filters(course_title: str, db: Session = Depends(get_db)):
 @router.get("/courses/{course_title}/assignments", response_model=List[SavedAssignmentResponse])
 async def get_saved_assignments_for_course(
     course_title: str,
+    request: Request,
     academic_year: Optional[str] = None,
     semester: Optional[int] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get saved assignments for a specific course title
     Filter by academic year and semester if provided
     """
     try:
+        cache_key = ('assignments', course_title, academic_year, semester)
+        cached = _listing_cache.get(cache_key)
+        if cached is not None:
+            return _listing_response(request, cached)
+        
         # Build query for saved assignments - join with course table for filtering
-        query = db.query(DBGeneratedAssignment).join(
+        query = select(DBGeneratedAssignment).join(
             DBCourse, DBCourse.id == DBGeneratedAssignment.course_id
-        ).filter(
+        ).where(
             DBCourse.title == course_title,
             DBGeneratedAssignment.is_selected == True,
             DBGeneratedAssignment.assignment_name.isnot(None)
@@ -524,34 +703,47 @@ async def get_saved_assignments_for_course(
         
         # Apply additional filters if provided
         if academic_year:
-            query = query.filter(DBCourse.academic_year == academic_year)
+            query = query.where(DBCourse.academic_year == academic_year)
         
         if semester:
-            query = query.filter(DBCourse.semester == semester)
-        
-        assignments = query.all()
+            query = query.where(DBCourse.semester == semester)
+        
+        assignments = (await db.execute(query)).scalars().all()
+        
+        # Find which assignments have a rubric with one query (FK link or legacy array overlap)
+        assignment_ids = [assignment.id for assignment in assignments]
+        rubric_rows = (await db.execute(
+            select(
+                DBAssignmentRubric.assignment_id, DBAssignmentRubric.assignment_ids
+            ).where(
+                or_(
+                    DBAssignmentRubric.assignment_id.in_(assignment_ids),
+                    DBAssignmentRubric.assignment_ids.overlap(assignment_ids)
+                )
+            )
+        )).all() if assignment_ids else []
+        assignments_with_rubric = {
+            aid for linked_id, legacy_ids in rubric_rows for aid in (linked_id, *(legacy_ids or ()))
+        }
         
-        # Convert to response models and check for rubrics
-        assignment_responses = []
+        # Convert to response rows
+        assignment_rows = []
         for assignment in assignments:
-            # Check if assignment has an associated rubric
-            has_rubric = db.query(DBAssignmentRubric).filter(
-                DBAssignmentRubric.assignment_ids.contains([assignment.id])
-            ).first() is not None
+            has_rubric = assignment.id in assignments_with_rubric
             
-            assignment_responses.append(SavedAssignmentResponse(
-                id=str(assignment.id),
-                assignment_name=assignment.assignment_name,
-                title=assignment.title,
-                description=assignment.description,
-                difficulty_level=assignment.difficulty_level,
-                topics=assignment.topics,
-                domains=assignment.domains,
-                created_at=assignment.created_at,
-                has_rubric=has_rubric
-            ))
+            assignment_rows.append({
+                'id': str(assignment.id),
+                'assignment_name': assignment.assignment_name,
+                'title': assignment.title,
+                'description': assignment.description,
+                'difficulty_level': assignment.difficulty_level,
+                'topics': assignment.topics,
+                'domains': assignment.domains,
+                'created_at': assignment.created_at,
+                'has_rubric': has_rubric
+            })
         
-        return assignment_responses
+        return _store_listing(request, cache_key, _dump_list(_SAVED_ASSIGNMENT_LIST, assignment_rows))
         
     except Exception as e:
         logger.error(f"Error fetching assignments for course {course_title}: {str(e)}")
@@ -559,58 +751,212 @@ async def get_saved_assignments_for_course(
 
 # Step 3: Rubric Selection API
 @router.get("/assignments/{assignment_id}/rubrics", response_model=List[RubricResponse])
-async def get_rubrics_for_assignment(assignment_id: str, db: Session = Depends(get_db)):
+async def get_rubrics_for_assignment(assignment_id: uuid.UUID, request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Get available rubrics for a specific assignment
     """
     try:
-        assignment_uuid = uuid.UUID(assignment_id)
+        cache_key = ('rubrics', assignment_id)
+        cached = _listing_cache.get(cache_key)
+        if cached is not None:
+            return _listing_response(request, cached)
         
         # Always ensure a rubric exists for this assignment using the hardcoded rubric
-        existing = db.query(DBAssignmentRubric).filter(
-            DBAssignmentRubric.assignment_ids.contains([assignment_uuid])
-        ).first()
-
-        if not existing:
-            # Load hardcoded rubric from MySQL and persist as the assignment's rubric
-            mysql_dimensions = fetch_rubric(rubric_name="Situated_Learning_rubric", as_text=False)
-            if not mysql_dimensions:
-                raise HTTPException(status_code=500, detail="Hardcoded rubric not found in MySQL")
-            transformed = _transform_mysql_rubric_to_app_structure(mysql_dimensions)
-            new_rubric = DBAssignmentRubric(
-                id=uuid.uuid4(),
-                assignment_ids=[assignment_uuid],
-                rubric_name="Situated_Learning_rubric",
-                doc_type="Assignment",
-                criteria=transformed
-            )
-            db.add(new_rubric)
-            db.commit()
-            existing = new_rubric
-
-        return [RubricResponse(
-            id=str(existing.id),
-            rubric_name=existing.rubric_name,
-            doc_type=existing.doc_type,
-            criteria=existing.criteria,
-            is_edited=existing.is_edited,
-            created_at=existing.updated_at or existing.created_at
-        )]
-        
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid assignment ID format")
+        existing, created = await _ensure_assignment_rubric(db, assignment_id)
+        if created:
+            await db.commit()
+            # has_rubric in the cached assignment listings is now stale
+            _listing_cache.clear()
+
+        return _store_listing(request, cache_key, _dump_list(_RUBRIC_LIST, [{
+            'id': str(existing.id),
+            'rubric_name': existing.rubric_name,
+            'doc_type': existing.doc_type,
+            'criteria': existing.criteria,
+            'is_edited': existing.is_edited,
+            'created_at': existing.updated_at or existing.created_at
+        }]))
+        
     except Exception as e:
         logger.error(f"Error fetching rubrics for assignment {assignment_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch rubrics: {str(e)}")
 
+def _text_preview(text: Optional[str], text_length: Optional[int] = None) -> Optional[str]:
+    """First TEXT_PREVIEW_CHARS characters of an extracted text, with "..." when it was cut"""
+    if not text:
+        return text
+    if text_length is None:
+        text_length = len(text)
+    return text[:TEXT_PREVIEW_CHARS] + "..." if text_length > TEXT_PREVIEW_CHARS else text
+
+def _to_submission_response(
+    submission_id,
+    file_name: str,
+    file_path: str,
+    text_preview: Optional[str],
+    ocr_confidence: Optional[float],
+    processing_status: str,
+    extraction_method: Optional[str] = "standard"
+) -> SubmissionResponse:
+    """Build a SubmissionResponse from an already-truncated text preview"""
+    return SubmissionResponse(
+        id=str(submission_id),
+        file_name=file_name,
+        file_path=file_path,
+        extracted_text=text_preview,
+        ocr_confidence=ocr_confidence or 0.0,
+        processing_status=processing_status,
+        extraction_method=extraction_method
+    )
+
+async def _process_uploaded_file(
+    file: UploadFile,
+    file_content: bytes,
+    content_hash: str,
+    assignment_id: uuid.UUID,
+    stored=None,
+    defer_extraction: bool = False
+) -> Dict[str, Any]:
+    """Extract one uploaded file's text and store it in MinIO (blocking steps run in threads).
+    A byte-identical file already on record (stored) reuses its MinIO object and extracted text;
+    with defer_extraction the file is only stored and left 'queued' for _extract_submission_text.
+    """
+    submission_id = str(uuid.uuid4())
+    
+    if stored is not None:
+        logger.info(f"Reusing stored copy of {file.filename} (sha256 {content_hash[:12]}): {stored.file_path}")
+        return {
+            'submission_id': submission_id,
+            'file_name': file.filename,
+            'file_path': stored.file_path,
+            'extracted_text': stored.extracted_text,
+            'text_preview': _text_preview(stored.extracted_text),
+            'ocr_confidence': stored.ocr_confidence or 0.0,
+            'extraction_method': stored.extraction_method or "standard",
+            'processing_status': "processed",
+            'content_hash': content_hash,
+        }
+    
+    # Process the file to extract text (now, or later in a background task)
+    if defer_extraction:
+        processing_result = {"status": "queued"}
+    else:
+        processing_result = await asyncio.to_thread(
+            submission_processor.process_submission_bytes,
+            file_bytes=file_content,
+            filename=file.filename,
+            submission_id=submission_id
+        )
+    
+    # Determine processing status and extract text
+    text_preview = _text_preview(processing_result.get("extracted_text"))
+    if processing_result["status"] == "queued":
+        extracted_text = None
+        ocr_confidence = None
+        extraction_method = None
+        processing_status = "queued"
+    elif processing_result["status"] == "success":
+        extracted_text = processing_result["extracted_text"]
+        ocr_confidence = processing_result.get("confidence", 1.0)
+        extraction_method = processing_result.get("extraction_method", "standard")
+        processing_status = "processed"
+        # Log extracted text (full or preview) depending on environment flag
+        if not extracted_text:
+            logger.warning("[EXTRACTED TEXT] File: %s extracted but text is empty or None", file.filename)
+        elif logger.isEnabledFor(logging.INFO):
+            if SHOW_FULL_EXTRACTED_LOGS:
+                logger.info("[EXTRACTED TEXT - FULL] File: %s, Submission: %s, Length: %d chars", file.filename, submission_id, len(extracted_text))
+                logger.info("Content:\n%s", extracted_text)
+            else:
+                logger.info("[EXTRACTED TEXT] File: %s, Submission: %s, Length: %d chars, Preview: %r", file.filename, submission_id, len(extracted_text), text_preview)
+    else:
+        extracted_text = None
+        ocr_confidence = 0.0
+        extraction_method = "failed"
+        processing_status = "failed"
+        logger.error(f"Processing failed for {file.filename}: {processing_result.get('error_message', 'Unknown error')}")
+    
+    # Generate MinIO path for student submissions
+    # Following structure: student_submissions/{assignment_id}/{submission_id}_{filename}
+    minio_path = f"student_submissions/{assignment_id}/{submission_id}_{file.filename}"
+    
+    # Store file in MinIO (reusing the bytes read above)
+    try:
+        content_type = "application/pdf" if file.filename.lower().endswith('.pdf') else "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        
+        await asyncio.to_thread(
+            minio_client.upload_file_object,
+            io.BytesIO(file_content),
+            minio_path,
+            len(file_content),
+            content_type
+        )
+        logger.info(f"Uploaded {file.filename} to MinIO: {minio_path}")
+        
+    except Exception as e:
+        logger.error(f"Failed to upload {file.filename} to MinIO: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to store file {file.filename}")
+    
+    return {
+        'submission_id': submission_id,
+        'file_name': file.filename,
+        'file_path': minio_path,
+        'extracted_text': extracted_text,
+        'text_preview': text_preview,
+        'ocr_confidence': ocr_confidence,
+        'extraction_method': extraction_method,
+        'processing_status': processing_status,
+        'content_hash': content_hash,
+    }
+
+async def _extract_submission_text(submission_id: str, filename: str, file_content: bytes):
+    """Background task: extract a deferred submission's text and record the outcome on its row"""
+    processing_result = await asyncio.to_thread(
+        submission_processor.process_submission_bytes,
+        file_bytes=file_content,
+        filename=filename,
+        submission_id=submission_id
+    )
+    
+    if processing_result["status"] == "success":
+        values = {
+            'extracted_text': processing_result["extracted_text"],
+            'ocr_confidence': processing_result.get("confidence", 1.0),
+            'extraction_method': processing_result.get("extraction_method", "standard"),
+            'processing_status': 'pending'
+        }
+    else:
+        logger.error(f"Deferred processing failed for {filename}: {processing_result.get('error_message', 'Unknown error')}")
+        values = {
+            'ocr_confidence': 0.0,
+            'extraction_method': 'failed',
+            'processing_status': 'failed',
+            'error_message': processing_result.get('error_message')
+        }
+    
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(DBStudentSubmission)
+                .where(DBStudentSubmission.id == uuid.UUID(submission_id))
+                .values(**values)
+            )
+            await session.commit()
+        logger.info(f"Deferred extraction finished for submission {submission_id}: {values['processing_status']}")
+    except Exception as e:
+        logger.error(f"Failed to record deferred extraction for submission {submission_id}: {str(e)}")
+
 # Step 4: Student Submission Upload API
 @router.post("/submissions/upload", response_model=List[SubmissionResponse])
 async def upload_student_submissions(
-    assignment_id: str = Form(...),
+    response: Response,
+    background_tasks: BackgroundTasks,
+    assignment_id: uuid.UUID = Form(...),
     student_id: Optional[str] = Form(None),  # Made optional for now
-    course_id: Optional[str] = Form(None),   # Made optional for now
+    course_id: Optional[uuid.UUID] = Form(None),   # Made optional for now
+    defer_extraction: bool = Form(False),
     files: List[UploadFile] = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Upload student submissions for evaluation (max 5 files, PDF/DOCX only)
@@ -621,6 +967,8 @@ async def upload_student_submissions(
     - assignment_id: UUID of the assignment
     - student_id: ID of the student submitting (optional - will be pulled from assignment)
     - course_id: UUID of the course (optional - will be pulled from assignment)
+    - defer_extraction: store files and return 202 right away; text is extracted in the
+      background and the submissions report processing_status 'queued' until it finishes
     - files: List of files to upload (max 5, PDF/DOCX only)
     """
     print("UPLOAD STUDENT SUBMISSIONS CALLED")
@@ -642,9 +990,7 @@ async def upload_student_submissions(
             raise HTTPException(status_code=400, detail="Maximum 5 submissions allowed per evaluation")
     
         # Validate assignment exists and get course info
-        assignment = db.query(DBGeneratedAssignment).filter(
-            DBGeneratedAssignment.id == uuid.UUID(assignment_id)
-        ).first()
+        assignment = (await db.execute(_ASSIGNMENT_BY_ID, {'assignment_id': assignment_id})).first()
         
         if not assignment:
             raise HTTPException(status_code=404, detail="Assignment not found")
@@ -659,7 +1005,7 @@ async def upload_student_submissions(
         
         # Use provided values or get from assignment
         final_student_id = student_id or "TEMP_STUDENT"  # This should be replaced with actual student ID from auth
-        final_course_id = course_id or str(assignment.course_id)
+        final_course_id = course_id or assignment.course_id
         
         # Log final values
         logger.debug("="*50)
@@ -675,88 +1021,58 @@ async def upload_student_submissions(
             raise HTTPException(status_code=400, detail="Course ID not found - either provide it or ensure assignment has course_id")
         
         # Check for existing submissions (but don't delete them)
-        existing_submissions = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.assignment_id == uuid.UUID(assignment_id)
-        ).all()
+        existing_count = (await db.execute(
+            select(func.count(DBStudentSubmission.id)).where(
+                DBStudentSubmission.assignment_id == assignment_id
+            )
+        )).scalar()
         
-        if existing_submissions:
-            logger.info(f"Found {len(existing_submissions)} existing submissions for assignment {assignment_id}. New submissions will be added alongside existing ones.")
+        if existing_count:
+            logger.info(f"Found {existing_count} existing submissions for assignment {assignment_id}. New submissions will be added alongside existing ones.")
         
         submission_responses = []
         
         logger.info(f"Processing {len(files)} files for assignment {assignment_id}")
         
-        # Process each uploaded file
+        # Validate file types before doing any work
         for file in files:
-            # Validate file type
             if not file.filename.lower().endswith(('.pdf', '.docx')):
                 raise HTTPException(status_code=400, detail=f"Invalid file type: {file.filename}. Only PDF and DOCX files are allowed.")
-            
-            # Read file content
-            file_content = await file.read()
-            submission_id = str(uuid.uuid4())
-            
-            # Process the file to extract text
-            processing_result = submission_processor.process_submission_bytes(
-                file_bytes=file_content,
-                filename=file.filename,
-                submission_id=submission_id
+        
+        # Hash the uploads and look up byte-identical files already stored for this assignment (one
+        # query for all). Only the same assignment's objects are reused, so a stored file_path never
+        # points into another assignment's storage; DISTINCT ON keeps the newest row per hash
+        file_contents = await asyncio.gather(*(file.read() for file in files))
+        content_hashes = [hashlib.sha256(content).hexdigest() for content in file_contents]
+        stored_rows = (await db.execute(
+            select(
+                DBStudentSubmission.content_hash,
+                DBStudentSubmission.file_path,
+                DBStudentSubmission.extracted_text,
+                DBStudentSubmission.ocr_confidence,
+                DBStudentSubmission.extraction_method
+            ).where(
+                DBStudentSubmission.assignment_id == assignment_id,
+                DBStudentSubmission.content_hash.in_(content_hashes),
+                DBStudentSubmission.extracted_text.isnot(None)
+            ).distinct(DBStudentSubmission.content_hash)
+            .order_by(DBStudentSubmission.content_hash, DBStudentSubmission.created_at.desc())
+        )).all()
+        stored_by_hash = {row.content_hash: row for row in stored_rows}
+        
+        # Extract and store all new files concurrently (blocking work runs in threads)
+        processed_files = await asyncio.gather(*(
+            _process_uploaded_file(
+                file, content, content_hash, assignment_id,
+                stored_by_hash.get(content_hash), defer_extraction
             )
-            
-            # Determine processing status and extract text
-            if processing_result["status"] == "success":
-                extracted_text = processing_result["extracted_text"]
-                ocr_confidence = processing_result.get("confidence", 1.0)
-                extraction_method = processing_result.get("extraction_method", "standard")
-                processing_status = "processed"
-                # Log extracted text (full or preview) depending on environment flag
-                try:
-                    if extracted_text:
-                        text_length = len(extracted_text)
-                        if SHOW_FULL_EXTRACTED_LOGS:
-                            logger.info(f"[EXTRACTED TEXT - FULL] File: {file.filename}, Submission: {submission_id}, Length: {text_length} chars")
-                            logger.info(f"Content:\n{extracted_text}")
-                        else:
-                            preview = extracted_text[:200] + "..." if text_length > 200 else extracted_text
-                            logger.info(f"[EXTRACTED TEXT] File: {file.filename}, Submission: {submission_id}, Length: {text_length} chars, Preview: {preview!r}")
-                    else:
-                        logger.warning(f"[EXTRACTED TEXT] File: {file.filename} extracted but text is empty or None")
-                except Exception as e:
-                    # Defensive: don't break upload on logging issues
-                    logger.exception(f"Error while logging extracted text: {e}")
-            else:
-                extracted_text = None
-                ocr_confidence = 0.0
-                extraction_method = "failed"
-                processing_status = "failed"
-                logger.error(f"Processing failed for {file.filename}: {processing_result.get('error_message', 'Unknown error')}")
-            
-            # Generate MinIO path for student submissions
-            # Following structure: student_submissions/{assignment_id}/{submission_id}_{filename}
-            minio_path = f"student_submissions/{assignment_id}/{submission_id}_{file.filename}"
-            
-            # Store file in MinIO
-            try:
-                # Reset file position to beginning
-                await file.seek(0)
-                file_content = await file.read()
-                
-                # Upload to MinIO
-                import io
-                file_obj = io.BytesIO(file_content)
-                content_type = "application/pdf" if file.filename.lower().endswith('.pdf') else "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                
-                minio_client.upload_file_object(
-                    file_obj, 
-                    minio_path, 
-                    len(file_content),
-                    content_type
-                )
-                logger.info(f"Uploaded {file.filename} to MinIO: {minio_path}")
-                
-            except Exception as e:
-                logger.error(f"Failed to upload {file.filename} to MinIO: {str(e)}")
-                raise HTTPException(status_code=500, detail=f"Failed to store file {file.filename}")
+            for file, content, content_hash in zip(files, file_contents, content_hashes)
+        ))
+        
+        submission_rows = []
+        for processed in processed_files:
+            submission_id = processed['submission_id']
+            extracted_text = processed['extracted_text']
             
             # Log submission creation details
             logger.debug("="*50)
@@ -766,110 +1082,123 @@ async def upload_student_submissions(
             logger.info(f"→ submission_id: {submission_id!r}")
             logger.info(f"→ student_id: {final_student_id!r}")
             logger.info(f"→ course_id: {final_course_id!r}")
-            logger.info(f"→ file: {file.filename!r}")
+            logger.info(f"→ file: {processed['file_name']!r}")
             logger.debug("-"*50)
             
-            # Create database entry with MinIO path
-            submission = DBStudentSubmission(
-                id=uuid.UUID(submission_id),
-                student_id=final_student_id,  # Use final_student_id
-                course_id=uuid.UUID(final_course_id),  # Use final_course_id
-                assignment_id=uuid.UUID(assignment_id),
-                original_file_name=file.filename,
-                file_path=minio_path,  # Store MinIO path instead of temp path
-                file_type=file.filename.split('.')[-1].lower(),
-                extracted_text=extracted_text,
-                ocr_confidence=ocr_confidence,
-                processing_status='pending',
-                evaluation_status='draft'
-            )
-            
-            # Log the created submission object
-            logger.info("Submission object created:")
-            logger.info(f"ID: {submission.id}")
-            logger.info(f"Student ID: {submission.student_id}")
-            logger.info(f"Course ID: {submission.course_id}")
-            
-            db.add(submission)
-            db.flush()
+            # Queue database row with MinIO path (inserted in bulk below)
+            submission_rows.append({
+                'id': uuid.UUID(submission_id),
+                'student_id': final_student_id,  # Use final_student_id
+                'course_id': final_course_id,  # Use final_course_id
+                'assignment_id': assignment_id,
+                'original_file_name': processed['file_name'],
+                'file_path': processed['file_path'],  # Store MinIO path instead of temp path
+                'file_type': processed['file_name'].split('.')[-1].lower(),
+                'extracted_text': extracted_text,
+                'ocr_confidence': processed['ocr_confidence'],
+                'content_hash': processed['content_hash'],
+                'processing_status': 'queued' if processed['processing_status'] == 'queued' else 'pending',
+                'evaluation_status': 'draft'
+            })
             
-            submission_responses.append(SubmissionResponse(
-                id=submission_id,
-                file_name=submission.original_file_name,
-                file_path=submission.file_path,
-                extracted_text=extracted_text[:200] + "..." if extracted_text and len(extracted_text) > 200 else extracted_text,
-                ocr_confidence=ocr_confidence,
-                processing_status=processing_status,
-                extraction_method=extraction_method
+            submission_responses.append(_to_submission_response(
+                submission_id,
+                processed['file_name'],
+                processed['file_path'],
+                processed['text_preview'],
+                processed['ocr_confidence'],
+                processed['processing_status'],
+                processed['extraction_method']
             ))
         
-        db.commit()
+        # Single executemany INSERT for all new submissions
+        if submission_rows:
+            await db.execute(insert(DBStudentSubmission), submission_rows)
+        await db.commit()
+        invalidate_dashboard_cache()
+        
+        # Queue text extraction for deferred files now that their rows exist
+        queued = [
+            (processed, content) for processed, content in zip(processed_files, file_contents)
+            if processed['processing_status'] == 'queued'
+        ]
+        for processed, content in queued:
+            background_tasks.add_task(
+                _extract_submission_text, processed['submission_id'], processed['file_name'], content
+            )
+        if queued:
+            response.status_code = 202
+        
         logger.info(f"Successfully processed {len(files)} new submissions")
         logger.info(f"New submission IDs: {[resp.id for resp in submission_responses]}")
         return submission_responses
         
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid assignment ID format")
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error uploading submissions: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to upload submissions: {str(e)}")
 
 # Get all submissions for an assignment
 @router.get("/assignments/{assignment_id}/submissions", response_model=List[SubmissionResponse])
 async def get_assignment_submissions(
-    assignment_id: str,
-    db: Session = Depends(get_db)
+    assignment_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all submissions for a specific assignment
     """
     try:
         # Validate assignment exists
-        assignment = db.query(DBGeneratedAssignment).filter(
-            DBGeneratedAssignment.id == uuid.UUID(assignment_id)
-        ).first()
-        
-        if not assignment:
+        if not (await db.execute(_ASSIGNMENT_EXISTS, {'assignment_id': assignment_id})).scalar():
             raise HTTPException(status_code=404, detail="Assignment not found")
         
-        # Get all submissions for this assignment
-        submissions = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.assignment_id == uuid.UUID(assignment_id)
-        ).order_by(DBStudentSubmission.created_at.desc()).all()
+        # Get all submissions for this assignment; only a preview of the extracted text
+        # (plus its length) is fetched unless full-text logging is enabled
+        columns = [
+            DBStudentSubmission.id,
+            DBStudentSubmission.original_file_name,
+            DBStudentSubmission.file_path,
+            DBStudentSubmission.ocr_confidence,
+            DBStudentSubmission.processing_status,
+            func.substr(DBStudentSubmission.extracted_text, 1, TEXT_PREVIEW_CHARS).label('preview'),
+            func.length(DBStudentSubmission.extracted_text).label('text_length'),
+        ]
+        if SHOW_FULL_EXTRACTED_LOGS:
+            columns.append(DBStudentSubmission.extracted_text)
+        submissions = (await db.execute(
+            select(*columns).where(
+                DBStudentSubmission.assignment_id == assignment_id
+            ).order_by(DBStudentSubmission.created_at.desc())
+        )).all()
         
         submission_responses = []
         for submission in submissions:
+            preview = _text_preview(submission.preview, submission.text_length)
+            
             # Optionally log stored extracted text for each submission
-            try:
-                if submission.extracted_text:
-                    text_length = len(submission.extracted_text)
-                    if SHOW_FULL_EXTRACTED_LOGS:
-                        logger.info(f"[STORED TEXT - FULL] Submission: {submission.id}, Length: {text_length} chars")
-                        logger.info(f"Content:\n{submission.extracted_text}")
-                    else:
-                        preview = submission.extracted_text[:200] + "..." if text_length > 200 else submission.extracted_text
-                        logger.info(f"[STORED TEXT] Submission: {submission.id}, Length: {text_length} chars, Preview: {preview!r}")
+            if not submission.text_length:
+                logger.warning("[STORED TEXT] Submission: %s has no extracted text", submission.id)
+            elif logger.isEnabledFor(logging.INFO):
+                if SHOW_FULL_EXTRACTED_LOGS:
+                    logger.info("[STORED TEXT - FULL] Submission: %s, Length: %d chars", submission.id, submission.text_length)
+                    logger.info("Content:\n%s", submission.extracted_text)
                 else:
-                    logger.warning(f"[STORED TEXT] Submission: {submission.id} has no extracted text")
-            except Exception as e:
-                logger.exception(f"Error while logging stored extracted text for submission: {e}")
-
-            submission_responses.append(SubmissionResponse(
-                id=str(submission.id),
-                file_name=submission.original_file_name,
-                file_path=submission.file_path,
-                extracted_text=submission.extracted_text[:200] + "..." if submission.extracted_text and len(submission.extracted_text) > 200 else submission.extracted_text,
-                ocr_confidence=submission.ocr_confidence or 0.0,
-                processing_status="processed" if submission.extracted_text else "failed",
-                extraction_method="standard"  # Could be enhanced to track this in DB
+                    logger.info("[STORED TEXT] Submission: %s, Length: %d chars, Preview: %r", submission.id, submission.text_length, preview)
+
+            submission_responses.append(_to_submission_response(
+                submission.id,
+                submission.original_file_name,
+                submission.file_path,
+                preview,
+                submission.ocr_confidence,
+                "queued" if submission.processing_status == "queued"
+                else "processed" if submission.text_length else "failed"
+                # extraction_method could be enhanced to track this in DB
             ))
         
         logger.info(f"Retrieved {len(submission_responses)} submissions for assignment {assignment_id}")
         return submission_responses
         
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid assignment ID format")
     except Exception as e:
         logger.error(f"Error fetching submissions for assignment {assignment_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch submissions: {str(e)}")
@@ -878,7 +1207,7 @@ async def get_assignment_submissions(
 @router.post("/evaluate", response_model=List[EvaluationResult])
 async def evaluate_submissions_against_rubric(
     request: EvaluationRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Evaluate submissions for an assignment against the selected rubric.
@@ -886,207 +1215,271 @@ async def evaluate_submissions_against_rubric(
     If submission_ids is None/empty, all submissions for the assignment will be evaluated (backward compatibility).
     """
     try:
+        # Writes in this handler (rubric, evaluations, cache rows) are all issued as Core inserts,
+        # so the lookups below never need an autoflush check of the session first
+        db.autoflush = False
+        assignment_id = request.assignment_id
         # Validate assignment
-        assignment = db.query(DBGeneratedAssignment).filter(
-            DBGeneratedAssignment.id == uuid.UUID(request.assignment_id)
-        ).first()
+        assignment = (await db.execute(_ASSIGNMENT_BY_ID, {'assignment_id': assignment_id})).first()
         
         if not assignment:
             raise HTTPException(status_code=404, detail="Assignment not found")
 
         # Load hardcoded rubric from MySQL, materialize/ensure a local rubric row, and use it
-        mysql_dimensions = fetch_rubric(rubric_name="Situated_Learning_rubric", as_text=False)
-        if not mysql_dimensions:
-            raise HTTPException(status_code=500, detail="Hardcoded rubric not found in MySQL")
-        transformed_rubric = _transform_mysql_rubric_to_app_structure(mysql_dimensions)
+        transformed_rubric, rubric_hash = _get_transformed_rubric("Situated_Learning_rubric")
 
         # Ensure a rubric DB record exists for FK integrity and report generation
-        rubric = db.query(DBAssignmentRubric).filter(
-            DBAssignmentRubric.assignment_ids.contains([uuid.UUID(request.assignment_id)])
-        ).first()
-        if not rubric:
-            rubric = DBAssignmentRubric(
-                id=uuid.uuid4(),
-                assignment_ids=[uuid.UUID(request.assignment_id)],
-                rubric_name="Situated_Learning_rubric",
-                doc_type="Assignment",
-                criteria=transformed_rubric
-            )
-            db.add(rubric)
-            db.flush()
+        rubric, created_rubric = await _ensure_assignment_rubric(db, assignment_id)
+        
+        # Only submissions with extracted text are loaded (and only the columns evaluation reads);
+        # empty/NULL texts never leave the database
+        has_text = func.length(DBStudentSubmission.extracted_text) > 0
+        evaluable_query = select(DBStudentSubmission).options(
+            load_only(DBStudentSubmission.id, DBStudentSubmission.original_file_name, DBStudentSubmission.extracted_text)
+        ).where(
+            DBStudentSubmission.assignment_id == assignment_id,
+            has_text
+        )
+        evaluation_results = []
         
-        # Get submissions for this assignment
         if request.submission_ids:
-            # Filter to only the specified submission IDs
-            submission_uuids = [uuid.UUID(sid) for sid in request.submission_ids]
-            submissions = db.query(DBStudentSubmission).filter(
-                DBStudentSubmission.assignment_id == uuid.UUID(request.assignment_id),
-                DBStudentSubmission.id.in_(submission_uuids)
-            ).all()
+            # Check the specified submission IDs, then load only those that have text
+            requested = (await db.execute(
+                select(DBStudentSubmission.id, has_text.label('has_text')).where(
+                    DBStudentSubmission.assignment_id == assignment_id,
+                    DBStudentSubmission.id.in_(request.submission_ids)
+                )
+            )).all()
             
             # Verify all requested submissions exist
-            found_ids = {str(sub.id) for sub in submissions}
+            found_ids = {row.id for row in requested}
             missing_ids = set(request.submission_ids) - found_ids
             if missing_ids:
-                raise HTTPException(status_code=404, detail=f"Submissions not found: {', '.join(missing_ids)}")
+                raise HTTPException(status_code=404, detail=f"Submissions not found: {', '.join(map(str, missing_ids))}")
+            
+            text_ids = [row.id for row in requested if row.has_text]
+            for row in requested:
+                if not row.has_text:
+                    logger.warning(f"No extracted text for submission {row.id}, skipping evaluation")
+                    evaluation_results.append(_failed_evaluation_result(row.id, "no extracted text"))
+            evaluable = (await db.execute(
+                evaluable_query.where(DBStudentSubmission.id.in_(text_ids))
+            )).scalars().all() if text_ids else []
                 
-            logger.info(f"Evaluating {len(submissions)} specific submissions: {request.submission_ids}")
+            logger.info(f"Evaluating {len(evaluable)} of {len(requested)} specific submissions: {request.submission_ids}")
         else:
             # Get all submissions for this assignment (backward compatibility)
-            submissions = db.query(DBStudentSubmission).filter(
-                DBStudentSubmission.assignment_id == uuid.UUID(request.assignment_id)
-            ).all()
-            logger.info(f"Evaluating all {len(submissions)} submissions for assignment {request.assignment_id}")
-        
-        if not submissions:
-            if request.submission_ids:
-                raise HTTPException(status_code=400, detail="None of the specified submissions were found")
-            else:
-                raise HTTPException(status_code=400, detail="No submissions found for this assignment")
-        
-        evaluation_results = []
+            evaluable = (await db.execute(evaluable_query)).scalars().all()
+            if not evaluable:
+                has_submissions = (await db.execute(
+                    select(DBStudentSubmission.id).where(DBStudentSubmission.assignment_id == assignment_id).limit(1)
+                )).first()
+                if not has_submissions:
+                    raise HTTPException(status_code=400, detail="No submissions found for this assignment")
+            logger.info(f"Evaluating all {len(evaluable)} submissions with extracted text for assignment {request.assignment_id}")
         
         # Get assignment description for evaluation context
         assignment_description = f"{assignment.title}\n\n{assignment.description}"
         
-        # Evaluate each submission using the robust evaluation service
-        logger.info(f"Starting evaluation of {len(submissions)} submissions for assignment {request.assignment_id}")
-        for i, submission in enumerate(submissions, 1):
-            try:
-                logger.info(f"Processing submission {i}/{len(submissions)}: {submission.original_file_name} (ID: {submission.id})")
+        # Fingerprint each submission's evaluation inputs (model, rubric, assignment, text) and fetch
+        # unexpired cached LLM output in one query
+        inputs_digest = hashlib.sha256(_evaluation_model_fingerprint().encode())
+        inputs_digest.update(b"\0")
+        inputs_digest.update(rubric_hash.encode())
+        inputs_digest.update(b"\0")
+        inputs_digest.update(assignment_description.encode())
+        cache_keys = {submission.id: _evaluation_cache_key(inputs_digest, submission.extracted_text) for submission in evaluable}
+        cached_results = dict((await db.execute(
+            select(DBEvaluationCache.hash_key, DBEvaluationCache.result_json)
+            .where(
+                DBEvaluationCache.hash_key.in_(set(cache_keys.values())),
+                DBEvaluationCache.created_at > func.now() - EVALUATION_CACHE_TTL
+            )
+        )).all()) if cache_keys else {}
+        
+        async def run_evaluation(i: int, submission):
+            """Evaluate one submission in a worker thread, at most EVALUATION_CONCURRENCY at a time"""
+            cached = cached_results.get(cache_keys[submission.id])
+            if cached is not None:
+                logger.info(f"Reusing cached evaluation for submission {submission.id}")
+                return SubmissionEvaluation.from_dict({**cached, 'submission_id': str(submission.id)})
+            
+            async with semaphore:
+                # Optionally log the text that will be evaluated (preview only built when INFO is on)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Processing submission %d/%d: %s (ID: %s)", i, len(evaluable), submission.original_file_name, submission.id)
+                    text_length = len(submission.extracted_text)
+                    if SHOW_FULL_EXTRACTED_LOGS:
+                        logger.info("[EVALUATION TEXT - FULL] Submission: %s, Length: %d chars", submission.id, text_length)
+                        logger.info("Content:\n%s", submission.extracted_text)
+                    else:
+                        logger.info("[EVALUATION TEXT] Submission: %s, Length: %d chars, Preview: %r", submission.id, text_length, _text_preview(submission.extracted_text, text_length))
                 
-                # Check if submission has extracted text
-                if not submission.extracted_text:
-                    logger.warning(f"No extracted text for submission {submission.id}, skipping evaluation")
-                    continue
-                # Optionally log the text that will be evaluated
-                try:
-                    if submission.extracted_text:
-                        text_length = len(submission.extracted_text)
-                        if SHOW_FULL_EXTRACTED_LOGS:
-                            logger.info(f"[EVALUATION TEXT - FULL] Submission: {submission.id}, Length: {text_length} chars")
-                            logger.info(f"Content:\n{submission.extracted_text}")
-                        else:
-                            preview = submission.extracted_text[:200] + "..." if text_length > 200 else submission.extracted_text
-                            logger.info(f"[EVALUATION TEXT] Submission: {submission.id}, Length: {text_length} chars, Preview: {preview!r}")
-                except Exception as e:
-                    logger.exception(f"Error while logging submission text before evaluation: {e}")
-
                 # Use submission processing service for evaluation
-                evaluation_result = submission_processor.evaluate_submission(
+                return await asyncio.to_thread(
+                    submission_processor.evaluate_submission,
                     submission_text=submission.extracted_text,
                     assignment_description=assignment_description,
                     rubric=transformed_rubric,
                     submission_id=str(submission.id)
                 )
-                
-                # Prepare evaluation metadata
-                evaluation_metadata = {
-                    "plagiarism_score": None,  # TODO: Implement plagiarism detection
-                    "ai_detection_score": None,  # TODO: Implement AI detection
-                    "evaluation_engine": "llm_based_enhanced",
-                    "processing_time": float(evaluation_result.processing_time),
-                    "total_raw_score": evaluation_result.evaluation_metadata.get('total_raw_score', 0),
-                    "total_possible_score": evaluation_result.evaluation_metadata.get('total_possible_score', 0),
-                    "normalization_factor": evaluation_result.evaluation_metadata.get('normalization_factor', 0),
-                    "criteria_count": evaluation_result.evaluation_metadata.get('criteria_count', 0)
-                }
-                
-                # Prepare criterion scores for database storage
-                criterion_scores = {}
-                for criterion_eval in evaluation_result.criterion_evaluations:
-                    criterion_scores[criterion_eval.category] = {
-                        "score": float(criterion_eval.score),
-                        "max_score": float(criterion_eval.max_score),
-                        "percentage": float(criterion_eval.percentage),
-                        "feedback": criterion_eval.feedback,
-                        "question_details": [
-                            {
-                                "question": q.question,
-                                "score": q.score,
-                                "reasoning": q.reasoning
-                            }
-                            for q in criterion_eval.question_results
-                        ]
-                    }
-                
-                # Create database evaluation record
-                evaluation = DBEvaluationResult(
-                    id=uuid.uuid4(),
-                    submission_id=submission.id,
-                    assignment_id=uuid.UUID(request.assignment_id),
-                    rubric_id=rubric.id,
-                    overall_score=float(evaluation_result.overall_score),  # Out of 20
-                    criterion_scores=criterion_scores,
-                    ai_feedback=evaluation_result.overall_feedback,
-                    evaluation_metadata=evaluation_metadata,
-                    flags=[]
-                )
-                
-                db.add(evaluation)
-                db.flush()
-                
-                # Prepare response with criterion results
-                criterion_results = []
-                for criterion_eval in evaluation_result.criterion_evaluations:
-                    criterion_results.append(CriterionResult(
-                        category=criterion_eval.category,
-                        score=criterion_eval.score,
-                        max_score=criterion_eval.max_score,
-                        percentage=criterion_eval.percentage,
-                        feedback=criterion_eval.feedback
-                    ))
-                
-                evaluation_results.append(EvaluationResult(
-                    submission_id=str(submission.id),
-                    overall_score=float(evaluation_result.overall_score),  # Out of 20
-                    criterion_results=criterion_results,
-                    overall_feedback=evaluation_result.overall_feedback,
-                    plagiarism_score=evaluation_metadata.get("plagiarism_score"),
-                    ai_detection_score=evaluation_metadata.get("ai_detection_score"),
-                    flags=[],
-                    faculty_reviewed=False
-                ))
-                
-                logger.info(f"Successfully evaluated submission {submission.id}: {evaluation_result.overall_score}/20 ({(evaluation_result.overall_score/20)*100:.1f}%)")
-                
+        
+        # Evaluate submissions concurrently (the LLM calls are network-bound), then record
+        # the outcomes in submission order on this session
+        logger.info(f"Starting evaluation of {len(evaluable)} submissions for assignment {request.assignment_id} (concurrency {EVALUATION_CONCURRENCY})")
+        semaphore = asyncio.Semaphore(EVALUATION_CONCURRENCY)
+        outcomes = await asyncio.gather(
+            *(run_evaluation(i, submission) for i, submission in enumerate(evaluable, 1)),
+            return_exceptions=True
+        )
+        
+        # Build all rows and responses from the outcomes (no DB access), in submission order
+        evaluation_rows = []
+        cache_rows = {}
+        for submission, evaluation_result in zip(evaluable, outcomes):
+            try:
+                if isinstance(evaluation_result, BaseException):
+                    raise evaluation_result
+                evaluation_row, response = _evaluation_records(submission.id, assignment_id, rubric.id, evaluation_result)
             except Exception as e:
                 logger.error(f"Error evaluating submission {submission.id}: {str(e)}")
-                # Create a failed evaluation record
-                evaluation_results.append(EvaluationResult(
-                    submission_id=str(submission.id),
-                    overall_score=0.0,
-                    criterion_results=[],
-                    overall_feedback=f"Evaluation failed: {str(e)}",
-                    plagiarism_score=None,
-                    ai_detection_score=None,
-                    flags=["evaluation_failed"],
-                    faculty_reviewed=False
-                ))
-        
-        db.commit()
+                evaluation_results.append(_failed_evaluation_result(submission.id, str(e)))
+                continue
+            
+            evaluation_rows.append(evaluation_row)
+            evaluation_results.append(response)
+            cache_key = cache_keys[submission.id]
+            # Only clean results are cached: a question that fell back to the failure score (rate
+            # limit, timeout) must be retried next time, not replayed as a zero
+            if cache_key not in cached_results and not evaluation_result.has_failed_questions():
+                cache_rows[cache_key] = {'hash_key': cache_key, 'result_json': evaluation_result.to_dict()}
+            logger.info(f"Successfully evaluated submission {submission.id}: {evaluation_result.overall_score}/20 ({(evaluation_result.overall_score/20)*100:.1f}%)")
+        
+        # Single executemany INSERT for all successful evaluations
+        if evaluation_rows:
+            await db.execute(insert(DBEvaluationResult), evaluation_rows)
+        if cache_rows:
+            # Upsert so an expired row for the same inputs is replaced with the fresh result
+            cache_insert = pg_insert(DBEvaluationCache)
+            await db.execute(
+                cache_insert.on_conflict_do_update(
+                    index_elements=['hash_key'],
+                    set_={'result_json': cache_insert.excluded.result_json, 'created_at': func.now()}
+                ),
+                list(cache_rows.values())
+            )
+        await db.commit()
+        if created_rubric:
+            _listing_cache.clear()
         return evaluation_results
         
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid ID format")
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error evaluating submissions: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to evaluate submissions: {str(e)}")
 
+def _evaluation_model_fingerprint() -> str:
+    """Provider, endpoint and model behind evaluations; part of the cache key so a model change
+    does not serve results produced by the previous one"""
+    return f"{llm_config.get_config_info()['provider']}|{llm_config.text_model_url}|{llm_config.text_model_name}"
+
+def _evaluation_cache_key(inputs_digest, submission_text: str) -> str:
+    """Evaluation cache key: the shared rubric/assignment digest extended with one submission's text"""
+    digest = inputs_digest.copy()
+    digest.update(b"\0")
+    digest.update(submission_text.encode())
+    return digest.hexdigest()
+
+def _failed_evaluation_result(submission_id, reason: str) -> EvaluationResult:
+    """Response entry for a submission whose evaluation could not be produced"""
+    return EvaluationResult(
+        submission_id=str(submission_id),
+        overall_score=0.0,
+        criterion_results=[],
+        overall_feedback=f"Evaluation failed: {reason}",
+        plagiarism_score=None,
+        ai_detection_score=None,
+        flags=["evaluation_failed"],
+        faculty_reviewed=False
+    )
+
+def _evaluation_records(submission_id, assignment_id, rubric_id, evaluation_result: SubmissionEvaluation):
+    """The evaluation_results row and the API response for one successful evaluation"""
+    metadata = evaluation_result.evaluation_metadata
+    evaluation_metadata = {
+        "plagiarism_score": None,  # TODO: Implement plagiarism detection
+        "ai_detection_score": None,  # TODO: Implement AI detection
+        "evaluation_engine": "llm_based_enhanced",
+        "processing_time": float(evaluation_result.processing_time),
+        "total_raw_score": metadata.get('total_raw_score', 0),
+        "total_possible_score": metadata.get('total_possible_score', 0),
+        "normalization_factor": metadata.get('normalization_factor', 0),
+        "criteria_count": metadata.get('criteria_count', 0)
+    }
+    criteria = evaluation_result.criterion_evaluations
+    
+    # Criterion scores for database storage
+    criterion_scores = {
+        criterion_eval.category: {
+            "score": float(criterion_eval.score),
+            "max_score": float(criterion_eval.max_score),
+            "percentage": float(criterion_eval.percentage),
+            "feedback": criterion_eval.feedback,
+            "question_details": [
+                {"question": q.question, "score": q.score, "reasoning": q.reasoning}
+                for q in criterion_eval.question_results
+            ]
+        }
+        for criterion_eval in criteria
+    }
+    overall_score = float(evaluation_result.overall_score)  # Out of 20
+    evaluation_row = {
+        'id': uuid.uuid4(),
+        'submission_id': submission_id,
+        'assignment_id': assignment_id,
+        'rubric_id': rubric_id,
+        'overall_score': overall_score,
+        'criterion_scores': criterion_scores,
+        'ai_feedback': evaluation_result.overall_feedback,
+        'evaluation_metadata': evaluation_metadata,
+        'flags': []
+    }
+    response = EvaluationResult(
+        submission_id=str(submission_id),
+        overall_score=overall_score,
+        criterion_results=[
+            CriterionResult(
+                category=criterion_eval.category,
+                score=criterion_eval.score,
+                max_score=criterion_eval.max_score,
+                percentage=criterion_eval.percentage,
+                feedback=criterion_eval.feedback
+            )
+            for criterion_eval in criteria
+        ],
+        overall_feedback=evaluation_result.overall_feedback,
+        plagiarism_score=None,
+        ai_detection_score=None,
+        flags=[],
+        faculty_reviewed=False
+    )
+    return evaluation_row, response
+
 # Step 6: Faculty Review API
 @router.put("/submissions/{submission_id}/review")
 async def faculty_review_submission(
-    submission_id: str,
+    submission_id: uuid.UUID,
     request: FacultyReviewRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Faculty review and adjustment of AI evaluation"""
     try:
         # Find the evaluation result
-        evaluation = db.query(DBEvaluationResult).filter(
-            DBEvaluationResult.submission_id == uuid.UUID(submission_id)
-        ).first()
+        evaluation = (await db.execute(
+            select(DBEvaluationResult).where(
+                DBEvaluationResult.submission_id == submission_id
+            ).limit(1)
+        )).scalar_one_or_none()
         
         if not evaluation:
             raise HTTPException(status_code=404, detail="Evaluation not found")
@@ -1109,7 +1502,7 @@ async def faculty_review_submission(
         # Log the adjustment reason
         logger.info(f"Faculty adjusted evaluation for submission {submission_id}: {request.reason_for_adjustment}")
         
-        db.commit()
+        await db.commit()
         
         return {
             "submission_id": submission_id,
@@ -1118,124 +1511,287 @@ async def faculty_review_submission(
             "message": "Faculty review completed successfully"
         }
         
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid submission ID format")
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error in faculty review: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to save faculty review: {str(e)}")
 
 # Step 7: Report Generation API
+async def _load_report_context(db: AsyncSession, assignment_uuid: uuid.UUID):
+    """Get assignment, course and rubric in a single joined round trip"""
+    row = (await db.execute(
+        select(DBGeneratedAssignment, DBCourse, DBAssignmentRubric)
+        .outerjoin(DBCourse, DBCourse.id == DBGeneratedAssignment.course_id)
+        .outerjoin(
+            DBAssignmentRubric,
+            DBAssignmentRubric.matches_assignment(DBGeneratedAssignment.id)
+        )
+        .where(DBGeneratedAssignment.id == assignment_uuid)
+        .limit(1)
+    )).first()
+    
+    if not row:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+    return row
+
+async def _build_report_payload(db: AsyncSession, assignment, course, rubric) -> Dict[str, Any]:
+    """Assemble the structured report data: {assignment, results, rubric}"""
+    if not rubric:
+        raise HTTPException(status_code=404, detail="No rubric found for this assignment")
+    
+    # Prepare assignment data
+    assignment_data = {
+        'assignment_name': assignment.assignment_name,
+        'title': assignment.title,
+        'description': assignment.description,
+        'course_title': course.title if course else 'Unknown Course',
+        'academic_year': course.academic_year if course else 'N/A',
+        'semester': course.semester if course else 'N/A'
+    }
+    
+    # Stream evaluation results (with their submissions) in pages of REPORT_RESULTS_PAGE_SIZE
+    # so only one page of ORM objects is alive at a time
+    evaluation_results_stream = await db.stream_scalars(
+        select(DBEvaluationResult)
+        .options(
+            load_only(
+                DBEvaluationResult.submission_id,
+                DBEvaluationResult.overall_score,
+                DBEvaluationResult.ai_feedback,
+                DBEvaluationResult.faculty_reviewed,
+                DBEvaluationResult.faculty_feedback,
+                DBEvaluationResult.faculty_score_adjustment,
+                DBEvaluationResult.faculty_reason,
+                DBEvaluationResult.criterion_scores,
+            ),
+            selectinload(DBEvaluationResult.submission).load_only(
+                DBStudentSubmission.id, DBStudentSubmission.original_file_name
+            ),
+        )
+        .where(DBEvaluationResult.assignment_id == assignment.id)
+        .execution_options(yield_per=REPORT_RESULTS_PAGE_SIZE)
+    )
+    
+    # Prepare evaluation results data
+    evaluation_results = []
+    async for eval_result in evaluation_results_stream:
+        submission = eval_result.submission
+        
+        result_data = {
+            'submission_id': str(eval_result.submission_id),
+            'file_name': submission.original_file_name if submission else 'Unknown',
+            'overall_score': eval_result.overall_score,
+            'overall_feedback': eval_result.ai_feedback,
+            'faculty_reviewed': eval_result.faculty_reviewed,
+            'faculty_feedback': eval_result.faculty_feedback,
+            'faculty_adjustments': {
+                'score_adjustment': eval_result.faculty_score_adjustment,
+                'reason': eval_result.faculty_reason
+            } if eval_result.faculty_score_adjustment or eval_result.faculty_reason else None,
+            # Process criterion results
+            'criterion_results': [
+                dict(zip(_CRITERION_RESULT_KEYS, (
+                    category, *_criterion_fields({**_CRITERION_DEFAULTS, **details})
+                )))
+                for category, details in (eval_result.criterion_scores or {}).items()
+            ]
+        }
+        
+        evaluation_results.append(result_data)
+    
+    if not evaluation_results:
+        raise HTTPException(status_code=404, detail="No evaluation results found for this assignment")
+    
+    # Prepare rubric data
+    rubric_data = {
+        'rubric_name': rubric.rubric_name,
+        'doc_type': rubric.doc_type,
+        'rubrics': rubric.rubrics_list or []
+    }
+    
+    return {'assignment': assignment_data, 'results': evaluation_results, 'rubric': rubric_data}
+
+async def _render_report_pdf(app, payload: Dict[str, Any]) -> bytes:
+    """Render PDF off the event loop (process pool when the server provides one)"""
+    from services.report_generator import render_evaluation_report
+    
+    pdf_pool = getattr(app.state, "pdf_pool", None)
+    return await asyncio.get_running_loop().run_in_executor(
+        pdf_pool, render_evaluation_report,
+        payload['assignment'], payload['results'], payload['rubric']
+    )
+
 @router.get("/assignments/{assignment_id}/report")
-async def generate_evaluation_report(assignment_id: str, db: Session = Depends(get_db)):
+async def generate_evaluation_report(
+    assignment_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
     """Generate downloadable evaluation report for all submissions of an assignment"""
     try:
-        # Import report generator
-        from services.report_generator import EvaluationReportGenerator
+        assignment, course, rubric = await _load_report_context(db, assignment_id)
         
-        # Get assignment details
-        assignment = db.query(DBGeneratedAssignment).filter(
-            DBGeneratedAssignment.id == uuid.UUID(assignment_id)
-        ).first()
+        filename = f"evaluation_report_{assignment.assignment_name}_{time.strftime('%Y%m%d_%H%M%S')}.pdf"
         
-        if not assignment:
-            raise HTTPException(status_code=404, detail="Assignment not found")
-        
-        # Get course details
-        course = db.query(DBCourse).filter(DBCourse.id == assignment.course_id).first()
-        
-        # Get all evaluation results for this assignment
-        evaluation_results_db = db.query(DBEvaluationResult).filter(
-            DBEvaluationResult.assignment_id == uuid.UUID(assignment_id)
-        ).all()
-        
-        if not evaluation_results_db:
-            raise HTTPException(status_code=404, detail="No evaluation results found for this assignment")
-        
-        # Get rubric details
-        rubric = db.query(DBAssignmentRubric).filter(
-            DBAssignmentRubric.assignment_ids.contains([uuid.UUID(assignment_id)])
-        ).first()
-        
-        if not rubric:
-            raise HTTPException(status_code=404, detail="No rubric found for this assignment")
+        # Serve from cache / 304 when nothing feeding the report has changed
+        digest = await _report_digest(db, assignment, rubric)
+        cache_headers = _report_cache_headers(digest)
+        if _etag_matches(request, cache_headers["ETag"]):
+            return Response(status_code=304, headers=cache_headers)
         
-        # Prepare assignment data
-        assignment_data = {
-            'assignment_name': assignment.assignment_name,
-            'title': assignment.title,
-            'description': assignment.description,
-            'course_title': course.title if course else 'Unknown Course',
-            'academic_year': course.academic_year if course else 'N/A',
-            'semester': course.semester if course else 'N/A'
-        }
-        
-        # Prepare evaluation results data
-        evaluation_results = []
-        for eval_result in evaluation_results_db:
-            # Get submission details
-            submission = db.query(DBStudentSubmission).filter(
-                DBStudentSubmission.id == eval_result.submission_id
-            ).first()
-            
-            result_data = {
-                'submission_id': str(eval_result.submission_id),
-                'file_name': submission.original_file_name if submission else 'Unknown',
-                'overall_score': eval_result.overall_score,
-                'overall_feedback': eval_result.ai_feedback,
-                'faculty_reviewed': eval_result.faculty_reviewed,
-                'faculty_feedback': eval_result.faculty_feedback,
-                'faculty_adjustments': {
-                    'score_adjustment': eval_result.faculty_score_adjustment,
-                    'reason': eval_result.faculty_reason
-                } if eval_result.faculty_score_adjustment or eval_result.faculty_reason else None,
-                'criterion_results': []
-            }
+        pdf_content = _report_cache.get(digest)
+        if pdf_content is None:
+            payload = await _build_report_payload(db, assignment, course, rubric)
             
-            # Process criterion results
-            if eval_result.criterion_scores:
-                for category, details in eval_result.criterion_scores.items():
-                    criterion_data = {
-                        'category': category,
-                        'score': details.get('score', 0),
-                        'max_score': details.get('max_score', 0),
-                        'percentage': details.get('percentage', 0),
-                        'feedback': details.get('feedback', '')
-                    }
-                    result_data['criterion_results'].append(criterion_data)
+            # Return the connection to the pool before the (slow) render
+            await db.close()
             
-            evaluation_results.append(result_data)
-        
-        # Prepare rubric data
-        rubric_data = {
-            'rubric_name': rubric.rubric_name,
-            'doc_type': rubric.doc_type,
-            'rubrics': rubric.criteria.get('rubrics', []) if isinstance(rubric.criteria, dict) else []
-        }
+            pdf_content = await _render_report_pdf(request.app, payload)
+            if len(pdf_content) <= REPORT_CACHE_MAX_BYTES:
+                _report_cache.set(digest, pdf_content)
         
-        # Generate PDF report
-        report_generator = EvaluationReportGenerator()
-        pdf_content = report_generator.generate_evaluation_report(
-            assignment_data, evaluation_results, rubric_data
-        )
-        
-        # Return PDF as response
-        from fastapi.responses import Response
-        
-        filename = f"evaluation_report_{assignment.assignment_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        
-        return Response(
-            content=pdf_content,
+        # Stream PDF to the client in fixed-size chunks
+        return StreamingResponse(
+            _iter_report_chunks(io.BytesIO(pdf_content)),
             media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+            headers={"Content-Disposition": f"attachment; filename={filename}", **cache_headers}
         )
         
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid assignment ID format")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating report: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to generate report: {str(e)}")
 
+@router.get("/assignments/{assignment_id}/report/data")
+async def get_evaluation_report_data(
+    assignment_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Structured report data (assignment, results, rubric) for client-side rendering"""
+    try:
+        assignment, course, rubric = await _load_report_context(db, assignment_id)
+        
+        digest = await _report_digest(db, assignment, rubric)
+        cache_headers = _report_cache_headers(digest)
+        if _etag_matches(request, cache_headers["ETag"]):
+            return Response(status_code=304, headers=cache_headers)
+        
+        payload = await _build_report_payload(db, assignment, course, rubric)
+        return ORJSONResponse(content=payload, headers=cache_headers)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error loading report data: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to load report data: {str(e)}")
+
+@router.post("/assignments/{assignment_id}/report/pdf", status_code=202)
+async def request_evaluation_report_pdf(
+    assignment_id: uuid.UUID,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Queue PDF rendering in the background; poll the returned job id for a download URL"""
+    try:
+        assignment, course, rubric = await _load_report_context(db, assignment_id)
+        digest = await _report_digest(db, assignment, rubric)
+        payload = await _build_report_payload(db, assignment, course, rubric)
+        await db.close()
+        
+        job_id = str(uuid.uuid4())
+        object_name = f"reports/{assignment_id}/{digest}.pdf"
+        _report_jobs.set(job_id, {
+            'job_id': job_id,
+            'assignment_id': assignment_id,
+            'status': 'queued',
+            'object_name': object_name
+        })
+        background_tasks.add_task(_run_report_job, request.app, job_id, payload, object_name)
+        
+        return {'job_id': job_id, 'status': 'queued'}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error queueing report: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to queue report: {str(e)}")
+
+@router.get("/assignments/{assignment_id}/report/pdf/{job_id}")
+async def get_evaluation_report_job(assignment_id: uuid.UUID, job_id: str):
+    """Status of a background report job, with a presigned download URL once completed"""
+    job = _report_jobs.get(job_id)
+    if not job or job['assignment_id'] != assignment_id:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    
+    response = {key: job[key] for key in ('job_id', 'status') if key in job}
+    if job['status'] == 'completed':
+        response['download_url'] = await asyncio.to_thread(
+            minio_client.get_presigned_url, job['object_name'], REPORT_URL_EXPIRY_SECONDS
+        )
+        response['expires_in'] = REPORT_URL_EXPIRY_SECONDS
+    elif job['status'] == 'failed':
+        response['error'] = job.get('error')
+    return response
+
+async def _run_report_job(app, job_id: str, payload: Dict[str, Any], object_name: str):
+    """Background task: render the report and store it in MinIO"""
+    job = _report_jobs.get(job_id)
+    if job is None:
+        return
+    job['status'] = 'running'
+    try:
+        pdf_content = await _render_report_pdf(app, payload)
+        await asyncio.to_thread(
+            minio_client.upload_file_object,
+            io.BytesIO(pdf_content), object_name, len(pdf_content), "application/pdf"
+        )
+        job['status'] = 'completed'
+        logger.info(f"Report job {job_id} stored at {object_name}")
+    except Exception as e:
+        logger.error(f"Report job {job_id} failed: {str(e)}")
+        job['status'] = 'failed'
+        job['error'] = str(e)
+
+async def _report_digest(db: AsyncSession, assignment, rubric) -> str:
+    """Fingerprint everything the report is built from (results via one aggregate query)"""
+    row = (await db.execute(
+        select(func.count(DBEvaluationResult.id), func.max(DBEvaluationResult.updated_at))
+        .where(DBEvaluationResult.assignment_id == assignment.id)
+    )).one()
+    rubric_version = (rubric.id, rubric.updated_at) if rubric else (None, None)
+    fingerprint = "|".join(
+        str(part) for part in (assignment.id, assignment.updated_at, *rubric_version, *row)
+    )
+    return hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+
+def _report_cache_headers(digest: str) -> Dict[str, str]:
+    """Validator headers for report responses; weak because re-rendered PDFs are not byte-identical"""
+    return {"ETag": f'W/"{digest}"', "Cache-Control": "private, max-age=60"}
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of an ETag against the request's If-None-Match list"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+async def _iter_report_chunks(report_file):
+    """Yield a generated report in REPORT_CHUNK_SIZE pieces, closing the buffer when done"""
+    try:
+        while True:
+            chunk = report_file.read(REPORT_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        report_file.close()
+
 # Generate Rubric for Assignment (Step 3 - when no rubric exists)
 """
 Rubric generation in evaluation flow is disabled; the system uses a hardcoded rubric
@@ -1248,60 +1804,67 @@ class RubricEditRequestEval(BaseModel):
     reason_for_edit: str
     name_only_change: bool = False
 
-@router.put("/rubric/{rubric_id}/edit")
+@router.put("/rubric/{rubric_id}/edit", response_class=ORJSONResponse)
 async def edit_rubric_in_evaluation(
-    rubric_id: str,
+    rubric_id: uuid.UUID,
     request: RubricEditRequestEval,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Edit a rubric in the evaluation flow (reuses generation page logic)"""
     try:
-        rubric = db.query(DBAssignmentRubric).filter(
-            DBAssignmentRubric.id == uuid.UUID(rubric_id)
-        ).first()
-        
-        if not rubric:
-            raise HTTPException(status_code=404, detail="Rubric not found")
-        
-        # Update rubric
-        rubric.rubric_name = request.criteria.get('rubric_name', rubric.rubric_name)
-        rubric.doc_type = request.criteria.get('doc_type', rubric.doc_type)
-        rubric.criteria = request.criteria
+        # Update rubric in a single UPDATE ... RETURNING round trip
+        values = {
+            'criteria': request.criteria,
+            'rubrics_list': DBAssignmentRubric.extract_rubrics_list(request.criteria),
+            'reason_for_edit': request.reason_for_edit,
+        }
+        if 'rubric_name' in request.criteria:
+            values['rubric_name'] = request.criteria['rubric_name']
+        if 'doc_type' in request.criteria:
+            values['doc_type'] = request.criteria['doc_type']
         
         # Only mark as edited if it's not just a name/type change
         if not request.name_only_change:
-            rubric.is_edited = True
-        rubric.reason_for_edit = request.reason_for_edit
+            values['is_edited'] = True
+        
+        row = (await db.execute(
+            update(DBAssignmentRubric)
+            .where(DBAssignmentRubric.id == rubric_id)
+            .values(**values)
+            .returning(DBAssignmentRubric.is_edited)
+        )).first()
+        
+        if row is None:
+            raise HTTPException(status_code=404, detail="Rubric not found")
         
-        db.commit()
+        await db.commit()
+        _listing_cache.clear()
         
         return {
             "message": "Rubric updated successfully",
             "rubric_id": rubric_id,
-            "is_edited": rubric.is_edited
+            "is_edited": row.is_edited
         }
         
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid rubric ID format")
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error editing rubric {rubric_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to edit rubric: {str(e)}")
 
 @router.post("/faculty/reject/{submission_id}")
 async def reject_submission(
-    submission_id: str,
+    submission_id: uuid.UUID,
     rejection: RejectionRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Faculty rejection of a student submission with feedback
     """
     try:
         # Get submission
-        submission = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.id == submission_id
-        ).first()
+        submission = (await db.execute(_SUBMISSION_BY_ID, {'submission_id': submission_id})).scalar_one_or_none()
         
         if not submission:
             raise HTTPException(status_code=404, detail="Submission not found")
@@ -1312,28 +1875,27 @@ async def reject_submission(
         submission.rejection_date = datetime.utcnow()
         
         # Save to database
-        db.commit()
+        await db.commit()
+        invalidate_dashboard_cache()
         
         return {"message": "Submission rejected successfully"}
         
     except Exception as e:
         logger.error(f"Error rejecting submission: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Error rejecting submission")
 
 @router.post("/faculty/evaluate/{submission_id}/finalize")
 async def finalize_evaluation(
-    submission_id: str,
-    db: Session = Depends(get_db)
+    submission_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Finalize an evaluation after score adjustments
     """
     try:
         # Get submission
-        submission = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.id == submission_id
-        ).first()
+        submission = (await db.execute(_SUBMISSION_BY_ID, {'submission_id': submission_id})).scalar_one_or_none()
         
         if not submission:
             raise HTTPException(status_code=404, detail="Submission not found")
@@ -1342,9 +1904,11 @@ async def finalize_evaluation(
         submission.evaluation_status = "evaluated"
         
         # Get final evaluation
-        eval_result = db.query(DBFacultyEvaluation).filter(
-            DBFacultyEvaluation.submission_id == submission_id
-        ).first()
+        eval_result = (await db.execute(
+            select(DBFacultyEvaluation).where(
+                DBFacultyEvaluation.submission_id == submission_id
+            ).limit(1)
+        )).scalar_one_or_none()
         
         if not eval_result:
             raise HTTPException(status_code=404, detail="Evaluation not found")
@@ -1354,14 +1918,15 @@ async def finalize_evaluation(
         eval_result.finalized_at = datetime.utcnow()
         
         # Save changes
-        db.commit()
+        await db.commit()
+        invalidate_dashboard_cache()
         
         return {"message": "Evaluation finalized successfully"}
     except HTTPException as e:
         raise e
     except Exception as e:
         logger.error(f"Error finalizing evaluation: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to finalize evaluation: {str(e)}")
 
 # Service Health and Status Endpoints
@@ -1,21 +1,29 @@
 """
 Faculty workflow router: manage student assignments, approvals, and evaluations
 """
+import asyncio
+import base64
+import hashlib
 import os
 import sys
 import uuid
-from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Type, AsyncGenerator
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+import orjson
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_, func, or_, text, true, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from datetime import datetime, timezone
 import json
 import time
 import logging
 logger = logging.getLogger(__name__)
 
-from database.repository import get_db
+from database.connection import get_async_db, AsyncSessionLocal, AsyncReadSessionLocal
 from database.models import (
     StudentQuestionSet as DBStudentQuestionSet, 
     EvaluationResult as DBEvaluationResult,
@@ -27,58 +35,155 @@ from database.models import (
 from services.evaluation_service import EvaluationService, SITUATED_LEARNING_RUBRIC
 from schemas.schemas import AutoEvaluateResponse, AutoEvaluateRequest
 from services.radar_service import RadarService
+from utils.cache import TTLCache
+from utils.dashboard_cache import dashboard_cache, invalidate_dashboard_cache, dashboard_reads_need_primary
 from typing import Dict, Any
 
-router = APIRouter()
+# Responses here are plain JSON data; orjson encodes them several times faster than the stdlib json
+router = APIRouter(default_response_class=ORJSONResponse)
 radar_service = RadarService()
 
+# Background auto-evaluation jobs (in-process; each worker tracks its own jobs). Besides job_id ->
+# job, a queued or running job is also indexed under _submission_job_key(submission_id) -> job_id
+_evaluation_jobs = TTLCache(maxsize=256, ttl=float(os.getenv("EVALUATION_JOB_TTL_SECONDS", "3600")))
+
+def _submission_job_key(submission_id: str) -> str:
+    """_evaluation_jobs key of the in-flight job for a submission"""
+    return f"submission:{submission_id}"
+
+# AI-detection jobs are queued and run through RADAR in batches: up to AI_DETECTION_BATCH_SIZE
+# submissions per forward pass, waiting at most AI_DETECTION_BATCH_WAIT_MS for a batch to fill
+AI_DETECTION_BATCH_SIZE = int(os.getenv("AI_DETECTION_BATCH_SIZE", "8"))
+AI_DETECTION_BATCH_WAIT_MS = float(os.getenv("AI_DETECTION_BATCH_WAIT_MS", "50"))
+_ai_detection_jobs = TTLCache(maxsize=256, ttl=float(os.getenv("AI_DETECTION_JOB_TTL_SECONDS", "3600")))
+_ai_detection_queue: Optional[asyncio.Queue] = None
+_ai_detection_worker: Optional[asyncio.Task] = None
+
+# SITUATED_LEARNING_RUBRIC in the {"rubrics": [...]} shape EvaluationService expects; built once (read-only)
+_PRECOMPUTED_RUBRIC = {"rubrics": [
+    {"category": dim["name"], "questions": list(dim["criteria_output"].keys())}
+    for dim in SITUATED_LEARNING_RUBRIC["dimensions"]
+]}
+
+# GET /rubric serves a constant: encode it and derive its validator once
+_RUBRIC_BODY = orjson.dumps(SITUATED_LEARNING_RUBRIC)
+_RUBRIC_HEADERS = {
+    "ETag": f'"{hashlib.blake2b(_RUBRIC_BODY, digest_size=8).hexdigest()}"',
+    "Cache-Control": "public, max-age=3600",
+}
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware current UTC time (datetime.utcnow is naive and deprecated)"""
+    return datetime.now(timezone.utc)
+
+
+def _as_uuid(value) -> uuid.UUID:
+    """Return value as a UUID, skipping the parse when it already is one"""
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+
+
+def _json_body(model: Type[BaseModel]):
+    """Dependency that parses and validates a JSON request body in one pass: pydantic-core reads
+    the raw bytes directly, instead of json.loads building a dict that is then validated"""
+    async def parse(request: Request) -> BaseModel:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            # Same 422 shape FastAPI produces for a declared body parameter
+            raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in e.errors()])
+    return parse
+
+
+def _json_body_docs(model: Type[BaseModel]) -> Dict[str, Any]:
+    """openapi_extra documenting a _json_body(model) request body"""
+    return {"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": model.model_json_schema()}},
+    }}
+
+
+def _encode_keyset_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Opaque keyset cursor: the (created_at, id) of the last row on a page"""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{row_id}".encode()).decode()
+
+def _decode_keyset_cursor(cursor: str):
+    """Inverse of _encode_keyset_cursor; 400 for anything that is not one of our cursors"""
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
 
 @router.get("/pending-submissions")
-async def get_pending_submissions(db: Session = Depends(get_db)):
-    """Get all submissions pending faculty evaluation and evaluated submissions (not finalized)"""
+async def get_pending_submissions(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get submissions pending faculty evaluation and evaluated submissions (not finalized), newest first,
+    one page at a time. When more rows follow, the X-Next-Cursor response header carries the cursor
+    for the next page.
+    """
+    # Keyset pagination on (created_at, id), as on /dashboard. skip is kept for existing callers but
+    # only means anything without a cursor
+    if cursor and skip:
+        raise HTTPException(status_code=400, detail="skip cannot be combined with cursor")
+    pending = [DBStudentSubmission.evaluation_status.in_(["pending_faculty", "evaluated"])]
+    if cursor:
+        pending.append(
+            tuple_(DBStudentSubmission.created_at, DBStudentSubmission.id) < tuple_(*_decode_keyset_cursor(cursor))
+        )
+    newest_first = (DBStudentSubmission.created_at.desc(), DBStudentSubmission.id.desc())
+    
     try:
-        submissions = (
-            db.query(DBStudentSubmission)
-            .filter(
-                DBStudentSubmission.evaluation_status.in_(["pending_faculty", "evaluated"])
+        # Only the listed columns, with the assignment's course resolved in the same query. The page
+        # is bounded by limit, so it is read in full while the session is still the handler's; one
+        # extra row tells whether another page follows, and the cursor comes from the rows returned
+        rows = (await db.execute(
+            select(
+                DBStudentSubmission.id,
+                DBStudentSubmission.student_id,
+                DBStudentSubmission.assignment_id,
+                DBStudentSubmission.created_at,
+                DBStudentSubmission.evaluation_status,
+                DBCourse.title.label("course_title"),
+                DBGeneratedAssignment.course_name.label("assignment_course_name")
             )
-            .order_by(DBStudentSubmission.created_at.desc())
-            .all()
-        )
-
+            .outerjoin(DBGeneratedAssignment, DBGeneratedAssignment.id == DBStudentSubmission.assignment_id)
+            .outerjoin(DBCourse, DBCourse.id == DBGeneratedAssignment.course_id)
+            .where(*pending)
+            .order_by(*newest_first)
+            .offset(skip)
+            .limit(limit + 1)
+        )).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_keyset_cursor(rows[-1].created_at, rows[-1].id)
+        
         result = []
-        for sub in submissions:
-            # Get assignment to fetch course information
-            assignment = None
-            course_name = None
-            if sub.assignment_id:
-                assignment = db.query(DBGeneratedAssignment).filter(
-                    DBGeneratedAssignment.id == sub.assignment_id
-                ).first()
-                
-                # Get course name - prefer from Course table if course_id exists
-                if assignment:
-                    if assignment.course_id:
-                        course = db.query(DBCourse).filter(DBCourse.id == assignment.course_id).first()
-                        if course:
-                            course_name = course.title
-                    # Fallback to assignment.course_name
-                    if not course_name:
-                        course_name = assignment.course_name
-            
+        for sub in rows:
+            created_at = sub.created_at.isoformat() if sub.created_at else None
             result.append({
                 "id": str(sub.id),
                 "student_id": sub.student_id,
                 "assignment_id": str(sub.assignment_id),
-                "submission_date": sub.created_at.isoformat() if sub.created_at else None,
+                "submission_date": created_at,
                 "evaluation_status": sub.evaluation_status,
-                "course_name": course_name,
-                "created_at": sub.created_at.isoformat() if sub.created_at else None
+                # Prefer the Course table title, falling back to assignment.course_name
+                "course_name": sub.course_title or sub.assignment_course_name,
+                "created_at": created_at
             })
-
         logger.info(f"Found {len(result)} pending submissions")
-        return result
-
+        
+        return ORJSONResponse(
+            content=result,
+            headers={"X-Next-Cursor": next_cursor} if next_cursor else None
+        )
     except Exception as e:
         logger.error(f"Error fetching pending submissions: {str(e)}")
         raise HTTPException(
@@ -98,15 +203,15 @@ class CriterionScoreUpdate(BaseModel):
     new_score: float
     faculty_id: str
 
-class StudentAssignment(BaseModel):
-    approve: bool
-    remarks: Optional[str] = None
-    faculty_id: Optional[str] = None
-    rejection_reason: Optional[str] = None
-
 class StudentAssignment(BaseModel):
     id: str
     student_id: str
+    course_id: Optional[str] = None
+    course_name: str = ""
+    domain: str
+    assignment_text: str = ""
+    approval_status: str
+    evaluation_status: bool = False
 
 class SubmissionDetail(BaseModel):
     id: str
@@ -132,36 +237,36 @@ class RubricDimension(BaseModel):
 @router.get("/submissions/{submission_id}", response_model=SubmissionDetail)
 async def get_submission_details(
     submission_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get detailed view of a student submission including current evaluation if it exists
     """
     try:
         # Get submission with related assignment
-        submission = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.id == submission_id
-        ).first()
+        submission = (await db.execute(
+            select(DBStudentSubmission).where(DBStudentSubmission.id == submission_id)
+        )).scalars().first()
         
         if not submission:
             raise HTTPException(status_code=404, detail="Submission not found")
 
         # Get current evaluation if it exists
-        current_eval = db.query(DBFacultyEvaluation).filter(
-            DBFacultyEvaluation.submission_id == submission_id
-        ).first()
+        current_eval = (await db.execute(
+            select(DBFacultyEvaluation).where(DBFacultyEvaluation.submission_id == submission_id).limit(1)
+        )).scalars().first()
 
         # Get assignment details
-        assignment = db.query(DBGeneratedAssignment).filter(
-            DBGeneratedAssignment.id == submission.assignment_id
-        ).first()
+        assignment = (await db.execute(
+            select(DBGeneratedAssignment).where(DBGeneratedAssignment.id == submission.assignment_id)
+        )).scalars().first()
 
         # Get course name - prefer from Course table if course_id exists, otherwise use assignment.course_name
         course_name = None
         if assignment:
             if assignment.course_id:
                 # Fetch course from Course table to get the proper course name
-                course = db.query(DBCourse).filter(DBCourse.id == assignment.course_id).first()
+                course = await db.get(DBCourse, assignment.course_id)
                 if course:
                     course_name = course.title
             # Fallback to assignment.course_name if course_id doesn't exist or course not found
@@ -190,19 +295,23 @@ async def get_submission_details(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/rubric", response_model=Dict[str, Any])
-async def get_evaluation_rubric():
+async def get_evaluation_rubric(request: Request):
     """
-    Get the evaluation rubric structure
+    Get the evaluation rubric structure (304 when the client's copy is current)
     """
-    try:
-        return SITUATED_LEARNING_RUBRIC
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-@router.post("/submissions/{submission_id}/evaluate")
+    if_none_match = request.headers.get("if-none-match", "")
+    etag = _RUBRIC_HEADERS["ETag"]
+    if if_none_match.strip() == "*" or any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    ):
+        return Response(status_code=304, headers=_RUBRIC_HEADERS)
+    return Response(content=_RUBRIC_BODY, media_type="application/json", headers=_RUBRIC_HEADERS)
+
+@router.post("/submissions/{submission_id}/evaluate", openapi_extra=_json_body_docs(EvaluationRequest))
 async def evaluate_submission(
     submission_id: str,
-    evaluation: EvaluationRequest,
-    db: Session = Depends(get_db)
+    evaluation: EvaluationRequest = Depends(_json_body(EvaluationRequest)),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create or update faculty evaluation for a submission
@@ -218,26 +327,21 @@ async def evaluate_submission(
         
         # Convert submission_id to UUID if needed
         try:
-            submission_uuid = uuid.UUID(submission_id)
+            submission_uuid = _as_uuid(submission_id)
         except ValueError:
             logger.error(f"Invalid UUID format for submission_id: {submission_id}")
             raise HTTPException(status_code=400, detail=f"Invalid submission ID format: {submission_id}")
         
         # Verify submission exists
-        submission = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.id == submission_uuid
-        ).first()
+        submission = (await db.execute(
+            select(DBStudentSubmission).where(DBStudentSubmission.id == submission_uuid)
+        )).scalar_one_or_none()
         
         logger.info(f"Submission query result: {submission}")
         if not submission:
             logger.error(f"Submission not found: {submission_uuid}")
             raise HTTPException(status_code=404, detail=f"Submission not found: {submission_uuid}")
 
-        # Check if evaluation already exists
-        existing_eval = db.query(DBFacultyEvaluation).filter(
-            DBFacultyEvaluation.submission_id == submission_id
-        ).first()
-
         # If criteria_scores are flat keys like "Dimension > Criterion", transform into nested structure
         criteria = evaluation.criteria_scores or {}
         nested = {}
@@ -279,30 +383,26 @@ async def evaluate_submission(
             faculty_id = "f20220162"  # TODO: Replace with actual faculty ID from auth
             logger.warning(f"No faculty_id provided, using default: {faculty_id}")
 
-        if existing_eval:
-            # Update existing evaluation
-            existing_eval.rubric_scores = rubric_scores_list
-            existing_eval.comments = evaluation.feedback
-            existing_eval.faculty_id = faculty_id  # Make sure this is set
-            existing_eval.evaluation_date = datetime.utcnow()
-            logger.info(f"Updated existing evaluation with faculty_id: {faculty_id}")
-        else:
-            # Create new evaluation - THIS WAS MISSING faculty_id!
-            new_eval = DBFacultyEvaluation(
-                id=str(uuid.uuid4()),
-                submission_id=submission_id,
-                faculty_id=faculty_id,  # 🔥 THIS WAS THE MISSING LINE!
-                rubric_scores=rubric_scores_list,
-                comments=evaluation.feedback,
-                evaluation_date=datetime.utcnow()
-            )
-            db.add(new_eval)
-            logger.info(f"Created new evaluation with faculty_id: {faculty_id}")
+        # Create or update the evaluation in one statement; the unique submission_id makes
+        # concurrent saves for the same submission update one row instead of inserting duplicates
+        values = {
+            "faculty_id": faculty_id,
+            "rubric_scores": rubric_scores_list,
+            "comments": evaluation.feedback,
+            "evaluation_date": _utcnow(),
+        }
+        await db.execute(
+            pg_insert(DBFacultyEvaluation)
+            .values(id=uuid.uuid4(), submission_id=submission_uuid, **values)
+            .on_conflict_do_update(index_elements=[DBFacultyEvaluation.submission_id], set_=values)
+        )
+        logger.info(f"Saved evaluation with faculty_id: {faculty_id}")
 
         # Update submission status and score
         submission.evaluation_status = "evaluated"
         submission.evaluation_score = total_score
-        db.commit()
+        await db.commit()
+        invalidate_dashboard_cache()
 
         logger.info(f"✅ Evaluation saved successfully for submission {submission_id}")
         logger.info(f"→ faculty_id: {faculty_id}")
@@ -311,7 +411,7 @@ async def evaluate_submission(
         return {"message": "Evaluation saved successfully", "total_score": total_score}
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"❌ Error in evaluate_submission: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -329,6 +429,17 @@ class QuestionSetItem(BaseModel):
     selected_question: Optional[str] = None
     approval_status: str
 
+# Columns QuestionSetItem is built from (list endpoints fetch only these)
+_QUESTION_SET_ITEM_COLUMNS = (
+    DBStudentQuestionSet.id,
+    DBStudentQuestionSet.student_id,
+    DBStudentQuestionSet.domain,
+    DBStudentQuestionSet.service_category,
+    DBStudentQuestionSet.department,
+    DBStudentQuestionSet.selected_question,
+    DBStudentQuestionSet.approval_status,
+)
+
 class QuestionSetDetail(BaseModel):
     """Detailed question set information with assignment details"""
     id: str
@@ -348,64 +459,85 @@ class QuestionSetDetail(BaseModel):
 class EvaluationScores(BaseModel):
     scores: Dict[str, float]
 
+# Prebuilt serializers for the list responses, built once instead of per request
+_COURSE_INFO_LIST = TypeAdapter(List[CourseInfo])
+_STUDENT_ASSIGNMENT_LIST = TypeAdapter(List[StudentAssignment])
+_QUESTION_SET_ITEM_LIST = TypeAdapter(List[QuestionSetItem])
+
+def _list_response(adapter: TypeAdapter, items: List[BaseModel]) -> Response:
+    """JSON response for already-built items, serialized straight to bytes with a prebuilt adapter"""
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
 
 # Get available courses
 @router.get("/courses", response_model=List[CourseInfo])
-async def get_courses(db: Session = Depends(get_db)):
+async def get_courses(db: AsyncSession = Depends(get_async_db)):
     """Get all available courses"""
     try:
-        courses = db.query(DBCourse).all()
-        return [
-            CourseInfo(
+        courses = (await db.execute(select(DBCourse.id, DBCourse.course_code, DBCourse.title))).all()
+        # Rows come straight from our own tables, so per-row validation is skipped (model_construct)
+        # and the list is serialized directly rather than through response_model
+        return _list_response(_COURSE_INFO_LIST, [
+            CourseInfo.model_construct(
                 id=str(course.id),
                 course_code=course.course_code,
                 title=course.title
             )
             for course in courses
-        ]
+        ])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Get students by course
 @router.get("/students", response_model=List[StudentAssignment])
-async def get_students_by_course(course_id: Optional[str] = None, db: Session = Depends(get_db)):
+async def get_students_by_course(course_id: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
     """Get all student assignments, optionally filtered by course"""
     try:
-        query = db.query(DBStudentQuestionSet)
+        query = select(DBStudentQuestionSet).options(selectinload(DBStudentQuestionSet.course))
         if course_id:
-            query = query.filter(DBStudentQuestionSet.course_id == uuid.UUID(course_id))
+            query = query.where(DBStudentQuestionSet.course_id == _as_uuid(course_id))
         
-        assignments = query.all()
+        assignments = (await db.execute(query)).scalars().all()
         
-        return [
-            StudentAssignment(
+        # One query for which of these have an evaluation, instead of one per assignment
+        evaluated_ids = set((await db.execute(
+            select(DBEvaluationResult.submission_id).where(
+                DBEvaluationResult.submission_id.in_([assignment.id for assignment in assignments])
+            ).distinct()
+        )).scalars()) if assignments else set()
+        
+        # Trusted DB rows: build without validation (see get_courses)
+        return _list_response(_STUDENT_ASSIGNMENT_LIST, [
+            StudentAssignment.model_construct(
                 id=str(assignment.id),
                 student_id=assignment.student_id,
-                course_id=str(assignment.course_id),
+                course_id=str(assignment.course_id) if assignment.course_id else None,
                 course_name=assignment.course.title if assignment.course else "",
                 domain=assignment.domain,
                 assignment_text=assignment.selected_question or "",
                 approval_status=assignment.approval_status,
-                evaluation_status=bool(
-                    db.query(DBEvaluationResult)
-                    .filter(DBEvaluationResult.submission_id == assignment.id)
-                    .first()
-                )
+                evaluation_status=assignment.id in evaluated_ids
             )
             for assignment in assignments
-        ]
+        ])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/questions", response_model=List[QuestionSetItem])
-async def list_question_sets(status: Optional[str] = None, db: Session = Depends(get_db)):
+async def list_question_sets(
+    status: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db)
+):
     try:
-        query = db.query(DBStudentQuestionSet)
+        query = select(*_QUESTION_SET_ITEM_COLUMNS)
         if status:
-            query = query.filter(DBStudentQuestionSet.approval_status == status)
-        rows = query.order_by(DBStudentQuestionSet.created_at.desc()).limit(100).all()
-        return [
-            QuestionSetItem(
+            query = query.where(DBStudentQuestionSet.approval_status == status)
+        rows = (await db.execute(query.order_by(DBStudentQuestionSet.created_at.desc()).offset(skip).limit(limit))).all()
+        # Trusted DB rows: build without validation (see get_courses)
+        return _list_response(_QUESTION_SET_ITEM_LIST, [
+            QuestionSetItem.model_construct(
                 id=str(r.id),
                 student_id=r.student_id,
                 domain=r.domain,
@@ -414,15 +546,15 @@ async def list_question_sets(status: Optional[str] = None, db: Session = Depends
                 selected_question=r.selected_question,
                 approval_status=r.approval_status,
             ) for r in rows
-        ]
+        ])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.put("/questions/{question_set_id}/approve")
-async def approve_question(question_set_id: str, req: ApprovalRequest, db: Session = Depends(get_db)):
+async def approve_question(question_set_id: str, req: ApprovalRequest, db: AsyncSession = Depends(get_async_db)):
     try:
-        row = db.query(DBStudentQuestionSet).filter(DBStudentQuestionSet.id == uuid.UUID(question_set_id)).first()
+        row = await db.get(DBStudentQuestionSet, _as_uuid(question_set_id))
         if not row:
             raise HTTPException(status_code=404, detail="Question set not found")
         if not row.selected_question:
@@ -431,7 +563,8 @@ async def approve_question(question_set_id: str, req: ApprovalRequest, db: Sessi
         row.approval_status = 'approved' if req.approve else 'rejected'
         row.faculty_remarks = req.remarks
         row.approved_by = req.faculty_id
-        db.commit()
+        await db.commit()
+        invalidate_dashboard_cache()
         return {
             "id": str(row.id),
             "approval_status": row.approval_status,
@@ -440,7 +573,7 @@ async def approve_question(question_set_id: str, req: ApprovalRequest, db: Sessi
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -454,27 +587,28 @@ class EvaluationData(BaseModel):
     overall_score: float
 
 @router.get("/evaluation/{assignment_id}")
-async def get_evaluation_data(assignment_id: str, db: Session = Depends(get_db)):
+async def get_evaluation_data(assignment_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get evaluation data for an assignment"""
     try:
-        evaluation = db.query(DBEvaluationResult).filter(
-            DBEvaluationResult.submission_id == uuid.UUID(assignment_id)
-        ).first()
+        evaluation = (await db.execute(
+            select(DBEvaluationResult).where(DBEvaluationResult.submission_id == _as_uuid(assignment_id)).limit(1)
+        )).scalars().first()
         
         if not evaluation:
             raise HTTPException(status_code=404, detail="Evaluation not found")
         
+        # criterion_scores is keyed by rubric category (see the evaluation router), which doubles as the id
         return {
             "criteria": [
                 {
-                    "id": criterion["id"],
-                    "name": criterion["name"],
-                    "description": criterion["description"],
-                    "max_score": criterion["max_score"],
-                    "score": criterion["score"]
+                    "id": category,
+                    "name": category,
+                    "description": details.get("feedback"),
+                    "max_score": details.get("max_score"),
+                    "score": details.get("score")
                 }
-                for criterion in evaluation.criteria_scores
-            ] if evaluation.criteria_scores else [],
+                for category, details in (evaluation.criterion_scores or {}).items()
+            ],
             "overall_score": evaluation.overall_score
         }
     except HTTPException:
@@ -483,39 +617,40 @@ async def get_evaluation_data(assignment_id: str, db: Session = Depends(get_db))
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/evaluation/update/{assignment_id}")
-async def update_evaluation(assignment_id: str, scores: EvaluationScores, db: Session = Depends(get_db)):
+async def update_evaluation(assignment_id: str, scores: EvaluationScores, db: AsyncSession = Depends(get_async_db)):
     """Update evaluation scores for an assignment"""
     try:
-        evaluation = db.query(DBEvaluationResult).filter(
-            DBEvaluationResult.submission_id == uuid.UUID(assignment_id)
-        ).first()
+        evaluation = (await db.execute(
+            select(DBEvaluationResult).where(DBEvaluationResult.submission_id == _as_uuid(assignment_id)).limit(1)
+        )).scalars().first()
         
         if not evaluation:
             raise HTTPException(status_code=404, detail="Evaluation not found")
         
-        # Update individual criterion scores
-        if evaluation.criteria_scores:
-            updated_scores = evaluation.criteria_scores.copy()
-            for criterion in updated_scores:
-                if criterion["id"] in scores.scores:
-                    criterion["score"] = scores.scores[criterion["id"]]
-            evaluation.criteria_scores = updated_scores
+        # Update individual criterion scores, totalling the overall score in the same pass
+        total_score = 0
+        if evaluation.criterion_scores:
+            new_scores = scores.scores
+            updated_scores = {}
+            for category, details in evaluation.criterion_scores.items():
+                score = new_scores.get(category, details.get("score", 0))
+                updated_scores[category] = {**details, "score": score}
+                total_score += score
+            # New dict of new dicts, so the JSON column is seen as changed
+            evaluation.criterion_scores = updated_scores
         
-        # Recalculate overall score
-        evaluation.overall_score = sum(
-            criterion["score"] for criterion in evaluation.criteria_scores
-        ) if evaluation.criteria_scores else 0
+        evaluation.overall_score = total_score
         
-        db.commit()
+        await db.commit()
         return {"status": "success", "message": "Evaluation updated successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/finalize")
-async def finalize_marks(req: FinalizeMarksRequest, db: Session = Depends(get_db)):
+async def finalize_marks(req: FinalizeMarksRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Finalize the faculty evaluation of a submission.
     This marks the evaluation as complete and stores the final score.
@@ -525,21 +660,20 @@ async def finalize_marks(req: FinalizeMarksRequest, db: Session = Depends(get_db
         logger.info(f"submission_id: {req.submission_id}")
         logger.info(f"final_marks: {req.final_marks}")
         
-        submission_uuid = uuid.UUID(req.submission_id)
+        submission_uuid = _as_uuid(req.submission_id)
         
         # Get the submission
-        submission = db.query(DBStudentSubmission).filter(
-            DBStudentSubmission.id == submission_uuid
-        ).first()
+        submission = await db.get(DBStudentSubmission, submission_uuid)
         
         if not submission:
             logger.error(f"Submission not found: {submission_uuid}")
             raise HTTPException(status_code=404, detail=f"Submission not found: {submission_uuid}")
         
-        # Get the faculty evaluation (most recent one)
-        faculty_eval = db.query(DBFacultyEvaluation).filter(
-            DBFacultyEvaluation.submission_id == submission_uuid
-        ).order_by(DBFacultyEvaluation.evaluation_date.desc()).first()
+        # Get the faculty evaluation (at most one per submission: uq_faculty_eval_submission,
+        # whose unique index serves this lookup directly, with no sort)
+        faculty_eval = (await db.execute(
+            select(DBFacultyEvaluation).where(DBFacultyEvaluation.submission_id == submission_uuid)
+        )).scalar_one_or_none()
         
         if not faculty_eval:
             logger.error(f"Faculty evaluation not found for submission: {submission_uuid}")
@@ -555,7 +689,8 @@ async def finalize_marks(req: FinalizeMarksRequest, db: Session = Depends(get_db
         # Store finalization metadata on faculty evaluation
         faculty_eval.comments = req.final_feedback or faculty_eval.comments
         
-        db.commit()
+        await db.commit()
+        invalidate_dashboard_cache()
         
         logger.info(f"✅ Evaluation finalized successfully")
         logger.info(f"→ submission_id: {submission_uuid}")
@@ -574,24 +709,27 @@ async def finalize_marks(req: FinalizeMarksRequest, db: Session = Depends(get_db
         logger.error(f"Invalid UUID format: {e}")
         raise HTTPException(status_code=400, detail=f"Invalid submission ID format: {str(e)}")
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error finalizing evaluation: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/questions/student/{student_id}", response_model=List[QuestionSetItem])
-async def get_questions_by_student(student_id: str, db: Session = Depends(get_db)):
+async def get_questions_by_student(student_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get all question sets submitted by a specific student"""
     try:
-        rows = db.query(DBStudentQuestionSet).filter(
-            DBStudentQuestionSet.student_id == student_id
-        ).order_by(DBStudentQuestionSet.created_at.desc()).all()
+        rows = (await db.execute(
+            select(*_QUESTION_SET_ITEM_COLUMNS).where(
+                DBStudentQuestionSet.student_id == student_id
+            ).order_by(DBStudentQuestionSet.created_at.desc())
+        )).all()
         
         if not rows:
             return []  # Return empty list instead of raising 404
         
-        return [
-            QuestionSetItem(
+        # Trusted DB rows: build without validation (see get_courses)
+        return _list_response(_QUESTION_SET_ITEM_LIST, [
+            QuestionSetItem.model_construct(
                 id=str(r.id),
                 student_id=r.student_id,
                 domain=r.domain,
@@ -601,18 +739,16 @@ async def get_questions_by_student(student_id: str, db: Session = Depends(get_db
                 approval_status=r.approval_status
             )
             for r in rows
-        ]
+        ])
     except Exception as e:
         logger.error(f"Error fetching questions by student: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/questions/{question_set_id}", response_model=QuestionSetDetail)
-async def get_question_set_detail(question_set_id: str, db: Session = Depends(get_db)):
+async def get_question_set_detail(question_set_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get detailed information for a specific question set including assignment details"""
     try:
-        qs = db.query(DBStudentQuestionSet).filter(
-            DBStudentQuestionSet.id == uuid.UUID(question_set_id)
-        ).first()
+        qs = await db.get(DBStudentQuestionSet, _as_uuid(question_set_id))
         
         if not qs:
             raise HTTPException(status_code=404, detail="Question set not found")
@@ -620,15 +756,13 @@ async def get_question_set_detail(question_set_id: str, db: Session = Depends(ge
         # Get course name
         course_name = None
         if qs.course_id:
-            course = db.query(DBCourse).filter(DBCourse.id == qs.course_id).first()
+            course = await db.get(DBCourse, qs.course_id)
             course_name = course.title if course else None
         
         # Get assignment details using the assignment_id from this question set
         assignment_details = None
         if qs.assignment_id:
-            assignment = db.query(DBGeneratedAssignment).filter(
-                DBGeneratedAssignment.id == qs.assignment_id
-            ).first()
+            assignment = await db.get(DBGeneratedAssignment, qs.assignment_id)
             if assignment:
                 assignment_details = {
                     "id": str(assignment.id),
@@ -664,57 +798,70 @@ async def get_question_set_detail(question_set_id: str, db: Session = Depends(ge
 
 from fastapi.responses import JSONResponse
 
+# Sets one criterion inside rubric_scores in place and returns the new total. Postgres re-reads the
+# locked row before applying the update, so concurrent edits to other criteria are not lost, and only the
+# changed path is passed over the wire. Lists of {"category", "score"} items are matched by category
+# (appended when missing); legacy {category: score} dicts are keyed directly.
+_SET_CRITERION_SCORE = text("""
+    UPDATE faculty_evaluation_results AS f
+    SET rubric_scores = CASE
+        WHEN jsonb_typeof(f.rubric_scores) = 'array' THEN COALESCE(
+            (SELECT jsonb_set(f.rubric_scores, ARRAY[(item.idx - 1)::text, 'score'], to_jsonb(CAST(:score AS float8)))
+             FROM jsonb_array_elements(f.rubric_scores) WITH ORDINALITY AS item(value, idx)
+             WHERE item.value->>'category' = CAST(:criterion_id AS text)
+             ORDER BY item.idx
+             LIMIT 1),
+            f.rubric_scores || jsonb_build_array(
+                jsonb_build_object('category', CAST(:criterion_id AS text), 'score', CAST(:score AS float8))))
+        ELSE jsonb_set(f.rubric_scores, ARRAY[CAST(:criterion_id AS text)], to_jsonb(CAST(:score AS float8)))
+    END
+    WHERE f.id = (
+        SELECT id FROM faculty_evaluation_results
+        WHERE submission_id = CAST(:submission_id AS uuid)
+        LIMIT 1
+    )
+    AND jsonb_typeof(f.rubric_scores) IN ('array', 'object')
+    RETURNING CASE
+        WHEN jsonb_typeof(f.rubric_scores) = 'array' THEN
+            (SELECT COALESCE(SUM(CAST(item->>'score' AS float8)), 0)
+             FROM jsonb_array_elements(f.rubric_scores) AS item)
+        ELSE
+            (SELECT COALESCE(SUM(CAST(item.value #>> '{}' AS float8)), 0)
+             FROM jsonb_each(f.rubric_scores) AS item)
+    END AS total_score
+""")
+
+
 @router.put("/evaluate/{submission_id}/criterion/{criterion_id}")
 async def update_criterion_score(
     submission_id: str,
     criterion_id: str,
     update: CriterionScoreUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update individual criterion score for a submission (faculty manual adjustment)
     """
     try:
-        eval_result = db.query(DBFacultyEvaluation).filter(
-            DBFacultyEvaluation.submission_id == submission_id
-        ).first()
-
-        if not eval_result:
-            raise HTTPException(status_code=404, detail="Evaluation not found")
-
         # Round score
         new_score = round(update.new_score * 4) / 4
         new_score = max(1.0, min(4.0, new_score))
 
-        rubric_scores = eval_result.rubric_scores
-
-        # ✅ Case 1: Rubric is list of categories (correct structure)
-        if isinstance(rubric_scores, list):
-            for item in rubric_scores:
-                if str(item.get("category")) == str(criterion_id):
-                    item["score"] = new_score
-                    break
-            else:
-                # if not found, append it (failsafe)
-                rubric_scores.append({"category": criterion_id, "score": new_score})
-
-            # ✅ Recalculate total
-            total_score = sum(i.get("score", 0) for i in rubric_scores)
-            eval_result.rubric_scores = rubric_scores
-
-        # ✅ Case 2: Rubric is dict (legacy)
-        elif isinstance(rubric_scores, dict):
-            rubric_scores[criterion_id] = new_score
-            total_score = sum(rubric_scores.values())
-            eval_result.rubric_scores = rubric_scores
-
-        else:
+        total_score = (await db.execute(
+            _SET_CRITERION_SCORE,
+            {"submission_id": submission_id, "criterion_id": str(criterion_id), "score": new_score}
+        )).scalar_one_or_none()
+
+        if total_score is None:
+            # Nothing updated: either there is no evaluation, or its rubric_scores is neither list nor dict
+            evaluation_exists = (await db.execute(
+                select(DBFacultyEvaluation.id).where(DBFacultyEvaluation.submission_id == submission_id).limit(1)
+            )).first()
+            if not evaluation_exists:
+                raise HTTPException(status_code=404, detail="Evaluation not found")
             raise HTTPException(status_code=400, detail="Invalid rubric_scores format")
 
-        # ✅ Update DB record correctly
-        eval_result.evaluation_score = total_score
-        eval_result.last_updated = datetime.utcnow()
-        db.commit()
+        await db.commit()
 
         return {
             "criterion_id": criterion_id,
@@ -722,56 +869,305 @@ async def update_criterion_score(
             "total_score": total_score
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("Error updating criterion score")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Error updating score: {str(e)}")
 
 
 
+def _enqueue_ai_detection(job: Dict[str, Any], content: str, future: Optional[asyncio.Future]) -> None:
+    """Queue a submission for batched RADAR analysis, starting the batching worker on first use"""
+    global _ai_detection_queue, _ai_detection_worker
+    if _ai_detection_queue is None:
+        _ai_detection_queue = asyncio.Queue()
+    if _ai_detection_worker is None or _ai_detection_worker.done():
+        _ai_detection_worker = asyncio.create_task(_ai_detection_batcher(_ai_detection_queue))
+    _ai_detection_queue.put_nowait((job, content, future))
+
+async def _ai_detection_batcher(queue: asyncio.Queue):
+    """Worker: collect queued AI-detection jobs into batches and analyze each batch in one pass"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + AI_DETECTION_BATCH_WAIT_MS / 1000
+        while len(batch) < AI_DETECTION_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        await _run_ai_detection_batch(batch)
+
+async def _run_ai_detection_batch(batch: List[tuple]):
+    """Analyze a batch with RADAR, store each report on its submission and resolve the jobs"""
+    for job, _, _ in batch:
+        job['status'] = 'running'
+    try:
+        reports = await radar_service.analyze_batch([content for _, content, _ in batch])
+        async with AsyncSessionLocal() as db:
+            # Bulk UPDATE by primary key: one statement for the whole batch
+            await db.execute(update(DBStudentSubmission), [
+                {"id": _as_uuid(job['submission_id']), "ai_detection_results": report}
+                for (job, _, _), report in zip(batch, reports)
+            ])
+            await db.commit()
+    except Exception as e:
+        logger.exception(f"❌ AI detection batch of {len(batch)} submission(s) failed")
+        for job, _, future in batch:
+            job['status'] = 'failed'
+            job['error'] = str(e)
+            if future is not None and not future.done():
+                future.set_exception(e)
+        return
+
+    for (job, _, future), report in zip(batch, reports):
+        job['status'] = 'completed'
+        job['result'] = report
+        if future is not None and not future.done():
+            future.set_result(report)
+
 @router.post("/submissions/{submission_id}/detect-ai", response_model=Dict[str, Any])
-async def detect_ai_content(submission_id: str, db: Session = Depends(get_db)):
+async def detect_ai_content(
+    submission_id: str,
+    response: Response,
+    run_in_background: bool = Query(False),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
-    Analyze a submission for potential AI-generated content using RADAR
+    Analyze a submission for potential AI-generated content using RADAR.
+    The analysis is batched with other pending requests; with run_in_background the endpoint
+    answers 202 with a job handle to poll instead of waiting for the result.
     """
     try:
-        submission = db.query(DBStudentSubmission).filter(DBStudentSubmission.id == submission_id).first()
-        if not submission:
+        row = (await db.execute(
+            select(DBStudentSubmission.content).where(DBStudentSubmission.id == _as_uuid(submission_id))
+        )).first()
+        if not row:
             raise HTTPException(status_code=404, detail="Submission not found")
+        if not row.content:
+            raise HTTPException(status_code=400, detail="Submission has no content to analyze")
 
-        # Get AI detection analysis
-        analysis_results = await radar_service.analyze_submission(submission.content)
-        
-        # Update the submission with AI detection results
-        submission.ai_detection_results = analysis_results
-        db.commit()
-        
-        return analysis_results
+        # Return the connection to the pool before waiting on the model
+        await db.close()
+
+        job_id = str(uuid.uuid4())
+        job = {'job_id': job_id, 'submission_id': submission_id, 'status': 'queued'}
+        _ai_detection_jobs.set(job_id, job)
+
+        if run_in_background:
+            _enqueue_ai_detection(job, row.content, None)
+            response.status_code = 202
+            return {'job_id': job_id, 'status': 'queued', 'submission_id': submission_id}
+
+        # Get AI detection analysis (stored on the submission by the batch worker)
+        future = asyncio.get_running_loop().create_future()
+        _enqueue_ai_detection(job, row.content, future)
+        return await future
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error during AI detection: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to analyze submission for AI content")
 
-@router.post("/pending-submissions/{submission_id}/evaluate")
-async def auto_evaluate_submission(submission_id: str, request: AutoEvaluateRequest, db: Session = Depends(get_db)):
+@router.get("/submissions/{submission_id}/detect-ai/{job_id}")
+async def get_ai_detection_job(submission_id: str, job_id: str):
+    """Status of a queued AI-detection job, with the analysis report once completed"""
+    job = _ai_detection_jobs.get(job_id)
+    if not job or job['submission_id'] != submission_id:
+        raise HTTPException(status_code=404, detail="AI detection job not found")
+
+    response = {key: job[key] for key in ('job_id', 'status', 'submission_id')}
+    if job['status'] == 'completed':
+        response['result'] = job['result']
+    elif job['status'] == 'failed':
+        response['error'] = job.get('error')
+    return response
+
+async def _run_auto_evaluation(db: AsyncSession, submission, assignment, submission_id: str, faculty_id: Optional[str]) -> Dict[str, Any]:
+    """Run the LLM rubric evaluation of a submission, store it as a faculty evaluation and
+    return the auto-evaluation response payload"""
+    assignment_description = (
+        f"Title: {assignment.title}\n"
+        f"Description: {assignment.description}\n"
+        f"Requirements: {', '.join(assignment.requirements or [])}\n"
+        f"Context: {assignment.industry_context or 'No industry context provided.'}"
+    )
+
+    # Step 5: Use student's submission content
+    submission_text = submission.content or "No content submitted."
+
+    # Step 6: Prepare rubric
+    rubric = _PRECOMPUTED_RUBRIC
+
+    # Release the connection before the multi-second LLM call instead of holding it (and the open
+    # transaction of the SELECT that loaded submission and assignment) for its whole duration; the
+    # writes below run as fresh statements on a newly checked-out connection
+    await db.close()
+
+    # Step 7: Run EvaluationService
+    evaluator = EvaluationService()
+    start = time.time()
+    # The LLM call blocks, so it runs in a worker thread instead of on the event loop
+    evaluation_result = await asyncio.to_thread(
+        evaluator.evaluate_submission,
+        assignment_description=assignment_description,
+        submission_text=submission_text,
+        rubric=rubric,
+        submission_id=submission_id
+    )
+    duration = round(time.time() - start, 2)
+
+    # Log evaluation results
+    logger.info("=== Evaluation Results Processing ===")
+    logger.info(f"Raw evaluation result - overall score: {evaluation_result.overall_score}/72")
+    logger.info("Criterion evaluations:")
+    for ce in evaluation_result.criterion_evaluations:
+        logger.info(f"- {ce.category}:")
+        logger.info(f"  Score: {ce.score}/{ce.max_score}")
+        logger.info(f"  Percentage: {ce.percentage:.1f}%")
+        for qr in ce.question_results:
+            logger.info(f"  - Question: {qr.question}, Score: {qr.score}")
+
+    # Step 8: Store faculty evaluation (include question-level results so frontend can edit them)
+    rubric_scores = []
+    for ce in evaluation_result.criterion_evaluations:
+        question_results = [
+            {"question": qr.question, "score": qr.score, "feedback": qr.reasoning}
+            for qr in ce.question_results
+        ]
+        rubric_scores.append({
+            "category": ce.category,
+            "score": ce.score,
+            "max_score": ce.max_score,
+            "percentage": ce.percentage,
+            "feedback": ce.feedback,
+            "question_results": question_results,
+        })
+
+    # Create or update the evaluation in one statement, as evaluate_submission does: another
+    # request may have stored one for this submission while the LLM call was running
+    values = {
+        "faculty_id": faculty_id,
+        "rubric_scores": rubric_scores,
+        "comments": evaluation_result.overall_feedback,
+        "evaluation_date": _utcnow(),
+    }
+    await db.execute(
+        pg_insert(DBFacultyEvaluation)
+        .values(id=uuid.uuid4(), submission_id=_as_uuid(submission_id), **values)
+        .on_conflict_do_update(index_elements=[DBFacultyEvaluation.submission_id], set_=values)
+    )
+
+    # Step 9: Update submission status + score (submission is detached since the close above)
+    await db.execute(
+        update(DBStudentSubmission)
+        .where(DBStudentSubmission.id == _as_uuid(submission_id))
+        .values(evaluation_status="evaluated", evaluation_score=evaluation_result.overall_score)
+    )
+    await db.commit()
+    invalidate_dashboard_cache()
+
+    logger.info(f"✅ Auto evaluation done for submission {submission_id} | Score: {evaluation_result.overall_score}/72")
+
+    # Step 10: Build rich response with structured dimensions and criteria
+    dimensions = []
+    for ce in evaluation_result.criterion_evaluations:
+        criteria_list = []
+        # Build individual criteria with scores and feedback
+        for qr in ce.question_results:
+            criteria_list.append({
+                "name": qr.question,
+                "score": qr.score,
+                "feedback": qr.reasoning or "No specific feedback provided."
+            })
+        
+        dimensions.append({
+            "name": ce.category,
+            "dimension_score": float(ce.score),
+            "dimension_max_score": float(ce.max_score),
+            "dimension_percentage": round(ce.percentage, 2),
+            "dimension_feedback": ce.feedback,
+            "criteria": criteria_list
+        })
+
+    # Build the final response payload
+    response_payload = {
+        "submission_id": submission_id,
+        "status": "evaluated",
+        "overall_score": evaluation_result.overall_score,
+        "total_criteria": evaluation_result.total_criteria,
+        "overall_feedback": evaluation_result.overall_feedback,
+        "processing_time": evaluation_result.processing_time,
+        "llm_model": evaluation_result.evaluation_metadata.get("model_used"),
+        "duration": duration,
+        "dimensions": dimensions,
+        "evaluation_metadata": evaluation_result.evaluation_metadata
+    }
+
+    return response_payload
+
+async def _run_auto_evaluation_job(job_id: str, submission_id: str, faculty_id: Optional[str]):
+    """Background task: evaluate on a session of its own and keep the payload on the job"""
+    job = _evaluation_jobs.get(job_id)
+    if job is None:
+        _evaluation_jobs.pop(_submission_job_key(submission_id))
+        return
+    job['status'] = 'running'
+    try:
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(
+                select(DBStudentSubmission, DBGeneratedAssignment)
+                .join(DBGeneratedAssignment, DBGeneratedAssignment.id == DBStudentSubmission.assignment_id)
+                .where(DBStudentSubmission.id == submission_id)
+            )).first()
+            if not row:
+                raise ValueError("Submission or its linked assignment no longer exists")
+            job['result'] = await _run_auto_evaluation(db, row[0], row[1], submission_id, faculty_id)
+        job['status'] = 'completed'
+    except Exception as e:
+        logger.exception(f"❌ Auto evaluation job {job_id} failed")
+        job['status'] = 'failed'
+        job['error'] = str(e)
+    finally:
+        # The submission is free for a new job once this one has settled
+        if _evaluation_jobs.get(_submission_job_key(submission_id)) == job_id:
+            _evaluation_jobs.pop(_submission_job_key(submission_id))
+
+@router.post("/pending-submissions/{submission_id}/evaluate", openapi_extra=_json_body_docs(AutoEvaluateRequest))
+async def auto_evaluate_submission(
+    submission_id: str,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    request: AutoEvaluateRequest = Depends(_json_body(AutoEvaluateRequest)),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Automatically evaluate a student's submission using LLM-based rubric analysis.
     Triggered when a faculty member clicks 'Evaluate'.
-    If an evaluation already exists, returns it. Otherwise, runs a new evaluation.
+    If an evaluation already exists, returns it. Otherwise, runs a new evaluation
+    (in the background when run_in_background is set: 202 with a job id to poll).
     """
     try:
         # Log incoming request
         logger.info(f"📥 auto_evaluate_submission() called with submission_id: {submission_id}")
         logger.info(f"📤 Response model: AutoEvaluateResponse")
         
-        # Step 1: Fetch submission
-        submission = db.query(DBStudentSubmission).filter(DBStudentSubmission.id == submission_id).first()
-        if not submission:
+        # Steps 1-2: Fetch submission, any existing evaluation and the linked assignment in one query
+        row = (await db.execute(
+            select(DBStudentSubmission, DBFacultyEvaluation, DBGeneratedAssignment)
+            .outerjoin(DBFacultyEvaluation, DBFacultyEvaluation.submission_id == DBStudentSubmission.id)
+            .outerjoin(DBGeneratedAssignment, DBGeneratedAssignment.id == DBStudentSubmission.assignment_id)
+            .where(DBStudentSubmission.id == submission_id)
+            .limit(1)
+        )).first()
+        if not row:
             raise HTTPException(status_code=404, detail="Submission not found")
-
-        # Step 2: Check if evaluation already exists
-        existing_eval = db.query(DBFacultyEvaluation).filter(
-            DBFacultyEvaluation.submission_id == submission_id
-        ).first()
+        submission, existing_eval, assignment = row
         
         if existing_eval:
             logger.info(f"✅ Found existing evaluation for submission {submission_id}, returning it")
@@ -823,121 +1219,31 @@ async def auto_evaluate_submission(submission_id: str, request: AutoEvaluateRequ
                 detail=str(f"Submission not ready for evaluation (current status: {submission.evaluation_status})")
             )
 
-        # Step 4: Fetch the linked assignment context
-        assignment = db.query(DBGeneratedAssignment).filter(DBGeneratedAssignment.id == submission.assignment_id).first()
+        # Step 4: Linked assignment context (loaded with the submission above)
         if not assignment:
             raise HTTPException(status_code=404, detail="Linked assignment not found")
 
-        assignment_description = (
-            f"Title: {assignment.title}\n"
-            f"Description: {assignment.description}\n"
-            f"Requirements: {', '.join(assignment.requirements or [])}\n"
-            f"Context: {assignment.industry_context or 'No industry context provided.'}"
-        )
-
-        # Step 5: Use student's submission content
-        submission_text = submission.content or "No content submitted."
-
-        # Step 6: Prepare rubric
-        rubric = {"rubrics": [
-            {"category": dim["name"], "questions": list(dim["criteria_output"].keys())}
-            for dim in SITUATED_LEARNING_RUBRIC["dimensions"]
-        ]}
-
-        # Step 7: Run EvaluationService
-        evaluator = EvaluationService()
-        start = time.time()
-        evaluation_result = evaluator.evaluate_submission(
-            assignment_description=assignment_description,
-            submission_text=submission_text,
-            rubric=rubric,
-            submission_id=submission_id
-        )
-        duration = round(time.time() - start, 2)
-
-        # Log evaluation results
-        logger.info("=== Evaluation Results Processing ===")
-        logger.info(f"Raw evaluation result - overall score: {evaluation_result.overall_score}/72")
-        logger.info("Criterion evaluations:")
-        for ce in evaluation_result.criterion_evaluations:
-            logger.info(f"- {ce.category}:")
-            logger.info(f"  Score: {ce.score}/{ce.max_score}")
-            logger.info(f"  Percentage: {ce.percentage:.1f}%")
-            for qr in ce.question_results:
-                logger.info(f"  - Question: {qr.question}, Score: {qr.score}")
-
-        # Step 8: Store faculty evaluation (include question-level results so frontend can edit them)
-        rubric_scores = []
-        for ce in evaluation_result.criterion_evaluations:
-            question_results = [
-                {"question": qr.question, "score": qr.score, "feedback": qr.reasoning}
-                for qr in ce.question_results
-            ]
-            rubric_scores.append({
-                "category": ce.category,
-                "score": ce.score,
-                "max_score": ce.max_score,
-                "percentage": ce.percentage,
-                "feedback": ce.feedback,
-                "question_results": question_results,
-            })
-
         # 🔥 FIX: Use faculty_id from request or provide default
         faculty_id = getattr(request, 'faculty_id', "f20220162")
         
-        # Create new evaluation (we already checked for existing at the top)
-        faculty_eval = DBFacultyEvaluation(
-            submission_id=submission_id,
-            faculty_id=faculty_id,
-            rubric_scores=rubric_scores,
-            comments=evaluation_result.overall_feedback,
-            evaluation_date=datetime.utcnow()
-        )
-        db.add(faculty_eval)
-
-        # Step 9: Update submission status + score
-        submission.evaluation_status = "evaluated"
-        submission.evaluation_score = evaluation_result.overall_score
-        db.commit()
-
-        logger.info(f"✅ Auto evaluation done for submission {submission_id} | Score: {evaluation_result.overall_score}/72")
-
-        # Step 10: Build rich response with structured dimensions and criteria
-        dimensions = []
-        for ce in evaluation_result.criterion_evaluations:
-            criteria_list = []
-            # Build individual criteria with scores and feedback
-            for qr in ce.question_results:
-                criteria_list.append({
-                    "name": qr.question,
-                    "score": qr.score,
-                    "feedback": qr.reasoning or "No specific feedback provided."
-                })
+        # Optionally answer 202 right away and run the LLM evaluation in the background
+        if request.run_in_background:
+            # A queued or running job for this submission is handed back instead of starting a
+            # second LLM run (no await between the lookup and the set, so this cannot race)
+            active_job_id = _evaluation_jobs.get(_submission_job_key(submission_id))
+            active_job = _evaluation_jobs.get(active_job_id) if active_job_id else None
+            if active_job and active_job['status'] in ('queued', 'running'):
+                response.status_code = 202
+                return {key: active_job[key] for key in ('job_id', 'status', 'submission_id')}
             
-            dimensions.append({
-                "name": ce.category,
-                "dimension_score": float(ce.score),
-                "dimension_max_score": float(ce.max_score),
-                "dimension_percentage": round(ce.percentage, 2),
-                "dimension_feedback": ce.feedback,
-                "criteria": criteria_list
-            })
-
-        # Build the final response payload
-        response_payload = {
-            "submission_id": submission_id,
-            "status": "evaluated",
-            "overall_score": evaluation_result.overall_score,
-            "total_criteria": evaluation_result.total_criteria,
-            "overall_feedback": evaluation_result.overall_feedback,
-            "processing_time": evaluation_result.processing_time,
-            "llm_model": evaluation_result.evaluation_metadata.get("model_used"),
-            "duration": duration,
-            "dimensions": dimensions,
-            "evaluation_metadata": evaluation_result.evaluation_metadata
-        }
-
-        return response_payload
+            job_id = str(uuid.uuid4())
+            _evaluation_jobs.set(job_id, {'job_id': job_id, 'submission_id': submission_id, 'status': 'queued'})
+            _evaluation_jobs.set(_submission_job_key(submission_id), job_id)
+            background_tasks.add_task(_run_auto_evaluation_job, job_id, submission_id, faculty_id)
+            response.status_code = 202
+            return {'job_id': job_id, 'status': 'queued', 'submission_id': submission_id}
+        
+        return await _run_auto_evaluation(db, submission, assignment, submission_id, faculty_id)
 
     except HTTPException:
         raise
@@ -946,6 +1252,21 @@ async def auto_evaluate_submission(submission_id: str, request: AutoEvaluateRequ
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {e}")
     
 
+@router.get("/pending-submissions/{submission_id}/evaluate/{job_id}")
+async def get_auto_evaluation_job(submission_id: str, job_id: str):
+    """Status of a background auto-evaluation job, with the evaluation payload once completed"""
+    job = _evaluation_jobs.get(job_id)
+    # Submission index entries share the cache but are not jobs
+    if not isinstance(job, dict) or job['submission_id'] != submission_id:
+        raise HTTPException(status_code=404, detail="Evaluation job not found")
+    
+    response = {key: job[key] for key in ('job_id', 'status', 'submission_id')}
+    if job['status'] == 'completed':
+        response['result'] = job['result']
+    elif job['status'] == 'failed':
+        response['error'] = job.get('error')
+    return response
+
 class FacultyDashboardItem(BaseModel):
     id: str
     student_id: str
@@ -961,103 +1282,186 @@ class FacultyDashboardItem(BaseModel):
     submission_id: Optional[str] = None
     submission_date: Optional[str] = None
 
+_DASHBOARD_ITEM_LIST = TypeAdapter(List[FacultyDashboardItem])
+
+# Latest submission for the outer question set: matched on student + assignment, or on student +
+# course for the (legacy) question sets that have no assignment. LATERAL, so it runs per question set
+# inside the one dashboard query
+_LATEST_DASHBOARD_SUBMISSION = (
+    select(
+        DBStudentSubmission.id,
+        DBStudentSubmission.evaluation_status,
+        DBStudentSubmission.evaluation_score,
+        DBStudentSubmission.created_at
+    )
+    .where(
+        DBStudentSubmission.student_id == DBStudentQuestionSet.student_id,
+        or_(
+            and_(
+                DBStudentQuestionSet.assignment_id.isnot(None),
+                DBStudentSubmission.assignment_id == DBStudentQuestionSet.assignment_id
+            ),
+            and_(
+                DBStudentQuestionSet.assignment_id.is_(None),
+                DBStudentSubmission.course_id == DBStudentQuestionSet.course_id
+            )
+        )
+    )
+    .order_by(DBStudentSubmission.created_at.desc())
+    .limit(1)
+    .lateral("latest_submission")
+)
+
+# One row per question set with its course title and latest submission: exactly the dashboard columns
+_DASHBOARD_ROWS = (
+    select(
+        DBStudentQuestionSet.id,
+        DBStudentQuestionSet.student_id,
+        DBStudentQuestionSet.assignment_id,
+        DBStudentQuestionSet.course_id,
+        DBStudentQuestionSet.domain,
+        DBStudentQuestionSet.service_category,
+        DBStudentQuestionSet.department,
+        DBStudentQuestionSet.selected_question,
+        DBStudentQuestionSet.approval_status,
+        DBStudentQuestionSet.created_at,
+        DBCourse.title.label("course_name"),
+        _LATEST_DASHBOARD_SUBMISSION.c.id.label("submission_id"),
+        _LATEST_DASHBOARD_SUBMISSION.c.evaluation_status,
+        _LATEST_DASHBOARD_SUBMISSION.c.evaluation_score,
+        _LATEST_DASHBOARD_SUBMISSION.c.created_at.label("submission_created_at")
+    )
+    .outerjoin(DBCourse, DBCourse.id == DBStudentQuestionSet.course_id)
+    .outerjoin(_LATEST_DASHBOARD_SUBMISSION, true())
+    .order_by(DBStudentQuestionSet.created_at.desc(), DBStudentQuestionSet.id.desc())
+)
+
+async def _get_dashboard_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dashboard session: the read replica, except shortly after a write it may not have yet"""
+    session_factory = AsyncSessionLocal if dashboard_reads_need_primary() else AsyncReadSessionLocal
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
 @router.get("/dashboard", response_model=List[FacultyDashboardItem])
-async def get_faculty_dashboard(db: Session = Depends(get_db)):
+async def get_faculty_dashboard(
+    limit: int = Query(200, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(_get_dashboard_db)
+):
     """
-    Get comprehensive dashboard data with all student submissions and evaluations
+    Get comprehensive dashboard data with all student submissions and evaluations, newest first,
+    one page at a time. When more rows follow, the X-Next-Cursor response header carries the
+    cursor for the next page.
     """
+    cache_key = (limit, cursor)
+    cached = dashboard_cache.get(cache_key)
+    if cached is not None:
+        body, next_cursor = cached
+        return Response(
+            content=body, media_type="application/json",
+            headers={"X-Next-Cursor": next_cursor} if next_cursor else None
+        )
+    
+    # Keyset pagination on (created_at, id): each page starts right after the previous page's last
+    # row via the index, however deep it is, instead of scanning and discarding OFFSET rows
+    statement = _DASHBOARD_ROWS
+    if cursor:
+        statement = statement.where(
+            tuple_(DBStudentQuestionSet.created_at, DBStudentQuestionSet.id) < tuple_(*_decode_keyset_cursor(cursor))
+        )
+    
     try:
-        # Get all student question sets with assignment relationship loaded
-        question_sets = db.query(DBStudentQuestionSet).options(
-            joinedload(DBStudentQuestionSet.assignment)
-        ).order_by(
-            DBStudentQuestionSet.created_at.desc()
-        ).all()
+        # Question sets, course titles and latest submissions in a single query; one
+        # extra row tells whether another page follows
+        rows = (await db.execute(statement.limit(limit + 1))).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_keyset_cursor(rows[-1].created_at, rows[-1].id)
         
         result = []
-        for qs in question_sets:
-            # Get assignment_id from question set (either directly or through relationship)
-            assignment_id = qs.assignment_id
-            if not assignment_id and qs.assignment:
-                assignment_id = qs.assignment.id
-            
-            # CRITICAL: Each submission is linked to a specific assignment_id
-            # We MUST match by both student_id AND assignment_id to get the correct submission
-            submission = None
-            
-            if assignment_id:
-                # Exact match: student_id + assignment_id (this ensures assignment-specific matching)
-                submission = db.query(DBStudentSubmission).filter(
-                    and_(
-                        DBStudentSubmission.student_id == qs.student_id,
-                        DBStudentSubmission.assignment_id == assignment_id
-                    )
-                ).order_by(DBStudentSubmission.created_at.desc()).first()
-                
-                # Log if no submission found for debugging
-                if not submission:
-                    logger.warning(
-                        f"No submission found for student_id={qs.student_id}, "
-                        f"assignment_id={assignment_id}, question_set_id={qs.id}"
-                    )
-            else:
-                # Fallback: if no assignment_id on question set, try to match by course_id
-                # This is less precise but handles edge cases
+        for row in rows:
+            # CRITICAL: Each submission is linked to a specific assignment_id; the query matches by
+            # both student_id AND assignment_id, falling back to course_id only without an assignment
+            if not row.assignment_id:
                 logger.warning(
-                    f"Question set {qs.id} has no assignment_id, falling back to course_id matching"
+                    f"Question set {row.id} has no assignment_id, falling back to course_id matching"
                 )
-                if qs.course_id:
-                    submission = db.query(DBStudentSubmission).filter(
-                        and_(
-                            DBStudentSubmission.student_id == qs.student_id,
-                            DBStudentSubmission.course_id == qs.course_id
-                        )
-                    ).order_by(DBStudentSubmission.created_at.desc()).first()
-            
-            # Get course info if available
-            course_name = None
-            if qs.course_id:
-                course = db.query(DBCourse).filter(DBCourse.id == qs.course_id).first()
-                course_name = course.title if course else None
-            
-            # Get evaluation status and score from submission
-            evaluation_status = None
-            evaluation_score = None
-            submission_id = None
-            submission_date = None
-            
-            if submission:
-                evaluation_status = submission.evaluation_status
-                evaluation_score = submission.evaluation_score
-                submission_id = str(submission.id)
-                submission_date = submission.created_at.isoformat() if submission.created_at else None
-                
-                # Log for debugging - verify we got the correct submission
-                logger.debug(
-                    f"Question Set {qs.id}: Matched submission {submission_id} "
-                    f"(student={qs.student_id}, assignment={assignment_id}, "
-                    f"status={evaluation_status}, score={evaluation_score})"
+            elif not row.submission_id:
+                # Log if no submission found for debugging
+                logger.warning(
+                    f"No submission found for student_id={row.student_id}, "
+                    f"assignment_id={row.assignment_id}, question_set_id={row.id}"
                 )
             
-            result.append(FacultyDashboardItem(
-                id=str(qs.id),
-                student_id=qs.student_id,
-                student_email=qs.student_id,  # Using student_id as email if separate email not available
-                course_name=course_name,
-                domain=qs.domain,
-                service_category=qs.service_category,
-                department=qs.department,
-                selected_question=qs.selected_question,
-                approval_status=qs.approval_status,
-                evaluation_status=evaluation_status,
-                evaluation_score=evaluation_score,
-                submission_id=submission_id,
-                submission_date=submission_date
+            # Trusted DB rows: build without validation (see get_courses)
+            result.append(FacultyDashboardItem.model_construct(
+                id=str(row.id),
+                student_id=row.student_id,
+                student_email=row.student_id,  # Using student_id as email if separate email not available
+                course_name=row.course_name,
+                domain=row.domain,
+                service_category=row.service_category,
+                department=row.department,
+                selected_question=row.selected_question,
+                approval_status=row.approval_status,
+                evaluation_status=row.evaluation_status,
+                evaluation_score=row.evaluation_score,
+                submission_id=str(row.submission_id) if row.submission_id else None,
+                submission_date=row.submission_created_at.isoformat() if row.submission_created_at else None
             ))
         
         logger.info(f"✅ Faculty dashboard data fetched: {len(result)} items")
-        return result
+        body = _DASHBOARD_ITEM_LIST.dump_json(result)
+        dashboard_cache.set(cache_key, (body, next_cursor))
+        return Response(
+            content=body, media_type="application/json",
+            headers={"X-Next-Cursor": next_cursor} if next_cursor else None
+        )
         
     except Exception as e:
         logger.error(f"❌ Error fetching faculty dashboard data: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error fetching dashboard data: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error fetching dashboard data: {str(e)}")
+
+
+class FacultyDashboardStats(BaseModel):
+    total: int
+    pending_approval: int
+    approved: int
+    rejected: int
+    pending_evaluation: int
+    evaluated: int
+    finalized: int
+
+@router.get("/dashboard/stats", response_model=FacultyDashboardStats)
+async def get_faculty_dashboard_stats(course_id: Optional[str] = None, db: AsyncSession = Depends(_get_dashboard_db)):
+    """
+    Dashboard counters (approval and evaluation states of each question set's latest submission),
+    aggregated by the database in one pass instead of counted client-side over every row
+    """
+    try:
+        evaluation_status = _LATEST_DASHBOARD_SUBMISSION.c.evaluation_status
+        query = select(
+            func.count().label("total"),
+            func.count().filter(or_(
+                DBStudentQuestionSet.approval_status == "pending", DBStudentQuestionSet.approval_status.is_(None)
+            )).label("pending_approval"),
+            func.count().filter(DBStudentQuestionSet.approval_status == "approved").label("approved"),
+            func.count().filter(DBStudentQuestionSet.approval_status == "rejected").label("rejected"),
+            func.count().filter(or_(
+                evaluation_status.is_(None), evaluation_status == "pending_faculty"
+            )).label("pending_evaluation"),
+            func.count().filter(evaluation_status == "evaluated").label("evaluated"),
+            func.count().filter(evaluation_status == "finalized").label("finalized"),
+        ).select_from(DBStudentQuestionSet).outerjoin(_LATEST_DASHBOARD_SUBMISSION, true())
+        if course_id:
+            query = query.where(DBStudentQuestionSet.course_id == _as_uuid(course_id))
+        
+        stats = (await db.execute(query)).one()
+        return FacultyDashboardStats.model_construct(**stats._mapping)
+    except Exception as e:
+        logger.error(f"❌ Error fetching faculty dashboard stats: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error fetching dashboard stats: {str(e)}")
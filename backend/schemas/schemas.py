@@ -59,6 +59,7 @@ class FacultyEvaluationResponse(BaseModel):
 
 class AutoEvaluateRequest(BaseModel):
     faculty_id: Optional[str]=None  # sent from frontend when faculty initiates evaluation
+    run_in_background: bool = False  # return 202 with a job id instead of waiting for the LLM
 
 class CriterionFeedback(BaseModel):
     category: str
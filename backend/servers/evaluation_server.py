@@ -6,6 +6,7 @@ Handles student submission evaluation, scoring, and assessment functionality
 import os
 import sys
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from contextlib import asynccontextmanager
 
@@ -23,8 +24,10 @@ import uvicorn
 from routers.evaluation import router as evaluation_router
 from routers.student import router as student_router
 from routers.faculty import router as faculty_router
-from database.connection import init_db
+from database.connection import init_db, async_engine, sync_engine
+from database.pool_metrics import pool_stats
 from config.settings import settings
+from utils.executor import blocking_io_executor
 
 # Configure logging
 logging.basicConfig(
@@ -50,17 +53,25 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     logger.info("Starting Evaluation Server...")
     
-    # Initialize database
-    try:
-        await init_db()
-        logger.info("Database initialized successfully")
-    except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
-        # Don't fail startup, just log the error
-    
-    yield
-    
-    logger.info("Shutting down Evaluation Server...")
+    # Blocking work offloaded with asyncio.to_thread runs on this pool instead of the small default one
+    async with blocking_io_executor():
+        # Initialize database
+        try:
+            await init_db()
+            logger.info("Database initialized successfully")
+        except Exception as e:
+            logger.error(f"Database initialization failed: {e}")
+            # Don't fail startup, just log the error
+        
+        # Process pool for CPU-bound PDF report rendering (keeps the event loop free)
+        pdf_workers = int(os.getenv("PDF_POOL_WORKERS", str(os.cpu_count() or 1)))
+        app.state.pdf_pool = ProcessPoolExecutor(max_workers=pdf_workers)
+        logger.info(f"PDF render pool started with {pdf_workers} workers")
+        
+        yield
+        
+        logger.info("Shutting down Evaluation Server...")
+        app.state.pdf_pool.shutdown(wait=False, cancel_futures=True)
 
 # Create FastAPI application
 app = FastAPI(
@@ -99,6 +110,15 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "evaluation"}
 
+# Connection pool diagnostics
+@app.get("/debug/pool")
+async def debug_pool():
+    """Report pool usage and rolling checkout latency for both engines"""
+    return {
+        "sync": pool_stats(sync_engine.pool),
+        "async": pool_stats(async_engine.pool),
+    }
+
 # Root endpoint
 @app.get("/")
 async def root():
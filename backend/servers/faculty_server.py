@@ -1,6 +1,7 @@
 import sys
 import os
 from pathlib import Path
+from contextlib import asynccontextmanager
 
 current_dir = Path(__file__).parent
 backend_dir = current_dir.parent
@@ -9,9 +10,16 @@ sys.path.insert(0, str(backend_dir))
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from routers import faculty
+from utils.executor import blocking_io_executor
 import uvicorn
 
-app = FastAPI(title="Faculty Service API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Blocking work offloaded with asyncio.to_thread runs on this pool instead of the small default one
+    async with blocking_io_executor():
+        yield
+
+app = FastAPI(title="Faculty Service API", lifespan=lifespan)
 
 # Configure CORS with specific origins
 app.add_middleware(
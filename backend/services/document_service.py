@@ -288,7 +288,7 @@ class DocumentService:
             # Get associated rubric if any
             rubric = None
             rubric_query = db.query(AssignmentRubric).filter(
-                AssignmentRubric.assignment_ids.contains([assignments[0].id])
+                AssignmentRubric.matches_assignment(assignments[0].id)
             ).first()
             
             if rubric_query:
@@ -7,7 +7,7 @@ import json
 import time
 import logging
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from openai import OpenAI
 import os
 from config.settings import settings
@@ -138,6 +138,12 @@ SITUATED_LEARNING_RUBRIC = {
     ]
 }
 
+# Reasoning evaluate_question returns (with a 0 score) when the LLM could not be reached or kept
+# answering out of format; such results reflect a transient failure, not the submission
+EVALUATION_ERROR_REASONING = "Evaluation failed due to technical error"
+EVALUATION_RETRIES_EXHAUSTED_REASONING = "Evaluation failed after multiple attempts"
+EVALUATION_FAILURE_REASONINGS = frozenset({EVALUATION_ERROR_REASONING, EVALUATION_RETRIES_EXHAUSTED_REASONING})
+
 @dataclass
 class EvaluationResult:
     """Data class to store evaluation results for each question"""
@@ -167,6 +173,30 @@ class SubmissionEvaluation:
     processing_time: float
     evaluation_metadata: Dict[str, Any]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form (nested criteria and question results included)"""
+        return asdict(self)
+
+    def has_failed_questions(self) -> bool:
+        """Whether any question fell back to a failure score (LLM error or exhausted retries)"""
+        return any(
+            question.reasoning in EVALUATION_FAILURE_REASONINGS
+            for criterion in self.criterion_evaluations
+            for question in criterion.question_results
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SubmissionEvaluation":
+        """Rebuild an evaluation from to_dict() output"""
+        criterion_evaluations = [
+            CriterionEvaluation(**{
+                **criterion,
+                'question_results': [EvaluationResult(**q) for q in criterion.get('question_results', [])]
+            })
+            for criterion in data.get('criterion_evaluations', [])
+        ]
+        return cls(**{**data, 'criterion_evaluations': criterion_evaluations})
+
 class EvaluationService:
     """Enhanced service for evaluating student submissions using LLM and structured rubrics"""
     
@@ -304,10 +334,10 @@ REASONING: The submission demonstrates effective application of theoretical conc
                 logger.error(f"Error during evaluation (attempt {attempt + 1}): {e}")
                 if attempt == max_retries - 1:
                     logger.error(f"Failed to evaluate question after {max_retries} attempts")
-                    return 0, "Evaluation failed due to technical error"
+                    return 0, EVALUATION_ERROR_REASONING
                 time.sleep(1)  # Brief pause before retry
         
-        return 0, "Evaluation failed after multiple attempts"
+        return 0, EVALUATION_RETRIES_EXHAUSTED_REASONING
     
     def parse_llm_response_new(self, response_text: str) -> Tuple[int, str]:
         """
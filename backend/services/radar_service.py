@@ -2,6 +2,7 @@
 AI Text Detection Service using RADAR (Robust AI-Text Detection via Adversarial Learning)
 """
 from typing import Dict, Any, List
+import asyncio
 import logging
 import torch
 import torch.nn.functional as F
@@ -22,6 +23,28 @@ class RadarService:
             logger.error(f"Failed to initialize RADAR model: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to initialize AI detection model")
 
+    def _predict_ai_probabilities(self, texts: List[str]) -> List[float]:
+        """Run one RADAR forward pass over a batch of texts (blocking; call from a worker thread)"""
+        with torch.no_grad():
+            inputs = self.tokenizer(texts, padding=True, truncation=True,
+                                    max_length=512, return_tensors="pt")
+            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            return F.log_softmax(self.detector(**inputs).logits, -1)[:, 0].exp().tolist()
+
+    @staticmethod
+    def _detection_result(ai_prob: float) -> Dict[str, Any]:
+        """Shape a RADAR probability into the detection result returned to callers"""
+        return {
+            "ai_probability": ai_prob,
+            "is_likely_ai": ai_prob > 0.8,  # Threshold can be adjusted
+            "confidence_score": ai_prob if ai_prob > 0.5 else (1 - ai_prob),
+            "analysis_details": {
+                "raw_probability": ai_prob,
+                "model_name": "RADAR-Vicuna-7B",
+                "threshold": 0.8
+            }
+        }
+
     async def detect_ai_content(self, text: str) -> Dict[str, Any]:
         """
         Analyze text to determine probability of AI generation
@@ -33,25 +56,9 @@ class RadarService:
             Dict containing AI probability and analysis details
         """
         try:
-            with torch.no_grad():
-                inputs = self.tokenizer([text], padding=True, truncation=True, 
-                                      max_length=512, return_tensors="pt")
-                inputs = {k: v.to(self.device) for k, v in inputs.items()}
-                output_probs = F.log_softmax(self.detector(**inputs).logits, -1)[:, 0].exp().tolist()
-
-            # Get the probability for the text
-            ai_prob = output_probs[0]
-
-            return {
-                "ai_probability": ai_prob,
-                "is_likely_ai": ai_prob > 0.8,  # Threshold can be adjusted
-                "confidence_score": ai_prob if ai_prob > 0.5 else (1 - ai_prob),
-                "analysis_details": {
-                    "raw_probability": ai_prob,
-                    "model_name": "RADAR-Vicuna-7B",
-                    "threshold": 0.8
-                }
-            }
+            # Model inference blocks, so it runs in a worker thread instead of on the event loop
+            output_probs = await asyncio.to_thread(self._predict_ai_probabilities, [text])
+            return self._detection_result(output_probs[0])
         except Exception as e:
             logger.error(f"Error during AI detection: {str(e)}")
             raise HTTPException(status_code=500, detail="AI detection analysis failed")
@@ -68,9 +75,31 @@ class RadarService:
         """
         # Get AI detection results
         detection_results = await self.detect_ai_content(submission_content)
+        return self._build_report(submission_content, detection_results)
+
+    async def analyze_batch(self, contents: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze several submissions with a single RADAR forward pass
+        
+        Args:
+            contents: The text content of each submission
+            
+        Returns:
+            One analysis report per submission, in the same order (see analyze_submission)
+        """
+        try:
+            output_probs = await asyncio.to_thread(self._predict_ai_probabilities, contents)
+        except Exception as e:
+            logger.error(f"Error during batched AI detection: {str(e)}")
+            raise HTTPException(status_code=500, detail="AI detection analysis failed")
+        return [
+            self._build_report(content, self._detection_result(ai_prob))
+            for content, ai_prob in zip(contents, output_probs)
+        ]
 
-        # Generate detailed analysis report
-        report = {
+    def _build_report(self, submission_content: str, detection_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate the detailed analysis report for one submission"""
+        return {
             "ai_detection_results": detection_results,
             "risk_assessment": self._assess_risk(detection_results["ai_probability"]),
             "recommendations": self._generate_recommendations(detection_results["ai_probability"]),
@@ -80,8 +109,6 @@ class RadarService:
             }
         }
 
-        return report
-
     def _assess_risk(self, ai_probability: float) -> Dict[str, Any]:
         """Assess the risk level based on AI probability"""
         if ai_probability > 0.9:
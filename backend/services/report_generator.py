@@ -6,7 +6,7 @@ Creates professional, detailed evaluation reports with all submission details
 import io
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import BinaryIO, Dict, List, Any, Optional
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -106,10 +106,25 @@ class EvaluationReportGenerator:
         Returns:
             PDF content as bytes
         """
+        buffer = io.BytesIO()
+        self.write_evaluation_report(buffer, assignment_data, evaluation_results, rubric_data)
+        return buffer.getvalue()
+
+    def write_evaluation_report(self, output: BinaryIO,
+                                assignment_data: Dict[str, Any],
+                                evaluation_results: List[Dict[str, Any]],
+                                rubric_data: Dict[str, Any]) -> None:
+        """
+        Write comprehensive evaluation report PDF into a writable binary file-like
+        
+        Args:
+            output: Writable binary file-like object (BytesIO, temp file, ...)
+            assignment_data: Assignment information
+            evaluation_results: List of evaluation results for all submissions
+            rubric_data: Rubric information and criteria
+        """
         try:
-            # Create PDF in memory
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4, 
+            doc = SimpleDocTemplate(output, pagesize=A4, 
                                   rightMargin=72, leftMargin=72,
                                   topMargin=72, bottomMargin=18)
             
@@ -142,10 +157,8 @@ class EvaluationReportGenerator:
             
             # Build PDF
             doc.build(story)
-            buffer.seek(0)
             
             logger.info(f"Successfully generated evaluation report with {len(evaluation_results)} submissions")
-            return buffer.getvalue()
             
         except Exception as e:
             logger.error(f"Error generating evaluation report: {str(e)}")
@@ -406,3 +419,12 @@ class EvaluationReportGenerator:
         elements.append(Paragraph(f"Report generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", self.styles['CustomBody']))
         
         return elements
+
+
+def render_evaluation_report(assignment_data: Dict[str, Any],
+                             evaluation_results: List[Dict[str, Any]],
+                             rubric_data: Dict[str, Any]) -> bytes:
+    """Module-level (picklable) entry point so reports can be rendered in a process pool"""
+    return EvaluationReportGenerator().generate_evaluation_report(
+        assignment_data, evaluation_results, rubric_data
+    )
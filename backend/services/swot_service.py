@@ -34,14 +34,9 @@ class LLMAnalysisService:
         if not assignment:
             raise Exception("Assignment not found")
 
-        # Create prompts
-        system_prompt = self._create_system_prompt()
-        user_prompt = self._create_user_prompt(assignment, request.content)
-
         try:
             # Call LLM
-            response_text = await self._call_llm(system_prompt, user_prompt)
-            swot_analysis = self._parse_swot_response(response_text)
+            swot_analysis = await self.generate_swot(assignment, request.content)
 
             # ✅ Store SWOT analysis using the provided submission_id
             # The submission was already created in the router, so we just link the SWOT result to it
@@ -77,6 +72,13 @@ class LLMAnalysisService:
             db.rollback()
             raise
 
+    async def generate_swot(self, assignment, content: str) -> Dict[str, list]:
+        """Run the SWOT prompt for one submission and return the parsed sections (no DB access)."""
+        system_prompt = self._create_system_prompt()
+        user_prompt = self._create_user_prompt(assignment, content)
+        response_text = await self._call_llm(system_prompt, user_prompt)
+        return self._parse_swot_response(response_text)
+
     def _create_submission(self, db: Session, submission_data: SubmissionCreate):
         """Create a new SWOT submission entry."""
         new_submission = SWOTSubmission(
@@ -8,6 +8,7 @@ from minio import Minio
 from minio.error import S3Error
 import logging
 import traceback
+from datetime import timedelta
 
 logger = logging.getLogger(__name__)
 
@@ -174,6 +175,14 @@ class MinIOClient:
         except S3Error:
             return False
     
+    def get_presigned_url(self, object_name: str, expires_seconds: int = 900) -> str:
+        """Get a time-limited download URL for an object"""
+        return self.client.presigned_get_object(
+            self.bucket_name,
+            object_name,
+            expires=timedelta(seconds=expires_seconds)
+        )
+    
     def get_file_size(self, object_name: str) -> Optional[int]:
         """Get file size from MinIO"""
         try:
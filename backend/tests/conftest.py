@@ -0,0 +1,87 @@
+"""
+Shared pytest configuration for the backend test suite
+
+Database-backed tests run against TEST_DATABASE_URL (a postgresql:// URL) and are skipped
+when it is not set. Each test runs inside a transaction that is rolled back afterwards.
+"""
+
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+# Backend modules import each other as top-level packages (database, routers, ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from database.connection import Base
+from database.query_counter import count_queries as _count_queries
+from database.models import Course, GeneratedAssignment, AssignmentRubric, StudentSubmission
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    """Async engine on the test database, with the schema created if missing"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_async_engine(TEST_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db_session(db_engine):
+    """AsyncSession joined to an outer transaction that is rolled back after the test; handler
+    commits and rollbacks act on savepoints inside it"""
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture
+def count_queries(db_engine):
+    """
+    Context manager recording the SQL statements executed on the test engine:
+
+        with count_queries() as queries:
+            await handler(...)
+        assert len(queries) <= 5, queries
+    """
+    return lambda: _count_queries(db_engine.sync_engine)
+
+
+@pytest_asyncio.fixture
+async def seeded_assignment(db_session):
+    """Course -> assignment -> rubric (two categories) with one pending submission, flushed"""
+    course = Course(title="Distributed Systems", course_code="CS401", academic_year="2025-26", semester=1)
+    assignment = GeneratedAssignment(
+        id=uuid.uuid4(), course=course, course_name=course.title, title="Caching", description="Add a cache"
+    )
+    rubric = AssignmentRubric(
+        id=uuid.uuid4(), assignment_id=assignment.id, assignment_ids=[assignment.id],
+        rubric_name="Default", criteria={"rubrics": []},
+        rubrics_list=[
+            {"category": "Design", "description": "Architecture", "max_score": 12},
+            {"category": "Testing", "description": "Coverage", "max_score": 12},
+        ]
+    )
+    submission = StudentSubmission(
+        id=uuid.uuid4(), student_id="s1", assignment=assignment, course=course,
+        original_file_name="report.pdf", content="My report", evaluation_status="pending_faculty"
+    )
+    db_session.add_all([course, assignment, rubric, submission])
+    await db_session.flush()
+    return SimpleNamespace(course=course, assignment=assignment, rubric=rubric, submission=submission)
@@ -0,0 +1,66 @@
+"""
+Tests for GET /evaluation/{id} and PUT /evaluation/update/{id} in the faculty router
+"""
+
+import uuid
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from database.models import EvaluationResult
+from routers import faculty
+
+
+@pytest_asyncio.fixture
+async def evaluation_result(db_session, seeded_assignment):
+    """AI evaluation of the seeded submission, criterion_scores in the stored {category: details} shape"""
+    result = EvaluationResult(
+        submission=seeded_assignment.submission, assignment=seeded_assignment.assignment,
+        rubric=seeded_assignment.rubric, overall_score=14.0,
+        criterion_scores={
+            "Design": {"score": 8.0, "max_score": 12.0, "feedback": "Clear layering"},
+            "Testing": {"score": 6.0, "max_score": 12.0, "feedback": "Few edge cases"},
+        }
+    )
+    db_session.add(result)
+    await db_session.flush()
+    return result
+
+
+async def _reload(db, result_id):
+    db.expunge_all()
+    return (await db.execute(select(EvaluationResult).where(EvaluationResult.id == result_id))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_update_evaluation_rescores_criterion_and_totals_overall_score(db_session, evaluation_result):
+    response = await faculty.update_evaluation(
+        str(evaluation_result.submission_id), faculty.EvaluationScores(scores={"Testing": 10.0}), db=db_session
+    )
+
+    assert response["status"] == "success"
+    stored = await _reload(db_session, evaluation_result.id)
+    assert stored.criterion_scores["Testing"] == {"score": 10.0, "max_score": 12.0, "feedback": "Few edge cases"}
+    assert stored.criterion_scores["Design"]["score"] == 8.0
+    assert stored.overall_score == 18.0
+
+
+@pytest.mark.asyncio
+async def test_get_evaluation_data_lists_criteria_by_category(db_session, evaluation_result):
+    response = await faculty.get_evaluation_data(str(evaluation_result.submission_id), db=db_session)
+
+    assert response["overall_score"] == 14.0
+    assert sorted(response["criteria"], key=lambda criterion: criterion["id"]) == [
+        {"id": "Design", "name": "Design", "description": "Clear layering", "max_score": 12.0, "score": 8.0},
+        {"id": "Testing", "name": "Testing", "description": "Few edge cases", "max_score": 12.0, "score": 6.0},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_evaluation_unknown_submission_is_404(db_session):
+    with pytest.raises(HTTPException) as exc_info:
+        await faculty.update_evaluation(str(uuid.uuid4()), faculty.EvaluationScores(scores={}), db=db_session)
+
+    assert exc_info.value.status_code == 404
@@ -0,0 +1,76 @@
+"""
+Tests for POST /faculty/evaluate in the evaluation router
+"""
+
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from database.models import AssignmentRubric, EvaluationResult
+from routers import evaluation
+
+
+def _rubric_request(submission_id, **scores):
+    return evaluation.RubricRequest(
+        faculty_id="f1", submission_id=submission_id, criteria_scores=scores, feedback="Solid work"
+    )
+
+
+@pytest.mark.asyncio
+async def test_faculty_evaluation_stores_rubric_result(db_session, seeded_assignment):
+    submission = seeded_assignment.submission
+
+    response = await evaluation.faculty_evaluation(
+        _rubric_request(submission.id, Design=8.0, Testing=6.0), db=db_session
+    )
+
+    assert response.total_score == 14.0
+    assert [(c.name, c.max_score, c.description) for c in response.criteria] == [
+        ("Design", 12, "Architecture"), ("Testing", 12, "Coverage")
+    ]
+    stored = (await db_session.execute(
+        select(EvaluationResult).where(EvaluationResult.submission_id == submission.id)
+    )).scalar_one()
+    assert stored.overall_score == 14.0
+    assert stored.rubric_id == seeded_assignment.rubric.id
+    assert stored.assignment_id == seeded_assignment.assignment.id
+    assert stored.criterion_scores["Design"]["score"] == 8.0
+    assert stored.faculty_feedback == "Solid work"
+    assert submission.evaluation_status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_faculty_evaluation_prefers_directly_linked_rubric(db_session, seeded_assignment):
+    db_session.add(AssignmentRubric(
+        id=uuid.uuid4(), assignment_ids=[seeded_assignment.assignment.id],
+        rubric_name="Legacy", criteria={"rubrics": []}, rubrics_list=[]
+    ))
+    await db_session.flush()
+
+    await evaluation.faculty_evaluation(_rubric_request(seeded_assignment.submission.id, Design=5.0), db=db_session)
+
+    stored = (await db_session.execute(
+        select(EvaluationResult).where(EvaluationResult.submission_id == seeded_assignment.submission.id)
+    )).scalar_one()
+    assert stored.rubric_id == seeded_assignment.rubric.id
+
+
+@pytest.mark.asyncio
+async def test_faculty_evaluation_without_rubric_is_404(db_session, seeded_assignment):
+    await db_session.delete(seeded_assignment.rubric)
+    await db_session.flush()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await evaluation.faculty_evaluation(_rubric_request(seeded_assignment.submission.id, Design=5.0), db=db_session)
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_faculty_evaluation_unknown_submission_is_404(db_session):
+    with pytest.raises(HTTPException) as exc_info:
+        await evaluation.faculty_evaluation(_rubric_request(uuid.uuid4(), Design=5.0), db=db_session)
+
+    assert exc_info.value.status_code == 404
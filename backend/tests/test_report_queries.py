@@ -0,0 +1,44 @@
+"""
+Query budget of the assignment report endpoints (guards against N+1 regressions)
+"""
+
+import uuid
+
+import pytest
+from starlette.requests import Request
+
+from database.models import StudentSubmission, EvaluationResult
+from routers import evaluation
+
+
+async def _add_evaluated_submissions(db, seeded, submissions: int):
+    """`submissions` evaluated submissions of the seeded assignment"""
+    for index in range(submissions):
+        submission = StudentSubmission(
+            id=uuid.uuid4(), student_id=f"s{index}", assignment=seeded.assignment, course=seeded.course,
+            original_file_name=f"report_{index}.pdf"
+        )
+        db.add(EvaluationResult(
+            submission=submission, assignment=seeded.assignment, rubric=seeded.rubric, overall_score=40.0,
+            criterion_scores={"Design": {"score": 8, "max_score": 12}}
+        ))
+    await db.flush()
+    # Start the request from an empty identity map, as a real request does
+    db.expunge_all()
+
+
+def _get_request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""})
+
+
+@pytest.mark.asyncio
+async def test_report_data_runs_in_bounded_queries(db_session, seeded_assignment, count_queries):
+    assignment_id = seeded_assignment.assignment.id
+    await _add_evaluated_submissions(db_session, seeded_assignment, submissions=6)
+
+    with count_queries() as queries:
+        response = await evaluation.get_evaluation_report_data(assignment_id, _get_request(), db=db_session)
+
+    assert response.status_code == 200
+    # context + digest + results + their submissions, whatever the number of submissions
+    assert len(queries) <= 5, queries
@@ -0,0 +1,102 @@
+"""
+Tests for POST /student/swot (the LLM call is replaced; everything else runs against the test database)
+"""
+
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from database.models import StudentSWOTResult
+from routers import evaluation
+
+
+SWOT_SECTIONS = {
+    "strengths": ["Clear structure"],
+    "weaknesses": ["Few citations"],
+    "opportunities": ["Add benchmarks"],
+    "threats": ["N/A"],
+    "suggestions": ["Cite the dataset"],
+}
+
+
+@pytest.fixture
+def generate_swot(monkeypatch):
+    """Stand-in for the LLM SWOT call, with the cache emptied so each test reaches it"""
+    evaluation._swot_cache.clear()
+    generate = AsyncMock(return_value=SWOT_SECTIONS)
+    monkeypatch.setattr(evaluation.swot_generator, "generate_swot", generate)
+    return generate
+
+
+def _swot_request(submission, content="My report"):
+    return evaluation.SWOTRequest(student_id=submission.student_id, submission_id=submission.id, content=content)
+
+
+async def _stored_analyses(db, submission_id):
+    return (await db.execute(
+        select(StudentSWOTResult).where(StudentSWOTResult.submission_id == submission_id)
+    )).scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_create_swot_analysis_persists_generated_sections(db_session, seeded_assignment, generate_swot):
+    submission = seeded_assignment.submission
+
+    response = await evaluation.create_swot_analysis(_swot_request(submission), db=db_session)
+
+    assert response == evaluation.SWOTAnalysis(**SWOT_SECTIONS)
+    prompt_assignment, prompt_content = generate_swot.await_args.args
+    assert prompt_assignment.id == seeded_assignment.assignment.id
+    assert prompt_content == "My report"
+    [stored] = await _stored_analyses(db_session, submission.id)
+    assert stored.strengths == SWOT_SECTIONS["strengths"]
+    assert stored.suggestions == SWOT_SECTIONS["suggestions"]
+
+
+@pytest.mark.asyncio
+async def test_create_swot_analysis_unknown_submission_is_404(db_session, generate_swot):
+    request = evaluation.SWOTRequest(student_id="s1", submission_id=uuid.uuid4(), content="x")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await evaluation.create_swot_analysis(request, db=db_session)
+
+    assert exc_info.value.status_code == 404
+    generate_swot.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_swot_analysis_other_students_submission_is_404(db_session, seeded_assignment, generate_swot):
+    request = evaluation.SWOTRequest(
+        student_id="someone-else", submission_id=seeded_assignment.submission.id, content="x"
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await evaluation.create_swot_analysis(request, db=db_session)
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_swot_analysis_llm_failure_is_502(db_session, seeded_assignment, generate_swot):
+    generate_swot.side_effect = Exception("SWOT LLM request failed")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await evaluation.create_swot_analysis(_swot_request(seeded_assignment.submission), db=db_session)
+
+    assert exc_info.value.status_code == 502
+    assert await _stored_analyses(db_session, seeded_assignment.submission.id) == []
+
+
+@pytest.mark.asyncio
+async def test_create_swot_analysis_reuses_cached_analysis(db_session, seeded_assignment, generate_swot):
+    request = _swot_request(seeded_assignment.submission, content="Same text")
+
+    first = await evaluation.create_swot_analysis(request, db=db_session)
+    second = await evaluation.create_swot_analysis(request, db=db_session)
+
+    assert first == second
+    generate_swot.assert_awaited_once()
+    assert len(await _stored_analyses(db_session, seeded_assignment.submission.id)) == 2
@@ -0,0 +1,30 @@
+"""
+Cache of serialized faculty dashboard pages, shared by the routers whose writes it reflects
+"""
+import os
+import time
+
+from utils.cache import TTLCache
+
+# Pages are shared by concurrent viewers for a few seconds. Submissions carry no updated_at to
+# version on, so writes that change what the dashboard shows call invalidate_dashboard_cache()
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "5"))
+
+# After such a write, dashboard reads go to the primary for this long: the read replica may not
+# have the write yet, and a page refilled from it would hide the write for a whole TTL
+DASHBOARD_PRIMARY_READ_SECONDS = float(os.getenv("DASHBOARD_PRIMARY_READ_SECONDS", "30"))
+
+dashboard_cache = TTLCache(maxsize=32, ttl=DASHBOARD_CACHE_TTL_SECONDS)
+_primary_reads_until = 0.0
+
+
+def invalidate_dashboard_cache() -> None:
+    """Drop cached dashboard pages after a committed write and read from the primary for a while"""
+    global _primary_reads_until
+    _primary_reads_until = time.monotonic() + DASHBOARD_PRIMARY_READ_SECONDS
+    dashboard_cache.clear()
+
+
+def dashboard_reads_need_primary() -> bool:
+    """Whether a recent write may not have reached the read replica yet"""
+    return time.monotonic() < _primary_reads_until
@@ -0,0 +1,28 @@
+"""
+Default thread pool for blocking work offloaded from the event loop
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def blocking_io_executor():
+    """
+    Install a THREAD_POOL_SIZE-worker pool as the running loop's default executor
+    for the lifetime of an app, so asyncio.to_thread / run_in_executor(None, ...)
+    calls are not capped by the small stdlib default
+    """
+    executor = ThreadPoolExecutor(max_workers=settings.THREAD_POOL_SIZE, thread_name_prefix="blocking-io")
+    asyncio.get_running_loop().set_default_executor(executor)
+    logger.info(f"Thread pool sized to {settings.THREAD_POOL_SIZE} workers")
+    try:
+        yield executor
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
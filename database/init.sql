@@ -87,9 +87,11 @@ CREATE TABLE IF NOT EXISTS generated_assignments (
 CREATE TABLE IF NOT EXISTS assignment_rubrics (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     assignment_ids UUID[] NOT NULL,
+    assignment_id UUID UNIQUE REFERENCES generated_assignments(id) ON DELETE CASCADE,
     rubric_name VARCHAR(255) NOT NULL,
     doc_type VARCHAR(100) DEFAULT 'Assignment',
     criteria JSONB NOT NULL,
+    rubrics_list JSONB,
     total_points INTEGER,
     is_edited BOOLEAN DEFAULT FALSE,
     reason_for_edit TEXT,
@@ -124,7 +126,8 @@ CREATE TABLE IF NOT EXISTS student_submissions (
     faculty_feedback TEXT,
     swot_analysis JSONB,
     ai_detection_results JSONB,
-    error_message TEXT
+    error_message TEXT,
+    content_hash VARCHAR(64)
 );
 
 -- =====================================================
@@ -136,7 +139,8 @@ CREATE TABLE IF NOT EXISTS faculty_evaluation_results (
     faculty_id VARCHAR(255),
     rubric_scores JSONB NOT NULL,
     comments TEXT,
-    evaluation_date TIMESTAMPTZ DEFAULT NOW()
+    evaluation_date TIMESTAMPTZ DEFAULT NOW(),
+    CONSTRAINT uq_faculty_eval_submission UNIQUE (submission_id)
 );
 
 -- =====================================================
@@ -174,6 +178,15 @@ CREATE TABLE IF NOT EXISTS evaluation_results (
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- =====================================================
+-- Evaluation Cache (LLM output keyed by input fingerprint)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS evaluation_cache (
+    hash_key VARCHAR(64) PRIMARY KEY,
+    result_json JSONB NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
 -- =====================================================
 -- Student Question Sets
 -- =====================================================
@@ -218,14 +231,19 @@ CREATE TABLE IF NOT EXISTS swot_submissions (
 CREATE INDEX IF NOT EXISTS idx_courses_code ON courses(course_code);
 CREATE INDEX IF NOT EXISTS idx_past_assignments_course ON past_assignments(course_id);
 CREATE INDEX IF NOT EXISTS idx_generated_assignments_course ON generated_assignments(course_id);
-CREATE INDEX IF NOT EXISTS idx_student_submissions_assignment ON student_submissions(assignment_id);
-CREATE INDEX IF NOT EXISTS idx_student_submissions_student ON student_submissions(student_id);
-CREATE INDEX IF NOT EXISTS idx_student_submissions_status ON student_submissions(evaluation_status);
-CREATE INDEX IF NOT EXISTS idx_faculty_eval_submission ON faculty_evaluation_results(submission_id);
+CREATE INDEX IF NOT EXISTS idx_assignment_rubrics_assignment_ids ON assignment_rubrics USING GIN (assignment_ids);
+CREATE INDEX IF NOT EXISTS idx_student_submissions_assignment_created ON student_submissions(assignment_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_student_submissions_student_created ON student_submissions(student_id, created_at DESC) INCLUDE (id, assignment_id, course_id, evaluation_status, evaluation_score);
+CREATE INDEX IF NOT EXISTS idx_student_submissions_status_created ON student_submissions(evaluation_status, created_at DESC) INCLUDE (id, student_id, assignment_id);
+CREATE INDEX IF NOT EXISTS idx_student_submissions_pending ON student_submissions(course_id, evaluation_status) INCLUDE (student_id, submission_date);
+CREATE INDEX IF NOT EXISTS ix_student_submissions_content_hash ON student_submissions(content_hash);
 CREATE INDEX IF NOT EXISTS idx_student_swot_submission ON student_swot_results(submission_id);
 CREATE INDEX IF NOT EXISTS idx_eval_results_submission ON evaluation_results(submission_id);
+CREATE INDEX IF NOT EXISTS idx_eval_results_assignment ON evaluation_results(assignment_id);
 CREATE INDEX IF NOT EXISTS idx_question_sets_student ON student_question_sets(student_id);
 CREATE INDEX IF NOT EXISTS idx_question_sets_status ON student_question_sets(approval_status);
 CREATE INDEX IF NOT EXISTS idx_question_sets_assignment ON student_question_sets(assignment_id);
+CREATE INDEX IF NOT EXISTS idx_question_sets_course ON student_question_sets(course_id);
+CREATE INDEX IF NOT EXISTS idx_question_sets_created ON student_question_sets(created_at DESC, id DESC);
 
 -- End of schema
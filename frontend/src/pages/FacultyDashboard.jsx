@@ -16,10 +16,17 @@ const FacultyDashboard = () => {
   const load = async () => {
     setLoading(true)
     try {
-      // Load dashboard data
-      const dashboardRes = await fetch('/api/faculty/dashboard')
-      if (!dashboardRes.ok) throw new Error(`HTTP error! status: ${dashboardRes.status}`)
-      const dashboardData = await dashboardRes.json()
+      // Load dashboard data (paged newest first; X-Next-Cursor points at the next page)
+      const dashboardData = []
+      let cursor = null
+      do {
+        const dashboardRes = await fetch(
+          '/api/faculty/dashboard' + (cursor ? `?cursor=${encodeURIComponent(cursor)}` : '')
+        )
+        if (!dashboardRes.ok) throw new Error(`HTTP error! status: ${dashboardRes.status}`)
+        dashboardData.push(...(await dashboardRes.json()))
+        cursor = dashboardRes.headers.get('X-Next-Cursor')
+      } while (cursor)
       
       // Load courses for filter
       const coursesRes = await fetch('/api/faculty/courses')
@@ -46,9 +46,18 @@ const FacultyEvaluation = () => {
   useEffect(() => {
     const fetchSubmissions = async () => {
       try {
-        const res = await fetch(getApiUrl(SERVERS.FACULTY, "PENDING_SUBMISSIONS"));
-        if (!res.ok) throw new Error("Failed to fetch pending submissions");
-        const data = await res.json();
+        // Paged newest first; X-Next-Cursor points at the next page
+        const data = [];
+        let cursor = null;
+        do {
+          const res = await fetch(
+            getApiUrl(SERVERS.FACULTY, "PENDING_SUBMISSIONS") +
+              (cursor ? `?cursor=${encodeURIComponent(cursor)}` : "")
+          );
+          if (!res.ok) throw new Error("Failed to fetch pending submissions");
+          data.push(...(await res.json()));
+          cursor = res.headers.get("X-Next-Cursor");
+        } while (cursor);
         console.log(data);
         setSubmissions(data);
       } catch (e) {